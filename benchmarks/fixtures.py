@@ -0,0 +1,102 @@
+from urllib.parse import quote
+
+from tests.gitlab_stub import MERGE_REQUEST, MR_PATH, PROJECT, StubResponse, make_tar, paginate, paginate_keyset
+
+PROJECT_COUNT = 10_000
+MR_FILE_COUNT = 5_000
+LARGE_FILE_LINES = 50_000
+BATCH_FILE_COUNT = 30
+BATCH_FILE_LINES = 400
+ARCHIVE_FILE_COUNT = 5_000
+ARCHIVE_FILE_LINES = 40
+HEAD_SHA = 'c' * 40
+LARGE_FILE_PATH = 'src/generated/schema.py'
+
+
+def make_projects(count: int) -> list[dict]:
+    return [
+        {
+            'id': i,
+            'name': f'project-{i}',
+            'path_with_namespace': f'group-{i % 100}/project-{i}',
+            'default_branch': 'main',
+            'web_url': f'https://gitlab.example.com/group-{i % 100}/project-{i}',
+            'description': f'Service number {i} of the benchmark instance',
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def make_diff(index: int, hunk_lines: int = 20) -> dict:
+    path = f'src/module_{index // 100}/file_{index}.py'
+    removed = ''.join(f'-    value_{index}_{n} = compute({n})\n' for n in range(hunk_lines))
+    added = ''.join(f'+    value_{index}_{n} = compute_cached({n})\n' for n in range(hunk_lines))
+
+    return {
+        'old_path': path,
+        'new_path': path,
+        'a_mode': '100644',
+        'b_mode': '100644',
+        'new_file': False,
+        'renamed_file': False,
+        'deleted_file': False,
+        'diff': f'@@ -1,{hunk_lines} +1,{hunk_lines} @@\n{removed}{added}',
+    }
+
+
+def make_source(lines: int, prefix: str) -> bytes:
+    return ''.join(f'{prefix}_{n} = {{"id": {n}, "name": "field_{n}", "nullable": {n % 2 == 0}}}\n' for n in range(lines)).encode()
+
+
+def raw_file(path: str, content: bytes) -> StubResponse:
+    return StubResponse(content, headers={
+        'X-Gitlab-File-Path': path,
+        'X-Gitlab-File-Name': path.rsplit('/', 1)[-1],
+        'X-Gitlab-Size': str(len(content)),
+        'X-Gitlab-Ref': 'main',
+        'X-Gitlab-Last-Commit-Id': HEAD_SHA,
+    })
+
+
+def batch_file_paths() -> list[str]:
+    return [f'src/module_0/file_{i}.py' for i in range(BATCH_FILE_COUNT)]
+
+
+def make_archive(file_count: int) -> bytes:
+    files = [
+        (f'test-project-main/src/module_{i // 100}/file_{i}.py', make_source(ARCHIVE_FILE_LINES, f'value_{i}'))
+        for i in range(file_count)
+    ]
+
+    return make_tar(files, 'gz')
+
+
+def make_routes(
+    project_count: int = PROJECT_COUNT,
+    mr_file_count: int = MR_FILE_COUNT,
+    large_file_lines: int = LARGE_FILE_LINES,
+    archive_file_count: int = ARCHIVE_FILE_COUNT,
+) -> dict:
+    projects = make_projects(project_count)
+    diffs = [make_diff(i) for i in range(mr_file_count)]
+    files = {LARGE_FILE_PATH: make_source(large_file_lines, 'FIELD')}
+    for path in batch_file_paths():
+        files[path] = make_source(BATCH_FILE_LINES, 'value')
+
+    routes = {
+        ('GET', '/projects'): lambda query: paginate_keyset(projects, query),
+        ('GET', '/projects/1'): PROJECT,
+        ('GET', '/projects/1/repository/commits/main'): {'id': HEAD_SHA},
+        ('GET', MR_PATH): {**MERGE_REQUEST, 'changes_count': str(mr_file_count)},
+        ('GET', f'{MR_PATH}/diffs'): lambda query: paginate(diffs, query),
+        ('GET', f'{MR_PATH}/commits'): lambda query: paginate([], query),
+        ('GET', f'{MR_PATH}/pipelines'): lambda query: paginate([], query),
+        ('GET', f'{MR_PATH}/discussions'): lambda query: paginate([], query),
+        ('GET', f'{MR_PATH}/approvals'): {'approved_by': []},
+        ('GET', f'{MR_PATH}/award_emoji'): lambda query: paginate([], query),
+        ('GET', '/projects/1/repository/archive.tar.gz'): make_archive(archive_file_count),
+    }
+    for path, content in files.items():
+        routes[('GET', f'/projects/1/repository/files/{quote(path, safe="")}/raw')] = raw_file(path, content)
+
+    return routes
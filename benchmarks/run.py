@@ -0,0 +1,183 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import resource
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+from unittest.mock import patch
+
+import pydantic_core
+from fastmcp import FastMCP
+from fastmcp.server.auth import AccessToken
+
+from benchmarks.fixtures import LARGE_FILE_PATH, batch_file_paths, make_routes
+from gitlab_mcp.client import TokenGitLabClient
+from gitlab_mcp.content_cache import ContentCache
+from gitlab_mcp.search_index import SearchIndexCache
+from gitlab_mcp.tools import merge_requests, repository
+from tests.gitlab_stub import GitLabStub
+
+ACCESS_TOKEN = AccessToken(token='benchmark-user-token', client_id='benchmark', scopes=['api'])
+
+
+@dataclass
+class ScenarioResult:
+    scenario: str
+    calls: int
+    p50_ms: float
+    p99_ms: float
+    requests_per_call: float
+    response_bytes_per_call: float
+    peak_rss_mib: float
+
+
+class ToolRunner:
+    def __init__(self, tools: dict, stub: GitLabStub):
+        self._tools = tools
+        self._stub = stub
+        self._loop = asyncio.new_event_loop()
+        self.latencies: list[float] = []
+        self.response_bytes = 0
+
+    def __call__(self, tool_name: str, **kwargs) -> Any:
+        start = time.perf_counter()
+        result = self._loop.run_until_complete(self._tools[tool_name].fn(**kwargs))
+        self.latencies.append(time.perf_counter() - start)
+        if getattr(result, 'isError', False):
+            raise RuntimeError(f'{tool_name} failed: {result.content[0].text}')
+
+        self.response_bytes += len(pydantic_core.to_json(result))
+
+        return result
+
+    def reset(self) -> None:
+        self.latencies.clear()
+        self.response_bytes = 0
+        self._stub.reset()
+
+    def close(self) -> None:
+        self._loop.close()
+
+
+def list_all_projects(call: Callable, **options) -> None:
+    page_token = None
+    while True:
+        page = call('list_projects', limit=100, page_token=page_token, **options)
+        page_token = page.next_page_token
+        if page_token is None:
+            return
+
+
+def read_all_mr_changes(call: Callable) -> None:
+    page_token = None
+    while True:
+        changes = call('get_merge_request_changes', project_id='1', mr_iid=1, limit=100, page_token=page_token)
+        page_token = changes.next_page_token
+        if page_token is None:
+            return
+
+
+SCENARIOS: dict[str, Callable[[Callable], None]] = {
+    'list_projects_all_pages': list_all_projects,
+    'list_projects_tabular': lambda call: list_all_projects(call, fields=['id', 'path_with_namespace'], tabular=True),
+    'mr_changes_all_pages': read_all_mr_changes,
+    'mr_review_context': lambda call: call('get_merge_request_review_context', project_id='1', mr_iid=1),
+    'large_file_line_range': lambda call: call(
+        'get_file_content', project_id='1', file_path=LARGE_FILE_PATH, start_line=200, end_line=260,
+    ),
+    'large_file_full': lambda call: call('get_file_content', project_id='1', file_path=LARGE_FILE_PATH, max_bytes=None),
+    'get_files_batch': lambda call: call('get_files', project_id='1', file_paths=batch_file_paths()),
+    'search_code_index': lambda call: call('search_code', project_id='1', query='value_4242_17 ='),
+    'search_code_index_regex': lambda call: call('search_code', project_id='1', query=r'value_42\d\d_3 =', regex=True),
+}
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_scenario(name: str, runner: ToolRunner, iterations: int) -> ScenarioResult:
+    SCENARIOS[name](runner)
+    runner.reset()
+    for _ in range(iterations):
+        SCENARIOS[name](runner)
+
+    calls = len(runner.latencies)
+
+    return ScenarioResult(
+        scenario=name,
+        calls=calls,
+        p50_ms=statistics.median(runner.latencies) * 1000,
+        p99_ms=percentile(runner.latencies, 0.99) * 1000,
+        requests_per_call=runner._stub.total_calls / calls,
+        response_bytes_per_call=runner.response_bytes / calls,
+        peak_rss_mib=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    )
+
+
+def register(stub: GitLabStub, content_cache: bool) -> dict:
+    mcp = FastMCP('benchmark')
+    service_client = TokenGitLabClient(stub.url, 'benchmark-service-token')
+    cache = ContentCache(128 * 1024 * 1024) if content_cache else None
+    merge_requests.register_tools(mcp, service_client, stub.url)
+    repository.register_tools(
+        mcp,
+        service_client,
+        stub.url,
+        content_cache=cache,
+        search_indexes=SearchIndexCache(512 * 1024 * 1024),
+    )
+
+    return {t.name: t for t in mcp._tool_manager._tools.values()}
+
+
+def run_isolated(name: str, latency: float, content_cache: bool, iterations: int) -> ScenarioResult:
+    with GitLabStub(make_routes(), latency=latency) as stub:
+        runner = ToolRunner(register(stub, content_cache), stub)
+        with patch('gitlab_mcp.tools.common.get_access_token', return_value=ACCESS_TOKEN):
+            result = run_scenario(name, runner, iterations)
+        runner.close()
+
+    return result
+
+
+def print_table(results: list[ScenarioResult]) -> None:
+    header = f'{"scenario":<24} {"calls":>6} {"p50 ms":>9} {"p99 ms":>9} {"req/call":>9} {"bytes/call":>11} {"rss MiB":>8}'
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(
+            f'{r.scenario:<24} {r.calls:>6} {r.p50_ms:>9.2f} {r.p99_ms:>9.2f} '
+            f'{r.requests_per_call:>9.2f} {r.response_bytes_per_call:>11.0f} {r.peak_rss_mib:>8.1f}'
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark gitlab-mcp tools against a local GitLab stand-in')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='simulated per-request GitLab latency')
+    parser.add_argument('--iterations', type=int, default=5)
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help='run only these scenarios')
+    parser.add_argument('--content-cache', action='store_true', help='enable the SHA-pinned content cache')
+    parser.add_argument('--json', dest='json_path', help='also write results to this file')
+    args = parser.parse_args()
+
+    results = []
+    for name in args.scenario or SCENARIOS:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+            future = pool.submit(run_isolated, name, args.latency_ms / 1000, args.content_cache, args.iterations)
+            results.append(future.result())
+
+    print_table(results)
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,105 @@
-from fastmcp.server.auth import OAuthProxy
+import asyncio
+import hashlib
+import time
+
+from cryptography.fernet import Fernet
+from fastmcp.server.auth import AccessToken, OAuthProxy
+from fastmcp.server.auth.jwt_issuer import derive_jwt_key
 from fastmcp.server.auth.providers.introspection import IntrospectionTokenVerifier
+from key_value.aio.stores.disk import DiskStore
+from key_value.aio.wrappers.encryption import FernetEncryptionWrapper
 
+from gitlab_mcp.cache import TTLCache
 from gitlab_mcp.config import Config
+from gitlab_mcp.store import SQLiteStore
+
+TOKEN_CACHE_SIZE = 4096
+TOKEN_CACHE_TTL = 120
+NEGATIVE_TOKEN_CACHE_TTL = 5
+TOKEN_STORE_NAMESPACE = 'token-verdicts'
+
+
+class CachingIntrospectionTokenVerifier(IntrospectionTokenVerifier):
+    def __init__(
+        self,
+        *,
+        cache_ttl: float = TOKEN_CACHE_TTL,
+        negative_cache_ttl: float = NEGATIVE_TOKEN_CACHE_TTL,
+        shared_store: SQLiteStore | None = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._verdicts = TTLCache(TOKEN_CACHE_SIZE, cache_ttl)
+        self._cache_ttl = cache_ttl
+        self._shared_store = shared_store
+        self._negative_cache_ttl = negative_cache_ttl
+        self._pending: dict[str, asyncio.Future] = {}
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        key = hashlib.sha256(token.encode()).hexdigest()
+        verdict = self._verdicts.get(key)
+        if verdict is not None:
+            return verdict[0]
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._introspect(key, token))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+
+        return await asyncio.shield(pending)
+
+    async def _introspect(self, key: str, token: str) -> AccessToken | None:
+        if self._shared_store is not None:
+            verdict = await asyncio.to_thread(self._shared_store.get, TOKEN_STORE_NAMESPACE, key)
+            if verdict is not None:
+                access_token = verdict['access_token'] and AccessToken.model_validate(verdict['access_token'])
+                self._verdicts.set(key, (access_token,), self._verdict_ttl(access_token))
+                return access_token
+
+        access_token = await super().verify_token(token)
+        ttl = self._verdict_ttl(access_token)
+        self._verdicts.set(key, (access_token,), ttl)
+        if self._shared_store is not None:
+            verdict = {'access_token': access_token and access_token.model_dump(mode='json')}
+            await asyncio.to_thread(self._shared_store.set, TOKEN_STORE_NAMESPACE, key, verdict, ttl)
+
+        return access_token
+
+    def _verdict_ttl(self, access_token: AccessToken | None) -> float:
+        if access_token is None:
+            return self._negative_cache_ttl
+        if access_token.expires_at is not None:
+            return min(access_token.expires_at - time.time(), self._cache_ttl)
+
+        return self._cache_ttl
+
+
+def create_client_storage(config: Config) -> FernetEncryptionWrapper:
+    signing_key = derive_jwt_key(
+        high_entropy_material=config.secrets.oauth_client_secret,
+        salt='fastmcp-jwt-signing-key',
+    )
+    encryption_key = derive_jwt_key(
+        high_entropy_material=signing_key.decode(),
+        salt='fastmcp-storage-encryption-key',
+    )
+
+    return FernetEncryptionWrapper(
+        key_value=DiskStore(directory=config.state_dir / 'oauth-proxy'),
+        fernet=Fernet(key=encryption_key),
+    )
 
 
-def create_oauth_proxy(config: Config) -> OAuthProxy:
+def create_oauth_proxy(config: Config, shared_store: SQLiteStore | None = None) -> OAuthProxy:
     gitlab_url = config.url.rstrip('/')
 
-    token_verifier = IntrospectionTokenVerifier(
+    token_verifier = CachingIntrospectionTokenVerifier(
         introspection_url=f'{gitlab_url}/oauth/introspect',
         client_id=config.secrets.oauth_client_id,
         client_secret=config.secrets.oauth_client_secret,
         required_scopes=['read_user', 'api', 'read_repository'],
+        shared_store=shared_store,
     )
 
     return OAuthProxy(
@@ -23,4 +111,5 @@ def create_oauth_proxy(config: Config) -> OAuthProxy:
         base_url=config.server_advertised_url,
         redirect_path='callback',
         token_endpoint_auth_method='client_secret_post',
+        client_storage=create_client_storage(config) if config.state_dir is not None else None,
     )
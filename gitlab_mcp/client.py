@@ -1,7 +1,19 @@
+import hashlib
 import os
+import time
 
 import gitlab
 from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from gitlab.v4.objects import Project
+
+from gitlab_mcp.cache import TTLCache
+from gitlab_mcp.metrics import record_cache_hit
+from gitlab_mcp.scheduler import RateLimitScheduler
+from gitlab_mcp.session import GitLabSession, ResponseCache
+
+PROJECT_CACHE_SIZE = 1024
+PROJECT_CACHE_TTL = 60
 
 
 class PermissionDenied(Exception):
@@ -12,6 +24,21 @@ class ProjectNotFound(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class ProjectInfo:
+    id: int
+    path_with_namespace: str
+    default_branch: str | None
+
+    @staticmethod
+    def from_gitlab(project: Project) -> 'ProjectInfo':
+        return ProjectInfo(
+            id=project.id,
+            path_with_namespace=project.path_with_namespace,
+            default_branch=project.default_branch,
+        )
+
+
 class GitLabClient(ABC):
     @abstractmethod
     def get_project(self, project_id: str | int):
@@ -27,18 +54,29 @@ class GitLabClient(ABC):
 
 
 class TokenGitLabClient(GitLabClient):
-    def __init__(self, url: str, token: str):
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        response_cache: ResponseCache | None = None,
+        scheduler: RateLimitScheduler | None = None,
+    ):
+        self.response_cache = response_cache
         self._gl = gitlab.Gitlab(
             url=url,
             private_token=token,
             ssl_verify=os.environ.get('SSL_CERT_FILE', True),
+            session=GitLabSession(response_cache, scheduler),
         )
 
-    def get_project(self, project_id: str | int):
-        return self._gl.projects.get(project_id)
+    def get_project(self, project_id: str | int, lazy: bool = False):
+        return self._gl.projects.get(project_id, lazy=lazy)
+
+    def get_lazy_project(self, info: ProjectInfo) -> Project:
+        return Project(self._gl.projects, asdict(info), lazy=True)
 
     def list_projects(self, **kwargs):
-        return self._gl.projects.list(**kwargs)
+        return self._gl.http_list('/projects', **kwargs)
 
     def list_merge_requests(self, **kwargs):
         return self._gl.mergerequests.list(**kwargs)
@@ -51,22 +89,29 @@ class TokenGitLabClient(GitLabClient):
 
 
 class OAuthGitLabClient(GitLabClient):
-    def __init__(self, url: str, oauth_token: str):
+    def __init__(self, url: str, oauth_token: str, response_cache: ResponseCache | None = None):
         self._gl = gitlab.Gitlab(
             url=url,
             oauth_token=oauth_token,
             ssl_verify=os.environ.get('SSL_CERT_FILE', True),
+            session=GitLabSession(response_cache),
         )
 
-    def get_project(self, project_id: str | int):
-        return self._gl.projects.get(project_id)
+    def get_project(self, project_id: str | int, lazy: bool = False):
+        return self._gl.projects.get(project_id, lazy=lazy)
+
+    def get_lazy_project(self, info: ProjectInfo) -> Project:
+        return Project(self._gl.projects, asdict(info), lazy=True)
 
     def list_projects(self, **kwargs):
-        return self._gl.projects.list(**kwargs)
+        return self._gl.http_list('/projects', **kwargs)
 
     def list_merge_requests(self, **kwargs):
         return self._gl.mergerequests.list(**kwargs)
 
+    def get_user_id(self) -> int:
+        return self._gl.http_get('/user')['id']
+
 
 class CompositeGitLabClient(GitLabClient):
     def __init__(
@@ -74,29 +119,89 @@ class CompositeGitLabClient(GitLabClient):
         user_token: str,
         service_client: TokenGitLabClient,
         url: str,
+        project_cache: TTLCache | None = None,
     ):
-        self._user_client = OAuthGitLabClient(url, user_token)
+        self._user_client = OAuthGitLabClient(url, user_token, service_client.response_cache)
         self._service_client = service_client
+        self._project_cache = (
+            project_cache if project_cache is not None else TTLCache(PROJECT_CACHE_SIZE, PROJECT_CACHE_TTL)
+        )
+        self._user_project_cache = TTLCache(PROJECT_CACHE_SIZE, PROJECT_CACHE_TTL)
+        self._user_id = None
+
+    def get_user_id(self) -> int:
+        if self._user_id is None:
+            self._user_id = self._user_client.get_user_id()
+
+        return self._user_id
 
     def get_project(self, project_id: str | int):
+        info = self._project_cache.get(str(project_id))
+        if info is not None:
+            record_cache_hit('project')
+            return self._service_client.get_lazy_project(info)
+
         try:
-            return self._service_client.get_project(project_id)
+            project = self._service_client.get_project(project_id)
         except gitlab.exceptions.GitlabGetError as e:
             if e.response_code == 404:
                 raise ProjectNotFound(f'Project {project_id} not found')
 
             raise PermissionDenied(f'Service account cannot access project {project_id}')
 
+        self._cache_project(self._project_cache, project_id, project)
+
+        return project
+
     def get_user_project(self, project_id: str | int):
+        info = self._user_project_cache.get(str(project_id))
+        if info is not None:
+            record_cache_hit('project')
+            return self._user_client.get_lazy_project(info)
+
         try:
-            return self._user_client.get_project(project_id)
+            project = self._user_client.get_project(project_id)
         except gitlab.exceptions.GitlabGetError as e:
             if e.response_code == 404:
                 raise ProjectNotFound(f'Project {project_id} not found')
             raise PermissionDenied(f'User cannot access project {project_id}')
 
+        self._cache_project(self._user_project_cache, project_id, project)
+
+        return project
+
+    @staticmethod
+    def _cache_project(cache: TTLCache, project_id: str | int, project: Project) -> None:
+        info = ProjectInfo.from_gitlab(project)
+        cache.set(str(project_id), info)
+        cache.set(str(info.id), info)
+
     def list_projects(self, **kwargs):
         return self._service_client.list_projects(**kwargs)
 
     def list_merge_requests(self, **kwargs):
         return self._service_client.list_merge_requests(**kwargs)
+
+
+class ClientPool:
+    def __init__(self, max_size: int, ttl: float, project_cache: TTLCache | None = None):
+        self._clients = TTLCache(max_size, ttl)
+        self._project_cache = (
+            project_cache if project_cache is not None else TTLCache(PROJECT_CACHE_SIZE, PROJECT_CACHE_TTL)
+        )
+
+    def get(
+        self,
+        user_token: str,
+        service_client: TokenGitLabClient,
+        url: str,
+        expires_at: int | None = None,
+    ) -> CompositeGitLabClient:
+        ttl = None if expires_at is None else expires_at - time.time()
+        key = hashlib.sha256(f'{url}\0{user_token}'.encode()).hexdigest()
+
+        return self._clients.get_or_set(
+            key,
+            lambda: CompositeGitLabClient(user_token, service_client, url, self._project_cache),
+            ttl,
+        )
@@ -8,12 +8,23 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_RESPONSE_CACHE_BYTES = 64 * 1024 * 1024
+DEFAULT_CONTENT_CACHE_BYTES = 128 * 1024 * 1024
+DEFAULT_CONTENT_CACHE_DISK_BYTES = 1024 * 1024 * 1024
+DEFAULT_RATE_LIMIT_RPS = 20
+DEFAULT_RATE_LIMIT_BURST = 40
+DEFAULT_MIRROR_FETCH_INTERVAL = 60
+DEFAULT_REF_CACHE_TTL = 30
+DEFAULT_WORKER_THREADS = 64
+DEFAULT_FANOUT_THREADS = 64
+
 
 @dataclass(frozen=True)
 class Secrets:
     oauth_client_id: str
     oauth_client_secret: str
     service_token: str
+    webhook_secret: Optional[str] = None
 
     @staticmethod
     def from_file(path: Path) -> 'Secrets':
@@ -24,6 +35,7 @@ class Secrets:
             oauth_client_id=data['oauth_client_id'],
             oauth_client_secret=data['oauth_client_secret'],
             service_token=data['service_token'],
+            webhook_secret=data.get('webhook_secret'),
         )
 
 
@@ -35,6 +47,22 @@ class Config:
     server_advertised_url: str
     ssl_cert_path: Optional[Path]
     ssl_key_path: Optional[Path]
+    response_cache_bytes: int = DEFAULT_RESPONSE_CACHE_BYTES
+    content_cache_bytes: int = DEFAULT_CONTENT_CACHE_BYTES
+    content_cache_dir: Optional[Path] = None
+    content_cache_disk_bytes: int = DEFAULT_CONTENT_CACHE_DISK_BYTES
+    ref_cache_ttl: int = DEFAULT_REF_CACHE_TTL
+    server_workers: int = 1
+    worker_threads: int = DEFAULT_WORKER_THREADS
+    fanout_threads: int = DEFAULT_FANOUT_THREADS
+    state_dir: Optional[Path] = None
+    rate_limit_rps: int = DEFAULT_RATE_LIMIT_RPS
+    rate_limit_burst: int = DEFAULT_RATE_LIMIT_BURST
+    mirror_projects: tuple[str, ...] = ()
+    mirror_dir: Optional[Path] = None
+    mirror_fetch_interval: int = DEFAULT_MIRROR_FETCH_INTERVAL
+    search_index_bytes: int = 0
+    prefetch_bytes: int = 0
 
     @property
     def server_host(self) -> str:
@@ -56,6 +84,20 @@ class Config:
         if not parsed.port:
             raise ValueError(f'{name} must include explicit port number')
 
+    @staticmethod
+    def _int_env(name: str, default: int) -> int:
+        value = os.environ.get(name)
+        if not value:
+            return default
+        try:
+            parsed = int(value)
+        except ValueError:
+            raise ValueError(f'{name} must be an integer')
+        if parsed < 0:
+            raise ValueError(f'{name} must not be negative')
+
+        return parsed
+
     @staticmethod
     def from_env() -> 'Config':
         url = os.environ.get('GITLAB_URL')
@@ -100,6 +142,30 @@ class Config:
             if not ssl_key_path.exists():
                 raise ValueError(f'SSL key file not found: {ssl_key_path}')
 
+        content_cache_dir_env = os.environ.get('GITLAB_CONTENT_CACHE_DIR')
+        state_dir_env = os.environ.get('MCP_STATE_DIR')
+
+        server_workers = Config._int_env('MCP_SERVER_WORKERS', 1)
+        if server_workers < 1:
+            raise ValueError('MCP_SERVER_WORKERS must be at least 1')
+        if server_workers > 1 and not state_dir_env:
+            logger.warning('MCP_SERVER_WORKERS > 1 without MCP_STATE_DIR - token verdicts are cached per worker')
+
+        worker_threads = Config._int_env('MCP_WORKER_THREADS', DEFAULT_WORKER_THREADS)
+        fanout_threads = Config._int_env('MCP_FANOUT_THREADS', DEFAULT_FANOUT_THREADS)
+        if worker_threads < 1 or fanout_threads < 1:
+            raise ValueError('MCP_WORKER_THREADS and MCP_FANOUT_THREADS must be at least 1')
+
+        mirror_projects = tuple(p.strip() for p in os.environ.get('GITLAB_MIRROR_PROJECTS', '').split(',') if p.strip())
+        mirror_dir_env = os.environ.get('GITLAB_MIRROR_DIR')
+        if mirror_projects and not mirror_dir_env and not state_dir_env:
+            raise ValueError('GITLAB_MIRROR_PROJECTS requires GITLAB_MIRROR_DIR or MCP_STATE_DIR')
+
+        content_cache_bytes = Config._int_env('GITLAB_CONTENT_CACHE_BYTES', DEFAULT_CONTENT_CACHE_BYTES)
+        prefetch_bytes = Config._int_env('GITLAB_PREFETCH_BYTES', 0)
+        if prefetch_bytes and not content_cache_bytes:
+            raise ValueError('GITLAB_PREFETCH_BYTES requires GITLAB_CONTENT_CACHE_BYTES')
+
         return Config(
             url=url,
             secrets=secrets,
@@ -107,4 +173,23 @@ class Config:
             server_advertised_url=server_advertised_url,
             ssl_cert_path=ssl_cert_path,
             ssl_key_path=ssl_key_path,
+            response_cache_bytes=Config._int_env('GITLAB_RESPONSE_CACHE_BYTES', DEFAULT_RESPONSE_CACHE_BYTES),
+            content_cache_bytes=content_cache_bytes,
+            content_cache_dir=Path(content_cache_dir_env) if content_cache_dir_env else None,
+            content_cache_disk_bytes=Config._int_env(
+                'GITLAB_CONTENT_CACHE_DISK_BYTES',
+                DEFAULT_CONTENT_CACHE_DISK_BYTES,
+            ),
+            ref_cache_ttl=Config._int_env('GITLAB_REF_CACHE_TTL', DEFAULT_REF_CACHE_TTL),
+            server_workers=server_workers,
+            worker_threads=worker_threads,
+            fanout_threads=fanout_threads,
+            state_dir=Path(state_dir_env) if state_dir_env else None,
+            rate_limit_rps=Config._int_env('GITLAB_RATE_LIMIT_RPS', DEFAULT_RATE_LIMIT_RPS),
+            rate_limit_burst=Config._int_env('GITLAB_RATE_LIMIT_BURST', DEFAULT_RATE_LIMIT_BURST),
+            mirror_projects=mirror_projects,
+            mirror_dir=Path(mirror_dir_env) if mirror_dir_env else None,
+            mirror_fetch_interval=Config._int_env('GITLAB_MIRROR_FETCH_INTERVAL', DEFAULT_MIRROR_FETCH_INTERVAL),
+            search_index_bytes=Config._int_env('GITLAB_SEARCH_INDEX_BYTES', 0),
+            prefetch_bytes=prefetch_bytes,
         )
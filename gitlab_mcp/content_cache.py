@@ -0,0 +1,167 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from gitlab.v4.objects import Project
+
+from gitlab_mcp.cache import ByteBudgetCache, TTLCache
+from gitlab_mcp.metrics import record_cache_hit
+from gitlab_mcp.store import SQLiteStore
+
+logger = logging.getLogger(__name__)
+
+SHA_PATTERN = re.compile(r'[0-9a-f]{40}|[0-9a-f]{64}')
+REF_CACHE_SIZE = 4096
+REF_CACHE_TTL = 30
+REF_NAMESPACE = 'refs'
+DEFAULT_DISK_BYTES = 1024 * 1024 * 1024
+DISK_PRUNE_RATIO = 0.9
+
+
+def is_commit_sha(ref: str) -> bool:
+    return SHA_PATTERN.fullmatch(ref) is not None
+
+
+class ContentCache:
+    def __init__(
+        self,
+        max_bytes: int,
+        directory: Path | None = None,
+        ref_ttl: float = REF_CACHE_TTL,
+        ref_store: SQLiteStore | None = None,
+        disk_bytes: int = DEFAULT_DISK_BYTES,
+    ):
+        self._memory = ByteBudgetCache(max_bytes)
+        self._directory = directory
+        self._ref_ttl = ref_ttl
+        self._ref_store = ref_store
+        self._refs = TTLCache(REF_CACHE_SIZE, ref_ttl)
+        self._disk_bytes = disk_bytes
+        self._disk_usage = 0
+        self._disk_lock = threading.Lock()
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._prune()
+
+    def resolve_ref(self, project: Project, ref: str) -> str:
+        if is_commit_sha(ref):
+            return ref
+
+        sha = self._get_ref(project.id, ref)
+        if sha is not None:
+            record_cache_hit('ref')
+            return sha
+
+        sha = project.commits.get(ref).id
+        self.update_ref(project.id, ref, sha)
+
+        return sha
+
+    def update_ref(self, project_id: int, ref: str, sha: str | None) -> None:
+        if self._ref_store is not None:
+            if sha is None:
+                self._ref_store.delete(REF_NAMESPACE, f'{project_id}:{ref}')
+            else:
+                self._ref_store.set(REF_NAMESPACE, f'{project_id}:{ref}', sha, self._ref_ttl)
+        elif sha is None:
+            self._refs.pop((project_id, ref))
+        else:
+            self._refs.set((project_id, ref), sha)
+
+    def _get_ref(self, project_id: int, ref: str) -> str | None:
+        if self._ref_store is not None:
+            return self._ref_store.get(REF_NAMESPACE, f'{project_id}:{ref}')
+
+        return self._refs.get((project_id, ref))
+
+    def get(self, key: tuple) -> Any:
+        digest = self._digest(key)
+        value = self._memory.get(digest)
+        if value is not None or self._directory is None:
+            return value
+
+        path = self._path(digest)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        value = json.loads(data)
+        self._memory.set(digest, value, len(data))
+
+        return value
+
+    def set(self, key: tuple, value: Any) -> None:
+        digest = self._digest(key)
+        data = json.dumps(value).encode()
+        self._memory.set(digest, value, len(data))
+        if self._directory is not None:
+            self._write(self._path(digest), data)
+
+    def get_or_fetch(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is not None:
+            record_cache_hit('content')
+            return value
+
+        value = fetch()
+        self.set(key, value)
+
+        return value
+
+    @staticmethod
+    def _digest(key: tuple) -> str:
+        return hashlib.sha256(repr(key).encode()).hexdigest()
+
+    def _path(self, digest: str) -> Path:
+        return self._directory / digest[:2] / digest
+
+    def _write(self, path: Path, data: bytes) -> None:
+        try:
+            path.parent.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning('Failed to write content cache entry %s: %s', path, e)
+            return
+
+        with self._disk_lock:
+            self._disk_usage += len(data)
+            over_budget = self._disk_usage > self._disk_bytes
+        if over_budget:
+            self._prune()
+
+    def _prune(self) -> None:
+        with self._disk_lock:
+            entries = []
+            for path in self._directory.glob('*/*'):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            usage = sum(size for _, size, _ in entries)
+            if usage > self._disk_bytes:
+                target = self._disk_bytes * DISK_PRUNE_RATIO
+                for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                    if usage <= target:
+                        break
+                    try:
+                        path.unlink()
+                    except OSError:
+                        continue
+                    usage -= size
+            self._disk_usage = usage
@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+import requests
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+NO_TOOL = 'none'
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+TOOL_CALLS = Counter('gitlab_mcp_tool_calls_total', 'Tool calls by outcome', ['tool', 'outcome'])
+TOOL_DURATION = Histogram('gitlab_mcp_tool_duration_seconds', 'Tool wall time', ['tool'])
+TOOL_UPSTREAM_REQUESTS = Histogram(
+    'gitlab_mcp_tool_upstream_requests',
+    'GitLab HTTP requests per tool call',
+    ['tool'],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+UPSTREAM_REQUESTS = Counter('gitlab_mcp_upstream_requests_total', 'GitLab HTTP requests', ['tool', 'status'])
+UPSTREAM_BYTES = Counter('gitlab_mcp_upstream_bytes_total', 'Bytes received from GitLab', ['tool'])
+CACHE_HITS = Counter('gitlab_mcp_cache_hits_total', 'Cache hits', ['tool', 'cache'])
+WEBHOOK_EVENTS = Counter('gitlab_mcp_webhook_events_total', 'GitLab webhook events received', ['kind'])
+
+
+class ToolStats:
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.outcome = 'ok'
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def add_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+
+_current_stats: ContextVar[ToolStats | None] = ContextVar('gitlab_mcp_tool_stats', default=None)
+
+
+def current_tool() -> str:
+    stats = _current_stats.get()
+
+    return NO_TOOL if stats is None else stats.tool
+
+
+@contextmanager
+def track_tool(tool: str) -> Iterator[ToolStats]:
+    stats = ToolStats(tool)
+    token = _current_stats.set(stats)
+    start = time.perf_counter()
+    try:
+        yield stats
+    except BaseException:
+        stats.outcome = 'error'
+        raise
+    finally:
+        _current_stats.reset(token)
+        TOOL_DURATION.labels(tool).observe(time.perf_counter() - start)
+        TOOL_UPSTREAM_REQUESTS.labels(tool).observe(stats.requests)
+        TOOL_CALLS.labels(tool, stats.outcome).inc()
+
+
+def record_upstream_response(response: requests.Response, streamed: bool = False) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.add_request()
+
+    tool = current_tool()
+    UPSTREAM_REQUESTS.labels(tool, str(response.status_code)).inc()
+    size = int(response.headers.get('Content-Length') or 0) if streamed else len(response.content)
+    UPSTREAM_BYTES.labels(tool).inc(size)
+
+
+def record_cache_hit(cache: str) -> None:
+    CACHE_HITS.labels(current_tool(), cache).inc()
+
+
+def record_webhook_event(kind: str) -> None:
+    WEBHOOK_EVENTS.labels(kind).inc()
+
+
+def render_metrics() -> bytes:
+    if not os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+
+    return generate_latest(registry)
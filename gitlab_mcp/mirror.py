@@ -0,0 +1,349 @@
+import base64
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Collection, Iterator
+
+from gitlab_mcp.content_cache import SHA_PATTERN
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FETCH_INTERVAL = 60
+SYNC_THREADS = 2
+SYNC_TIMEOUT = 3600
+BLOB_CHUNK_SIZE = 64 * 1024
+SHORT_ID_LENGTH = 8
+FETCH_REFSPECS = (
+    '+refs/heads/*:refs/heads/*',
+    '+refs/tags/*:refs/tags/*',
+    '+refs/merge-requests/*:refs/merge-requests/*',
+)
+COMMIT_FORMAT = '%H%x00%s%x00%B%x00%an%x00%ae%x00%aI%x00%cn%x00%cI%x1e'
+COMMIT_FIELDS = (
+    'id',
+    'title',
+    'message',
+    'author_name',
+    'author_email',
+    'authored_date',
+    'committer_name',
+    'committed_date',
+)
+BLAME_COMMIT_FORMAT = '%H%x00%an%x00%ae%x00%B%x00%cI%x1e'
+BLAME_COMMIT_FIELDS = ('id', 'author_name', 'author_email', 'message', 'committed_date')
+
+
+class GitError(Exception):
+    pass
+
+
+def run_git(git_dir: Path, *args: str, env: dict[str, str] | None = None, timeout: float | None = None) -> bytes:
+    result = subprocess.run(
+        ['git', f'--git-dir={git_dir}', *args],
+        capture_output=True,
+        env=env,
+        timeout=timeout,
+    )
+    if result.returncode != 0:
+        raise GitError(result.stderr.decode('utf-8', 'replace').strip())
+
+    return result.stdout
+
+
+def parse_records(output: bytes, fields: tuple[str, ...]) -> list[dict]:
+    records = []
+    for record in output.decode('utf-8', 'replace').split('\x1e'):
+        values = record.lstrip('\n').split('\0')
+        if len(values) == len(fields):
+            records.append(dict(zip(fields, values)))
+
+    return records
+
+
+class MirrorRepository:
+    def __init__(self, path: Path):
+        self.path = path
+
+    def resolve(self, ref: str) -> str | None:
+        try:
+            output = run_git(self.path, 'rev-parse', '--verify', '--quiet', '--end-of-options', f'{ref}^{{commit}}')
+        except GitError:
+            return None
+
+        return output.decode().strip()
+
+    def tree(self, sha: str, path: str | None = None, recursive: bool = False) -> list[dict]:
+        args = ['ls-tree', '-z']
+        if recursive:
+            args += ['-r', '-t']
+        args.append(sha)
+        if path:
+            args += ['--', path.rstrip('/') + '/']
+
+        items = []
+        for entry in run_git(self.path, *args).decode('utf-8', 'replace').split('\0'):
+            if not entry:
+                continue
+            info, item_path = entry.split('\t', 1)
+            mode, item_type, item_id = info.split(' ')
+            items.append({
+                'id': item_id,
+                'name': item_path.rsplit('/', 1)[-1],
+                'type': item_type,
+                'path': item_path,
+                'mode': mode,
+            })
+
+        return items
+
+    def blob_size(self, sha: str, path: str) -> int | None:
+        try:
+            output = run_git(self.path, 'cat-file', '-s', f'{sha}:{path}')
+        except GitError:
+            return None
+
+        return int(output)
+
+    def object_type(self, sha: str, path: str) -> str | None:
+        try:
+            output = run_git(self.path, 'cat-file', '-t', f'{sha}:{path}')
+        except GitError:
+            return None
+
+        return output.decode().strip()
+
+    @contextmanager
+    def read_blob(self, sha: str, path: str) -> Iterator[Iterator[bytes]]:
+        process = subprocess.Popen(
+            ['git', f'--git-dir={self.path}', 'cat-file', 'blob', f'{sha}:{path}'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            yield iter(lambda: process.stdout.read(BLOB_CHUNK_SIZE), b'')
+        finally:
+            process.kill()
+            process.stdout.close()
+            process.wait()
+
+    @contextmanager
+    def archive(self, sha: str) -> Iterator[IO[bytes]]:
+        process = subprocess.Popen(
+            ['git', f'--git-dir={self.path}', 'archive', '--format=tar', sha],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            yield process.stdout
+        finally:
+            process.kill()
+            process.stdout.close()
+            process.wait()
+
+    def last_commit(self, sha: str, path: str) -> str:
+        return run_git(self.path, 'log', '-1', '--format=%H', sha, '--', path).decode().strip()
+
+    def blame(self, sha: str, path: str, start_line: int | None = None, end_line: int | None = None) -> list[dict]:
+        args = ['blame', '--porcelain']
+        if start_line is not None or end_line is not None:
+            args += ['-L', f'{start_line or 1},{end_line or ""}']
+        output = run_git(self.path, *args, sha, '--', path)
+
+        groups = []
+        commit_id = None
+        for line in output.decode('utf-8', 'replace').split('\n'):
+            if line.startswith('\t'):
+                if groups and groups[-1][0] == commit_id:
+                    groups[-1][1].append(line[1:])
+                else:
+                    groups.append((commit_id, [line[1:]]))
+                continue
+
+            header = line.split(' ', 1)[0]
+            if SHA_PATTERN.fullmatch(header):
+                commit_id = header
+
+        commits = {c['id']: c for c in self.commit_details({commit_id for commit_id, _ in groups})}
+
+        return [{'commit': commits[commit_id], 'lines': lines} for commit_id, lines in groups]
+
+    def commit_details(self, commit_ids: Collection[str]) -> list[dict]:
+        if not commit_ids:
+            return []
+
+        output = run_git(self.path, 'log', '--no-walk=unsorted', f'--format={BLAME_COMMIT_FORMAT}', *commit_ids)
+
+        return parse_records(output, BLAME_COMMIT_FIELDS)
+
+    def commits(
+        self,
+        sha: str,
+        since: str | None = None,
+        until: str | None = None,
+        page: int = 1,
+        per_page: int = 20,
+        get_all: bool = False,
+    ) -> list[dict]:
+        args = ['log', f'--format={COMMIT_FORMAT}', f'--skip={(page - 1) * per_page}', f'--max-count={per_page}']
+        if since:
+            args.append(f'--since={since}')
+        if until:
+            args.append(f'--until={until}')
+        records = parse_records(run_git(self.path, *args, sha, '--'), COMMIT_FIELDS)
+
+        return [{**record, 'short_id': record['id'][:SHORT_ID_LENGTH]} for record in records]
+
+    def grep(self, sha: str, query: str, limit: int) -> list[tuple[str, int, str]]:
+        process = subprocess.Popen(
+            ['git', f'--git-dir={self.path}', 'grep', '-z', '-n', '-I', '-i', '-F', '-e', query, sha, '--'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        matches = []
+        try:
+            for line in process.stdout:
+                if len(matches) >= limit:
+                    break
+                name, line_no, text = line.decode('utf-8', 'replace').rstrip('\n').split('\0', 2)
+                matches.append((name.split(':', 1)[1], int(line_no), text))
+        finally:
+            process.kill()
+            process.stdout.close()
+            process.wait()
+
+        return matches
+
+
+class RepositoryMirror:
+    def __init__(
+        self,
+        directory: Path,
+        remote_url: str,
+        token: str | None,
+        projects: Collection[str],
+        fetch_interval: float = DEFAULT_FETCH_INTERVAL,
+    ):
+        self._directory = directory
+        self._remote_url = remote_url.rstrip('/')
+        self._token = token
+        self._projects = frozenset(projects)
+        self._fetch_interval = fetch_interval
+        self._fetched_at: dict[int, float] = {}
+        self._syncing: set[int] = set()
+        self._stale: set[int] = set()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=SYNC_THREADS, thread_name_prefix='gitlab-mcp-mirror')
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def covers(self, project) -> bool:
+        return str(project.id) in self._projects or project.path_with_namespace in self._projects
+
+    def repository(self, project) -> MirrorRepository | None:
+        if not self.covers(project):
+            return None
+
+        fetched_at = self._fetched_at.get(project.id)
+        if fetched_at is None or time.monotonic() - fetched_at >= self._fetch_interval:
+            self.refresh(project)
+
+        path = self._path(project.id)
+        if not path.exists():
+            return None
+
+        return MirrorRepository(path)
+
+    def refresh(self, project) -> None:
+        if not self.covers(project):
+            return
+
+        with self._lock:
+            if project.id in self._syncing:
+                return
+            self._syncing.add(project.id)
+
+        self._pool.submit(self._sync_in_background, project.id, project.path_with_namespace)
+
+    def invalidate(self, project) -> None:
+        with self._lock:
+            if project.id in self._syncing:
+                self._stale.add(project.id)
+                return
+
+        self.refresh(project)
+
+    def sync(self, project) -> MirrorRepository:
+        return self._sync(project.id, project.path_with_namespace)
+
+    def _sync(self, project_id: int, path_with_namespace: str) -> MirrorRepository:
+        path = self._path(project_id)
+        try:
+            if path.exists():
+                self._fetch(path, path_with_namespace)
+            else:
+                self._clone(path, path_with_namespace)
+        finally:
+            self._fetched_at[project_id] = time.monotonic()
+
+        return MirrorRepository(path)
+
+    def _sync_in_background(self, project_id: int, path_with_namespace: str) -> None:
+        while True:
+            try:
+                self._sync(project_id, path_with_namespace)
+            except (GitError, OSError, subprocess.TimeoutExpired) as e:
+                logger.warning('Failed to sync mirror of %s: %s', path_with_namespace, e)
+
+            with self._lock:
+                if project_id not in self._stale:
+                    self._syncing.discard(project_id)
+                    return
+                self._stale.discard(project_id)
+
+    def _path(self, project_id: int) -> Path:
+        return self._directory / f'{project_id}.git'
+
+    def _clone(self, path: Path, path_with_namespace: str) -> None:
+        tmp = self._directory / f'.{path.name}.{uuid.uuid4().hex}'
+        try:
+            run_git(tmp, 'init', '--bare', '--quiet')
+            self._fetch(tmp, path_with_namespace)
+            os.rename(tmp, path)
+        except OSError:
+            if not path.exists():
+                raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def _fetch(self, path: Path, path_with_namespace: str) -> None:
+        run_git(
+            path,
+            'fetch',
+            '--prune',
+            '--quiet',
+            '--no-write-fetch-head',
+            f'{self._remote_url}/{path_with_namespace}.git',
+            *FETCH_REFSPECS,
+            env=self._env(),
+            timeout=SYNC_TIMEOUT,
+        )
+
+    def _env(self) -> dict[str, str]:
+        env = {**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+        if 'SSL_CERT_FILE' in os.environ:
+            env['GIT_SSL_CAINFO'] = os.environ['SSL_CERT_FILE']
+        if self._token:
+            credentials = base64.b64encode(f'oauth2:{self._token}'.encode()).decode()
+            env.update({
+                'GIT_CONFIG_COUNT': '1',
+                'GIT_CONFIG_KEY_0': 'http.extraHeader',
+                'GIT_CONFIG_VALUE_0': f'Authorization: Basic {credentials}',
+            })
+
+        return env
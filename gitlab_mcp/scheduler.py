@@ -0,0 +1,139 @@
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+
+import requests
+
+RETRYABLE_STATUSES = frozenset({429, 503})
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30.0
+MAX_WAIT = 1.0
+ANONYMOUS = 'anonymous'
+
+_current_user: ContextVar[str] = ContextVar('gitlab_mcp_scheduler_user', default=ANONYMOUS)
+
+
+def set_current_user(user: str) -> None:
+    _current_user.set(user)
+
+
+def current_user() -> str:
+    return _current_user.get()
+
+
+class RateLimitScheduler:
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+    ):
+        self._max_rate = rate
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._queues: OrderedDict[str, deque] = OrderedDict()
+        self._cond = threading.Condition()
+
+    def acquire(self, user: str | None = None) -> None:
+        user = user or _current_user.get()
+        ticket = object()
+        with self._cond:
+            self._queues.setdefault(user, deque()).append(ticket)
+            while True:
+                if self._is_next(user, ticket) and self._take_token():
+                    self._advance(user)
+                    self._cond.notify_all()
+                    return
+
+                self._cond.wait(self._wait_time())
+
+    def observe(self, response: requests.Response) -> None:
+        remaining = response.headers.get('RateLimit-Remaining')
+        reset = response.headers.get('RateLimit-Reset')
+        with self._cond:
+            if response.status_code == 429:
+                self._pause(self._retry_after(response))
+            if remaining is None or reset is None:
+                return
+
+            window = max(float(reset) - time.time(), 0.0)
+            if int(remaining) <= 0:
+                self._pause(window)
+            elif window > 0:
+                self._refill()
+                self._tokens = min(self._tokens, float(remaining))
+                self._rate = min(self._max_rate, int(remaining) / window)
+            else:
+                self._rate = self._max_rate
+
+    def retry_delay(self, response: requests.Response, attempt: int) -> float | None:
+        if response.status_code not in RETRYABLE_STATUSES or attempt >= self._max_retries:
+            return None
+        if response.status_code == 503 and response.request.method not in IDEMPOTENT_METHODS:
+            return None
+
+        backoff = random.uniform(0, min(self._backoff_max, self._backoff_base * 2 ** attempt))
+        retry_after = self._retry_after(response)
+
+        return min(self._backoff_max, retry_after + backoff) if retry_after else backoff
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        value = response.headers.get('Retry-After')
+        if value is not None and value.isdigit():
+            return float(value)
+
+        reset = response.headers.get('RateLimit-Reset')
+        if reset is not None and reset.isdigit():
+            return max(float(reset) - time.time(), 0.0)
+
+        return 0.0
+
+    def _pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _is_next(self, user: str, ticket: object) -> bool:
+        head_user = next(iter(self._queues))
+
+        return head_user == user and self._queues[user][0] is ticket
+
+    def _advance(self, user: str) -> None:
+        queue = self._queues.pop(user)
+        queue.popleft()
+        if queue:
+            self._queues[user] = queue
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(float(self._burst), self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _take_token(self) -> bool:
+        self._refill()
+        if time.monotonic() < self._paused_until or self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+
+        return True
+
+    def _wait_time(self) -> float:
+        now = time.monotonic()
+        if now < self._paused_until:
+            return min(MAX_WAIT, self._paused_until - now)
+        if self._rate <= 0:
+            return MAX_WAIT
+
+        return min(MAX_WAIT, max((1 - self._tokens) / self._rate, 0.001))
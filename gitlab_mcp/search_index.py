@@ -0,0 +1,247 @@
+import multiprocessing
+import re
+import tarfile
+import threading
+from array import array
+from concurrent.futures import Future
+from functools import partial
+from typing import IO, Callable, Hashable, Iterable, Iterator
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    sre_parse = None
+
+from gitlab_mcp.cache import ByteBudgetCache
+from gitlab_mcp.metrics import record_cache_hit
+
+MAX_INDEXED_FILE_BYTES = 1024 * 1024
+BINARY_SNIFF_BYTES = 8000
+POSTING_BYTES = 4
+TRIGRAM_OVERHEAD_BYTES = 100
+MAX_PATTERN_LENGTH = 256
+MAX_REGEX_LINE_CHARS = 1000
+REGEX_SEARCH_TIMEOUT = 2.0
+FORK_CONTEXT = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+
+
+class InvalidPattern(Exception):
+    pass
+
+
+class IndexTooLarge(Exception):
+    pass
+
+
+def trigrams(data: bytes) -> set[bytes]:
+    return {data[i:i + 3] for i in range(len(data) - 2)}
+
+
+def query_trigrams(literal: str) -> set[bytes]:
+    return {t for t in trigrams(literal.encode().lower()) if t.isascii()}
+
+
+def parse_pattern(pattern: str) -> list:
+    if sre_parse is None:
+        raise InvalidPattern('Regex search is not supported on this Python version')
+    if len(pattern) > MAX_PATTERN_LENGTH:
+        raise InvalidPattern(f'Regex is longer than {MAX_PATTERN_LENGTH} characters')
+    try:
+        parsed = sre_parse.parse(pattern, re.IGNORECASE)
+    except re.error as e:
+        raise InvalidPattern(f'Invalid regex: {e}')
+
+    check_pattern(parsed)
+
+    return parsed
+
+
+def check_pattern(items: Iterable, in_repeat: bool = False) -> None:
+    for op, value in items:
+        if op in (sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS, sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            raise InvalidPattern('Regex backreferences and lookarounds are not supported')
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, sre_parse.POSSESSIVE_REPEAT):
+            low, high, body = value
+            if in_repeat and low != high:
+                raise InvalidPattern('Regex nests variable-length repeats inside an unbounded repeat')
+            check_pattern(body, in_repeat or high == sre_parse.MAXREPEAT)
+        elif op is sre_parse.SUBPATTERN:
+            check_pattern(value[-1], in_repeat)
+        elif op is sre_parse.ATOMIC_GROUP:
+            check_pattern(value, in_repeat)
+        elif op is sre_parse.BRANCH:
+            if in_repeat:
+                raise InvalidPattern('Regex alternation inside an unbounded repeat is not supported')
+            for branch in value[1]:
+                check_pattern(branch, in_repeat)
+
+
+def required_literals(pattern: str) -> list[str]:
+    literals = []
+    run = []
+    for op, value in parse_pattern(pattern):
+        if op is sre_parse.LITERAL:
+            run.append(chr(value))
+            continue
+        if run:
+            literals.append(''.join(run))
+            run = []
+    if run:
+        literals.append(''.join(run))
+
+    return literals
+
+
+def send_result(connection, func: Callable[[], object]) -> None:
+    connection.send(func())
+    connection.close()
+
+
+def run_bounded(func: Callable[[], object], timeout: float) -> object:
+    if FORK_CONTEXT is None:
+        raise InvalidPattern('Regex search is not supported on this platform')
+
+    receiver, sender = FORK_CONTEXT.Pipe(duplex=False)
+    process = FORK_CONTEXT.Process(target=send_result, args=(sender, func), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            raise InvalidPattern(f'Regex search took longer than {timeout:g}s')
+
+        return receiver.recv()
+    except EOFError:
+        raise InvalidPattern('Regex search failed')
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+
+
+def read_tar(fileobj: IO[bytes], strip_components: int = 0) -> Iterator[tuple[str, bytes]]:
+    with tarfile.open(fileobj=fileobj, mode='r|*') as archive:
+        for member in archive:
+            if not member.isfile() or member.size > MAX_INDEXED_FILE_BYTES:
+                continue
+
+            parts = member.name.split('/')[strip_components:]
+            data = archive.extractfile(member).read()
+            if not parts or b'\0' in data[:BINARY_SNIFF_BYTES]:
+                continue
+
+            yield '/'.join(parts), data
+
+
+class TrigramIndex:
+    def __init__(self, files: Iterable[tuple[str, bytes]], max_bytes: int | None = None):
+        self.paths: list[str] = []
+        self.texts: list[str] = []
+        self.size = 0
+        self._postings: dict[bytes, array] = {}
+        for path, data in files:
+            doc_id = len(self.paths)
+            self.paths.append(path)
+            self.texts.append(data.decode('utf-8', 'replace'))
+            for trigram in trigrams(data.lower()):
+                postings = self._postings.get(trigram)
+                if postings is None:
+                    postings = self._postings[trigram] = array('I')
+                postings.append(doc_id)
+            self.size += len(data)
+            if max_bytes is not None and self.size > max_bytes:
+                raise IndexTooLarge(f'Search index exceeds {max_bytes} bytes')
+
+        self.size += sum(len(p) * POSTING_BYTES + TRIGRAM_OVERHEAD_BYTES for p in self._postings.values())
+        if max_bytes is not None and self.size > max_bytes:
+            raise IndexTooLarge(f'Search index exceeds {max_bytes} bytes')
+
+    def search(self, query: str, regex: bool = False, limit: int | None = None) -> list[tuple[str, int, str]]:
+        if regex:
+            candidates = list(self._candidates(required_literals(query)))
+            pattern = re.compile(query, re.IGNORECASE)
+            matcher = lambda line: len(line) <= MAX_REGEX_LINE_CHARS and pattern.search(line)
+
+            return run_bounded(partial(self._scan, candidates, matcher, limit), REGEX_SEARCH_TIMEOUT)
+
+        needle = query.lower()
+
+        return self._scan(self._candidates([query]), lambda line: needle in line.lower(), limit)
+
+    def _scan(
+        self,
+        candidates: Iterable[int],
+        matcher: Callable[[str], object],
+        limit: int | None,
+    ) -> list[tuple[str, int, str]]:
+        matches = []
+        for doc_id in candidates:
+            for line_no, line in enumerate(self.texts[doc_id].split('\n'), 1):
+                if matcher(line):
+                    matches.append((self.paths[doc_id], line_no, line))
+                    if limit is not None and len(matches) >= limit:
+                        return matches
+
+        return matches
+
+    def _candidates(self, literals: list[str]) -> Iterable[int]:
+        required = set()
+        for literal in literals:
+            required |= query_trigrams(literal)
+        if not required:
+            return range(len(self.paths))
+
+        postings = sorted((self._postings.get(t, array('I')) for t in required), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+
+        return sorted(candidates)
+
+
+class SearchIndexCache:
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._indexes = ByteBudgetCache(max_bytes)
+        self._oversized: set[Hashable] = set()
+        self._building: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: Hashable, files: Callable[[], Iterable[tuple[str, bytes]]]) -> TrigramIndex:
+        with self._lock:
+            if key in self._oversized:
+                raise IndexTooLarge(f'Search index exceeds {self._max_bytes} bytes')
+
+            index = self._indexes.get(key)
+            if index is not None:
+                record_cache_hit('search_index')
+                return index
+
+            build = self._building.get(key)
+            builder = build is None
+            if builder:
+                build = self._building[key] = Future()
+
+        if not builder:
+            return build.result()
+
+        try:
+            index = TrigramIndex(files(), self._max_bytes)
+        except IndexTooLarge as e:
+            with self._lock:
+                self._oversized.add(key)
+            build.set_exception(e)
+            raise
+        except BaseException as e:
+            build.set_exception(e)
+            raise
+        else:
+            self._indexes.set(key, index, index.size)
+            build.set_result(index)
+        finally:
+            with self._lock:
+                del self._building[key]
+
+        return index
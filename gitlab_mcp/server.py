@@ -1,9 +1,26 @@
+import functools
+
+import uvicorn
 from fastmcp import FastMCP
+from fastmcp.server.http import StarletteWithLifespan
+from starlette.requests import Request
+from starlette.responses import Response
 
 from gitlab_mcp.auth import create_oauth_proxy
 from gitlab_mcp.config import Config
 from gitlab_mcp.client import TokenGitLabClient
+from gitlab_mcp.content_cache import ContentCache
+from gitlab_mcp.metrics import METRICS_CONTENT_TYPE, render_metrics
+from gitlab_mcp.mirror import RepositoryMirror
+from gitlab_mcp.scheduler import RateLimitScheduler
+from gitlab_mcp.search_index import SearchIndexCache
+from gitlab_mcp.session import ResponseCache
+from gitlab_mcp.snapshots import SnapshotStore
+from gitlab_mcp.store import SQLiteStore
 from gitlab_mcp.tools import merge_requests, repository
+from gitlab_mcp.tools.common import configure_pools
+from gitlab_mcp.tools.prefetch import Prefetcher
+from gitlab_mcp.webhooks import WEBHOOK_PATH, WebhookHandler
 
 UVICORN_LOG_CONFIG = {
     'version': 1,
@@ -38,28 +55,105 @@ UVICORN_LOG_CONFIG = {
     },
 }
 
-config = Config.from_env()
-auth = create_oauth_proxy(config)
-mcp = FastMCP('GitLab MCP', auth=auth)
-service_client = TokenGitLabClient(
-    url=config.url,
-    token=config.secrets.service_token,
-)
-
 
+@functools.cache
 def get_config() -> Config:
-    return config
+    return Config.from_env()
+
+
+def create_mcp(config: Config) -> FastMCP:
+    configure_pools(config.worker_threads, config.fanout_threads)
+    shared_store = SQLiteStore(config.state_dir / 'state.db') if config.state_dir is not None else None
+    mirror_dir = config.mirror_dir
+    if mirror_dir is None and config.state_dir is not None:
+        mirror_dir = config.state_dir / 'mirrors'
+
+    mcp = FastMCP('GitLab MCP', auth=create_oauth_proxy(config, shared_store))
+    service_client = TokenGitLabClient(
+        url=config.url,
+        token=config.secrets.service_token,
+        response_cache=ResponseCache(config.response_cache_bytes) if config.response_cache_bytes else None,
+        scheduler=(
+            RateLimitScheduler(config.rate_limit_rps / config.server_workers, config.rate_limit_burst)
+            if config.rate_limit_rps
+            else None
+        ),
+    )
+    content_cache = (
+        ContentCache(
+            config.content_cache_bytes,
+            config.content_cache_dir,
+            config.ref_cache_ttl,
+            shared_store,
+            config.content_cache_disk_bytes,
+        )
+        if config.content_cache_bytes
+        else None
+    )
+    mirror = (
+        RepositoryMirror(
+            mirror_dir,
+            config.url,
+            config.secrets.service_token,
+            config.mirror_projects,
+            config.mirror_fetch_interval,
+        )
+        if config.mirror_projects
+        else None
+    )
+
+    merge_requests.register_tools(
+        mcp,
+        service_client,
+        config.url,
+        prefetcher=Prefetcher(content_cache, config.prefetch_bytes, mirror) if config.prefetch_bytes else None,
+        snapshots=SnapshotStore(shared_store),
+    )
+    repository.register_tools(
+        mcp,
+        service_client,
+        config.url,
+        content_cache=content_cache,
+        mirror=mirror,
+        search_indexes=SearchIndexCache(config.search_index_bytes) if config.search_index_bytes else None,
+    )
+
+    if config.secrets.webhook_secret:
+        webhooks = WebhookHandler(config.secrets.webhook_secret, content_cache, mirror)
+        mcp.custom_route(WEBHOOK_PATH, methods=['POST'])(webhooks.endpoint)
+
+    @mcp.custom_route('/metrics', methods=['GET'])
+    async def metrics(request: Request) -> Response:
+        return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+    return mcp
+
+
+def create_app() -> StarletteWithLifespan:
+    return create_mcp(get_config()).http_app(transport='http', stateless_http=True)
 
 
 def main():
-    merge_requests.register_tools(mcp, service_client, config.url)
-    repository.register_tools(mcp, service_client, config.url)
+    config = get_config()
     uvicorn_cfg = {'log_config': UVICORN_LOG_CONFIG}
     if config.bind_uses_tls:
         uvicorn_cfg['ssl_certfile'] = str(config.ssl_cert_path)
         uvicorn_cfg['ssl_keyfile'] = str(config.ssl_key_path)
 
-    mcp.run(
+    if config.server_workers > 1:
+        uvicorn.run(
+            'gitlab_mcp.server:create_app',
+            factory=True,
+            host=config.server_host,
+            port=config.server_port,
+            workers=config.server_workers,
+            lifespan='on',
+            timeout_graceful_shutdown=0,
+            **uvicorn_cfg,
+        )
+        return
+
+    create_mcp(config).run(
         transport='http',
         host=config.server_host,
         port=config.server_port,
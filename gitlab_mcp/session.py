@@ -0,0 +1,173 @@
+import hashlib
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+import requests
+from requests import PreparedRequest
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from gitlab_mcp.cache import ByteBudgetCache
+from gitlab_mcp.metrics import record_cache_hit, record_upstream_response
+from gitlab_mcp.scheduler import RateLimitScheduler
+
+HTTP_POOL_SIZE = 64
+
+
+def request_key(request: PreparedRequest) -> str:
+    scope = request.headers.get('PRIVATE-TOKEN') or request.headers.get('Authorization') or ''
+
+    return hashlib.sha256(f'{scope}\0{request.method}\0{request.url}'.encode()).hexdigest()
+
+
+def copy_response(response: requests.Response, request: PreparedRequest) -> requests.Response:
+    copy = requests.Response()
+    copy.status_code = response.status_code
+    copy.reason = response.reason
+    copy.url = response.url
+    copy.headers = CaseInsensitiveDict(response.headers)
+    copy.encoding = response.encoding
+    copy.elapsed = response.elapsed
+    copy.request = request
+    copy._content = response.content
+
+    return copy
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    etag: str
+    headers: dict[str, str]
+    content: bytes
+    encoding: str | None
+
+    @staticmethod
+    def from_response(response: requests.Response) -> 'CachedResponse':
+        return CachedResponse(
+            url=response.url,
+            etag=response.headers['ETag'],
+            headers=dict(response.headers),
+            content=response.content,
+            encoding=response.encoding,
+        )
+
+    def to_response(self, request: PreparedRequest) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response.request = request
+        response._content = self.content
+
+        return response
+
+
+class ResponseCache:
+    def __init__(self, max_bytes: int):
+        self._entries = ByteBudgetCache(max_bytes)
+
+    def get(self, request: PreparedRequest) -> CachedResponse | None:
+        return self._entries.get(request_key(request))
+
+    def put(self, request: PreparedRequest, response: requests.Response) -> None:
+        cached = CachedResponse.from_response(response)
+        self._entries.set(request_key(request), cached, len(cached.content))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class RequestCoalescer:
+    def __init__(self):
+        self._flights: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def run(self, request: PreparedRequest, send) -> requests.Response:
+        key = request_key(request)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Future()
+
+        if not leader:
+            record_cache_hit('coalesced')
+            return copy_response(flight.result(), request)
+
+        try:
+            response = send(request)
+            response.content
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(response)
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+        return response
+
+
+class GitLabSession(requests.Session):
+    def __init__(
+        self,
+        response_cache: ResponseCache | None = None,
+        scheduler: RateLimitScheduler | None = None,
+    ):
+        super().__init__()
+        adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+        self._response_cache = response_cache
+        self._scheduler = scheduler
+        self._coalescer = RequestCoalescer()
+
+    def send(self, request: PreparedRequest, **kwargs) -> requests.Response:
+        if request.method != 'GET' or kwargs.get('stream'):
+            return self._schedule(request, **kwargs)
+
+        return self._coalescer.run(request, lambda r: self._schedule(r, **kwargs))
+
+    def _schedule(self, request: PreparedRequest, **kwargs) -> requests.Response:
+        if self._scheduler is None:
+            return self._send(request, **kwargs)
+
+        attempt = 0
+        while True:
+            self._scheduler.acquire()
+            response = self._send(request, **kwargs)
+            self._scheduler.observe(response)
+            delay = self._scheduler.retry_delay(response, attempt)
+            if delay is None:
+                return response
+
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(self, request: PreparedRequest, **kwargs) -> requests.Response:
+        if self._response_cache is None or request.method != 'GET' or kwargs.get('stream'):
+            response = super().send(request, **kwargs)
+            record_upstream_response(response, streamed=bool(kwargs.get('stream')))
+            return response
+
+        cached = self._response_cache.get(request)
+        if cached is not None:
+            request.headers['If-None-Match'] = cached.etag
+
+        response = super().send(request, **kwargs)
+        record_upstream_response(response)
+        if response.status_code == 304 and cached is not None:
+            record_cache_hit('etag')
+            return cached.to_response(request)
+
+        if response.status_code == 200 and 'ETag' in response.headers:
+            self._response_cache.put(request, response)
+
+        return response
@@ -0,0 +1,48 @@
+import hashlib
+import json
+
+from gitlab_mcp.cache import TTLCache
+from gitlab_mcp.store import SQLiteStore
+
+SNAPSHOT_NAMESPACE = 'merge_request_snapshots'
+SNAPSHOT_TTL = 7 * 24 * 3600
+LOCAL_SNAPSHOTS = 4096
+SNAPSHOT_ID_LENGTH = 16
+
+
+def snapshot_id(snapshot: dict) -> str:
+    return hashlib.sha256(json.dumps(snapshot, sort_keys=True).encode()).hexdigest()[:SNAPSHOT_ID_LENGTH]
+
+
+class SnapshotStore:
+    def __init__(self, store: SQLiteStore | None = None, ttl: float = SNAPSHOT_TTL):
+        self._store = store
+        self._ttl = ttl
+        self._local = TTLCache(LOCAL_SNAPSHOTS, ttl)
+
+    def get(self, user: int, project_id: int, snapshot: str | None = None) -> dict | None:
+        if snapshot is None:
+            snapshot = self._get(f'{user}:{project_id}')
+            if snapshot is None:
+                return None
+
+        return self._get(f'{user}:{project_id}:{snapshot}')
+
+    def set(self, user: int, project_id: int, snapshot: dict) -> str:
+        key = snapshot_id(snapshot)
+        self._set(f'{user}:{project_id}:{key}', snapshot)
+        self._set(f'{user}:{project_id}', key)
+
+        return key
+
+    def _get(self, key: str):
+        if self._store is None:
+            return self._local.get(key)
+
+        return self._store.get(SNAPSHOT_NAMESPACE, key)
+
+    def _set(self, key: str, value) -> None:
+        if self._store is None:
+            self._local.set(key, value)
+        else:
+            self._store.set(SNAPSHOT_NAMESPACE, key, value, self._ttl)
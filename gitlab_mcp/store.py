@@ -0,0 +1,83 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+SQLITE_BUSY_TIMEOUT = 5.0
+PURGE_EVERY_WRITES = 1000
+
+
+class SQLiteStore:
+    def __init__(self, path: Path, purge_every: int = PURGE_EVERY_WRITES):
+        self._path = path
+        self._local = threading.local()
+        self._purge_every = purge_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL, '
+                'PRIMARY KEY (namespace, key))'
+            )
+        self.purge_expired()
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        row = self._connection().execute(
+            'SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ?',
+            (namespace, key),
+        ).fetchone()
+        if row is None:
+            return default
+
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            self.delete(namespace, key)
+            return default
+
+        return json.loads(value)
+
+    def set(self, namespace: str, key: str, value: Any, ttl: float | None = None) -> None:
+        if ttl is not None and ttl <= 0:
+            self.delete(namespace, key)
+            return
+
+        expires_at = None if ttl is None else time.time() + ttl
+        with self._connection() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)',
+                (namespace, key, json.dumps(value), expires_at),
+            )
+        if self._count_write():
+            self.purge_expired()
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._connection() as conn:
+            conn.execute('DELETE FROM entries WHERE namespace = ? AND key = ?', (namespace, key))
+
+    def purge_expired(self) -> int:
+        with self._connection() as conn:
+            cursor = conn.execute(
+                'DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?',
+                (time.time(),),
+            )
+
+            return cursor.rowcount
+
+    def _count_write(self) -> bool:
+        with self._lock:
+            self._writes += 1
+
+            return self._writes % self._purge_every == 0
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=SQLITE_BUSY_TIMEOUT)
+            self._local.conn = conn
+
+        return conn
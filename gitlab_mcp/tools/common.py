@@ -1,10 +1,73 @@
-from functools import wraps
+import asyncio
+import base64
+import binascii
+import contextvars
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields as dataclass_fields
+from functools import partial, wraps
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit
 
+import gitlab
 import gitlab.exceptions
 from fastmcp.server.dependencies import get_access_token
 from mcp.types import CallToolResult, TextContent
 
-from gitlab_mcp.client import CompositeGitLabClient, PermissionDenied, ProjectNotFound, TokenGitLabClient
+from gitlab_mcp.client import (
+    ClientPool,
+    CompositeGitLabClient,
+    PermissionDenied,
+    ProjectNotFound,
+    TokenGitLabClient,
+)
+from gitlab_mcp.metrics import track_tool
+from gitlab_mcp.mirror import GitError
+from gitlab_mcp.scheduler import set_current_user
+from gitlab_mcp.session import HTTP_POOL_SIZE
+
+CLIENT_POOL_SIZE = 256
+CLIENT_POOL_TTL = 900
+WORKER_THREADS = HTTP_POOL_SIZE
+FANOUT_THREADS = HTTP_POOL_SIZE
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+PAGE_TOKEN_KEYS = frozenset({'page', 'id_after', 'page_token', 'offset', 'snapshot', 'path_after', 'sha'})
+
+_client_pool = ClientPool(max_size=CLIENT_POOL_SIZE, ttl=CLIENT_POOL_TTL)
+_worker_pool = ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix='gitlab-mcp-tool')
+_fanout_pool = ThreadPoolExecutor(max_workers=FANOUT_THREADS, thread_name_prefix='gitlab-mcp-fanout')
+
+
+def configure_pools(worker_threads: int, fanout_threads: int) -> None:
+    global _worker_pool, _fanout_pool
+    previous = (_worker_pool, _fanout_pool)
+    _worker_pool = ThreadPoolExecutor(max_workers=worker_threads, thread_name_prefix='gitlab-mcp-tool')
+    _fanout_pool = ThreadPoolExecutor(max_workers=fanout_threads, thread_name_prefix='gitlab-mcp-fanout')
+    for pool in previous:
+        pool.shutdown(wait=False)
+
+
+class InvalidArgument(Exception):
+    pass
+
+
+class InvalidPageToken(InvalidArgument):
+    pass
+
+
+@dataclass
+class Table:
+    columns: list[str]
+    rows: list[list[Any]]
+    next_page_token: str | None = None
+
+
+@dataclass
+class ProjectedPage:
+    items: list[dict[str, Any]]
+    next_page_token: str | None = None
 
 
 def get_client(
@@ -12,19 +75,135 @@ def get_client(
     url: str,
 ) -> CompositeGitLabClient:
     token = get_access_token()
+    set_current_user(hashlib.sha256(token.token.encode()).hexdigest())
 
-    return CompositeGitLabClient(token.token, service_client, url)
+    return _client_pool.get(token.token, service_client, url, token.expires_at)
 
 
 def handle_gitlab_errors(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except (ProjectNotFound, PermissionDenied, gitlab.exceptions.GitlabError) as e:
-            return CallToolResult(
-                content=[TextContent(type='text', text=str(e))],
-                isError=True,
-            )
+        with track_tool(func.__name__) as stats:
+            try:
+                return func(*args, **kwargs)
+            except (ProjectNotFound, PermissionDenied, InvalidArgument, GitError, gitlab.exceptions.GitlabError) as e:
+                stats.outcome = 'error'
+                return CallToolResult(
+                    content=[TextContent(type='text', text=str(e))],
+                    isError=True,
+                )
 
     return wrapper
+
+
+def run_in_worker(func):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(_worker_pool, partial(context.run, func, *args, **kwargs))
+
+    return wrapper
+
+
+def gather(*calls: Callable[[], Any], max_concurrency: int | None = None) -> list[Any]:
+    futures = []
+    for call in calls:
+        if max_concurrency is not None and len(futures) >= max_concurrency:
+            futures[len(futures) - max_concurrency].result()
+        futures.append(_fanout_pool.submit(contextvars.copy_context().run, call))
+
+    return [future.result() for future in futures]
+
+
+def encode_page_token(cursor: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+
+def decode_page_token(page_token: str | None) -> dict:
+    if not page_token:
+        return {}
+
+    try:
+        cursor = json.loads(base64.urlsafe_b64decode(page_token.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidPageToken(f'Invalid page_token: {page_token}')
+
+    if not isinstance(cursor, dict) or not cursor.keys() <= PAGE_TOKEN_KEYS:
+        raise InvalidPageToken(f'Invalid page_token: {page_token}')
+
+    return cursor
+
+
+def next_offset_page(cursor: dict, items: list) -> dict:
+    return {'page': cursor.get('page', 1) + 1}
+
+
+def list_page(
+    list_fn: Callable[..., list],
+    params: dict,
+    limit: int,
+    page_token: str | None,
+    next_cursor: Callable[[dict, list], dict] = next_offset_page,
+) -> tuple[list, str | None]:
+    per_page = max(1, min(limit, MAX_PAGE_SIZE))
+    cursor = decode_page_token(page_token)
+    items = list_fn(**params, **cursor, per_page=per_page, get_all=False)
+    if len(items) < per_page:
+        return items, None
+
+    return items, encode_page_token(next_cursor(cursor, items))
+
+
+def keyset_page(
+    gl: gitlab.Gitlab,
+    path: str,
+    params: dict,
+    limit: int,
+    page_token: str | None,
+) -> tuple[list[dict], str | None]:
+    per_page = max(1, min(limit, MAX_PAGE_SIZE))
+    cursor = decode_page_token(page_token)
+    if not cursor.keys() <= {'page_token'}:
+        raise InvalidPageToken(f'Invalid page_token: {page_token}')
+    response = gl.http_request('get', path, query_data={**params, **cursor, 'per_page': per_page})
+    next_url = response.links.get('next', {}).get('url')
+    next_query = parse_qs(urlsplit(next_url).query) if next_url else {}
+    if 'page_token' not in next_query:
+        return response.json(), None
+
+    return response.json(), encode_page_token({'page_token': next_query['page_token'][-1]})
+
+
+def select_fields(item_type: type, fields: list[str] | None) -> list[str]:
+    names = [f.name for f in dataclass_fields(item_type)]
+    if not fields:
+        return names
+
+    unknown = [name for name in fields if name not in names]
+    if unknown:
+        raise InvalidArgument(f'Unknown fields: {", ".join(unknown)}. Available fields: {", ".join(names)}')
+
+    return list(dict.fromkeys(fields))
+
+
+def project_items(
+    items: list,
+    item_type: type,
+    fields: list[str] | None,
+    tabular: bool,
+    next_page_token: str | None = None,
+) -> Table | ProjectedPage:
+    columns = select_fields(item_type, fields)
+    if tabular:
+        return Table(
+            columns=columns,
+            rows=[[getattr(item, name) for name in columns] for item in items],
+            next_page_token=next_page_token,
+        )
+
+    return ProjectedPage(
+        items=[{name: getattr(item, name) for name in columns} for item in items],
+        next_page_token=next_page_token,
+    )
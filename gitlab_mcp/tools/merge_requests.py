@@ -1,12 +1,43 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime
+from fnmatch import fnmatchcase
+from itertools import islice
+from typing import Any, Collection, Iterable, Iterator, Literal
 
 from fastmcp import FastMCP
-from gitlab.v4.objects import ProjectMergeRequest
+from gitlab.v4.objects import Project as GitLabProject, ProjectMergeRequest
 
 from gitlab_mcp.client import TokenGitLabClient
-from gitlab_mcp.tools.common import get_client, handle_gitlab_errors
+from gitlab_mcp.snapshots import SnapshotStore
+from gitlab_mcp.tools.common import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidArgument,
+    ProjectedPage,
+    Table,
+    decode_page_token,
+    encode_page_token,
+    gather,
+    get_client,
+    handle_gitlab_errors,
+    list_page,
+    project_items,
+    run_in_worker,
+)
+from gitlab_mcp.tools.prefetch import Prefetcher
+
+DetailSection = Literal['approvals', 'reactions']
+DETAIL_SECTIONS: tuple[DetailSection, ...] = ('approvals', 'reactions')
+DEFAULT_MAX_FILE_DIFF_BYTES = 64 * 1024
+DEFAULT_MAX_TOTAL_DIFF_BYTES = 512 * 1024
+ReviewSection = Literal['approvals', 'reactions', 'changes', 'commits', 'pipelines', 'discussions']
+REVIEW_SECTIONS: tuple[ReviewSection, ...] = ('approvals', 'reactions', 'changes', 'commits', 'pipelines', 'discussions')
+DEFAULT_REVIEW_PIPELINES = 5
+MAX_SYNC_MERGE_REQUESTS = MAX_PAGE_SIZE
+SYNC_PIPELINES = 5
+ACTIVE_PIPELINE_STATUSES = frozenset({'created', 'waiting_for_resource', 'preparing', 'pending', 'running'})
 
 
 @dataclass
@@ -40,6 +71,12 @@ class MergeRequest:
         )
 
 
+@dataclass
+class MergeRequestPage:
+    items: list[MergeRequest]
+    next_page_token: str | None
+
+
 @dataclass
 class MergeRequestDetails:
     iid: int
@@ -62,14 +99,20 @@ class MergeRequestDetails:
     work_in_progress: bool
     has_conflicts: bool
     blocking_discussions_resolved: bool
-    approved_by: list[str]
-    reactions: list[str]
+    approved_by: list[str] | None = None
+    reactions: list[str] | None = None
 
     @staticmethod
-    def from_gitlab(mr: ProjectMergeRequest) -> MergeRequestDetails:
-        approvals = mr.approvals.get()
-        approved_by = [a['user']['username'] for a in approvals.approved_by]
-        reactions = [e.name for e in mr.awardemojis.list(iterator=True)]
+    def from_gitlab(
+        mr: ProjectMergeRequest,
+        include: Collection[DetailSection] = DETAIL_SECTIONS,
+    ) -> MergeRequestDetails:
+        fetchers = {
+            'approvals': lambda: fetch_approved_by(mr),
+            'reactions': lambda: fetch_reactions(mr),
+        }
+        sections = [name for name in fetchers if name in include]
+        results = dict(zip(sections, gather(*(fetchers[name] for name in sections))))
 
         return MergeRequestDetails(
             iid=mr.iid,
@@ -92,11 +135,25 @@ class MergeRequestDetails:
             work_in_progress=mr.work_in_progress,
             has_conflicts=mr.has_conflicts,
             blocking_discussions_resolved=mr.blocking_discussions_resolved,
-            approved_by=approved_by,
-            reactions=reactions,
+            approved_by=results.get('approvals'),
+            reactions=results.get('reactions'),
         )
 
 
+def fetch_approved_by(mr: ProjectMergeRequest) -> list[str]:
+    return [a['user']['username'] for a in mr.approvals.get().approved_by]
+
+
+def fetch_reactions(mr: ProjectMergeRequest) -> list[str]:
+    return [e.name for e in mr.awardemojis.list(iterator=True)]
+
+
+def take(items: Iterable[Any], limit: int) -> tuple[list[Any], bool]:
+    taken = list(islice(items, limit + 1))
+
+    return taken[:limit], len(taken) > limit
+
+
 @dataclass
 class MergeRequestChange:
     old_path: str
@@ -107,9 +164,17 @@ class MergeRequestChange:
     renamed_file: bool
     deleted_file: bool
     diff: str
+    truncated: bool = False
 
     @staticmethod
-    def from_dict(c: dict) -> MergeRequestChange:
+    def from_dict(c: dict, max_diff_bytes: int | None = None) -> MergeRequestChange:
+        diff = c['diff']
+        truncated = False
+        if max_diff_bytes is not None and len(diff.encode()) > max_diff_bytes:
+            diff = diff.encode()[:max_diff_bytes].decode('utf-8', 'ignore')
+            diff = diff[:diff.rfind('\n') + 1] or diff
+            truncated = True
+
         return MergeRequestChange(
             old_path=c['old_path'],
             new_path=c['new_path'],
@@ -118,13 +183,58 @@ class MergeRequestChange:
             new_file=c['new_file'],
             renamed_file=c['renamed_file'],
             deleted_file=c['deleted_file'],
-            diff=c['diff'],
+            diff=diff,
+            truncated=truncated,
         )
 
 
 @dataclass
 class MergeRequestChanges:
     changes: list[MergeRequestChange]
+    next_page_token: str | None = None
+    truncated: bool = False
+
+
+def iter_merge_request_diffs(mr: ProjectMergeRequest, start: int, per_page: int) -> Iterator[tuple[int, dict, bool]]:
+    page = start // per_page + 1
+    diffs = mr.manager.gitlab.http_list(
+        f'{mr.manager.path}/{mr.encoded_id}/diffs',
+        query_data={'page': page, 'per_page': per_page},
+        iterator=True,
+    )
+    for index, diff in enumerate(diffs, start=(page - 1) * per_page):
+        if index >= start:
+            total = getattr(diffs, 'total', None)
+            yield index, diff, total is not None and index + 1 >= total
+
+
+def collect_changes(
+    mr: ProjectMergeRequest,
+    paths: list[str] | None,
+    max_file_bytes: int,
+    max_total_bytes: int,
+    limit: int,
+    page_token: str | None,
+) -> MergeRequestChanges:
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    start = decode_page_token(page_token).get('offset', 0)
+    changes = []
+    total_bytes = 0
+    for index, diff, last in iter_merge_request_diffs(mr, start, limit):
+        if paths and not any(fnmatchcase(diff['new_path'], p) or fnmatchcase(diff['old_path'], p) for p in paths):
+            continue
+
+        change = MergeRequestChange.from_dict(diff, max_file_bytes)
+        size = len(change.diff.encode())
+        if changes and total_bytes + size > max_total_bytes:
+            return MergeRequestChanges(changes, encode_page_token({'offset': index}), truncated=True)
+
+        total_bytes += size
+        changes.append(change)
+        if len(changes) == limit and not last:
+            return MergeRequestChanges(changes, encode_page_token({'offset': index + 1}))
+
+    return MergeRequestChanges(changes)
 
 
 @dataclass
@@ -208,6 +318,165 @@ class Discussion:
     individual_note: bool
     notes: list[Note]
 
+    @staticmethod
+    def from_gitlab(d) -> Discussion:
+        return Discussion(
+            id=d.id,
+            individual_note=d.individual_note,
+            notes=[Note.from_dict(n) for n in d.attributes['notes']],
+        )
+
+
+@dataclass
+class MergeRequestReviewContext:
+    merge_request: MergeRequestDetails
+    changes: MergeRequestChanges | None = None
+    commits: list[Commit] | None = None
+    pipelines: list[Pipeline] | None = None
+    discussions: list[Discussion] | None = None
+    truncated_sections: list[str] = field(default_factory=list)
+
+
+MergeRequestEventType = Literal['opened', 'updated', 'state_changed', 'note_added', 'pipeline_changed']
+
+
+@dataclass
+class MergeRequestEvent:
+    type: MergeRequestEventType
+    mr_iid: int
+    title: str
+    state: str
+    web_url: str
+    updated_at: str
+    previous_state: str | None = None
+    note: Note | None = None
+    pipeline: Pipeline | None = None
+
+    @staticmethod
+    def from_snapshot(event_type: MergeRequestEventType, iid: str, snapshot: dict, **kwargs) -> MergeRequestEvent:
+        return MergeRequestEvent(
+            type=event_type,
+            mr_iid=int(iid),
+            title=snapshot['title'],
+            state=snapshot['state'],
+            web_url=snapshot['web_url'],
+            updated_at=snapshot['updated_at'],
+            **kwargs,
+        )
+
+
+@dataclass
+class MergeRequestUpdates:
+    events: list[MergeRequestEvent]
+    cursor: str
+    has_more: bool = False
+
+
+def parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def snapshot_merge_request(mr: ProjectMergeRequest, pipelines: dict[str, str]) -> dict:
+    return {
+        'title': mr.title,
+        'state': mr.state,
+        'web_url': mr.web_url,
+        'updated_at': mr.updated_at,
+        'sha': mr.sha,
+        'user_notes_count': mr.user_notes_count,
+        'pipelines': pipelines,
+    }
+
+
+def has_active_pipeline(snapshot: dict) -> bool:
+    return any(status in ACTIVE_PIPELINE_STATUSES for status in snapshot['pipelines'].values())
+
+
+def notes_since(mr: ProjectMergeRequest, since: str) -> list[Note]:
+    since_time = parse_time(since)
+    notes = []
+    for note in mr.notes.list(order_by='created_at', sort='desc', iterator=True):
+        if parse_time(note.created_at) <= since_time:
+            break
+        if not note.system:
+            notes.append(Note.from_dict(note.attributes))
+
+    return notes[::-1]
+
+
+def recent_pipelines(mr: ProjectMergeRequest, known: dict[str, str]) -> tuple[list[Pipeline], dict[str, str]]:
+    pipelines = [Pipeline.from_dict(p.attributes) for p in islice(mr.pipelines.list(iterator=True), SYNC_PIPELINES)]
+    changed = [p for p in reversed(pipelines) if known.get(str(p.id)) != p.status]
+
+    return changed, {str(p.id): p.status for p in pipelines}
+
+
+def baseline_snapshot(project: GitLabProject) -> dict:
+    latest = project.mergerequests.list(order_by='updated_at', sort='desc', per_page=1, get_all=False)
+    merge_requests = {
+        str(mr.iid): snapshot_merge_request(mr, {})
+        for mr in project.mergerequests.list(state='opened', iterator=True)
+    }
+
+    return {'updated_after': latest[0].updated_at if latest else None, 'merge_requests': merge_requests}
+
+
+def collect_updates(
+    project: GitLabProject,
+    snapshot: dict,
+    updated_after: str,
+) -> tuple[list[MergeRequestEvent], dict, bool]:
+    known = dict(snapshot['merge_requests'])
+    active = {iid for iid, mr_snapshot in known.items() if has_active_pipeline(mr_snapshot)}
+    events = []
+    watermark = updated_after
+    mrs = project.mergerequests.list(updated_after=updated_after, order_by='updated_at', sort='asc', iterator=True)
+    mrs, has_more = take(mrs, MAX_SYNC_MERGE_REQUESTS)
+    for mr in mrs:
+        iid = str(mr.iid)
+        watermark = mr.updated_at
+        previous = known.get(iid)
+        if previous is not None and previous['updated_at'] == mr.updated_at:
+            continue
+
+        pipelines = {} if previous is None else previous['pipelines']
+        changed_pipelines = []
+        if previous is None or mr.sha != previous['sha'] or iid in active:
+            changed_pipelines, pipelines = recent_pipelines(mr, pipelines)
+            active.discard(iid)
+        known[iid] = snapshot_merge_request(mr, pipelines)
+
+        if previous is None:
+            created = parse_time(mr.created_at) > parse_time(updated_after)
+            events.append(MergeRequestEvent.from_snapshot('opened' if created else 'updated', iid, known[iid]))
+        elif previous['state'] != mr.state:
+            events.append(MergeRequestEvent.from_snapshot(
+                'state_changed', iid, known[iid], previous_state=previous['state'],
+            ))
+        else:
+            events.append(MergeRequestEvent.from_snapshot('updated', iid, known[iid]))
+
+        if previous is None or previous['user_notes_count'] != mr.user_notes_count:
+            events.extend(
+                MergeRequestEvent.from_snapshot('note_added', iid, known[iid], note=note)
+                for note in notes_since(mr, updated_after)
+            )
+        events.extend(
+            MergeRequestEvent.from_snapshot('pipeline_changed', iid, known[iid], pipeline=pipeline)
+            for pipeline in changed_pipelines
+        )
+
+    for iid in sorted(active, key=int):
+        mr = project.mergerequests.get(int(iid), lazy=True)
+        changed_pipelines, pipelines = recent_pipelines(mr, known[iid]['pipelines'])
+        known[iid] = {**known[iid], 'pipelines': pipelines}
+        events.extend(
+            MergeRequestEvent.from_snapshot('pipeline_changed', iid, known[iid], pipeline=pipeline)
+            for pipeline in changed_pipelines
+        )
+
+    return events, {'updated_after': watermark, 'merge_requests': known}, has_more
+
 
 @dataclass
 class ActionResult:
@@ -231,9 +500,13 @@ def register_tools(
     mcp: FastMCP,
     service_client: TokenGitLabClient,
     url: str,
+    prefetcher: Prefetcher | None = None,
+    snapshots: SnapshotStore | None = None,
 ):
+    snapshots = snapshots if snapshots is not None else SnapshotStore()
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def search_merge_requests(
         state: str | None = None,
@@ -246,9 +519,13 @@ def register_tools(
         created_before: str | None = None,
         updated_after: str | None = None,
         updated_before: str | None = None,
-    ) -> list[MergeRequest]:
+        limit: int = DEFAULT_PAGE_SIZE,
+        page_token: str | None = None,
+        fields: list[str] | None = None,
+        tabular: bool = False,
+    ) -> MergeRequestPage | ProjectedPage | Table:
         client = get_client(service_client, url)
-        params = {'iterator': True, 'scope': scope}
+        params = {'scope': scope}
         if state:
             params['state'] = state
         if wip:
@@ -268,21 +545,30 @@ def register_tools(
         if updated_before:
             params['updated_before'] = updated_before
 
-        mrs = client.list_merge_requests(**params)
+        mrs, next_page_token = list_page(client.list_merge_requests, params, limit, page_token)
+
+        items = [MergeRequest.from_gitlab(mr) for mr in mrs]
+        if fields or tabular:
+            return project_items(items, MergeRequest, fields, tabular, next_page_token)
 
-        return [MergeRequest.from_gitlab(mr) for mr in mrs]
+        return MergeRequestPage(items=items, next_page_token=next_page_token)
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def list_merge_requests(
         project_id: str,
         state: str | None = None,
         author_username: str | None = None,
         assignee_username: str | None = None,
-    ) -> list[MergeRequest]:
+        limit: int = DEFAULT_PAGE_SIZE,
+        page_token: str | None = None,
+        fields: list[str] | None = None,
+        tabular: bool = False,
+    ) -> MergeRequestPage | ProjectedPage | Table:
         client = get_client(service_client, url)
         project = client.get_project(project_id)
-        params = {'iterator': True}
+        params = {}
         if state:
             params['state'] = state
         if author_username:
@@ -290,64 +576,89 @@ def register_tools(
         if assignee_username:
             params['assignee_username'] = assignee_username
 
-        mrs = project.mergerequests.list(**params)
+        mrs, next_page_token = list_page(project.mergerequests.list, params, limit, page_token)
+
+        items = [MergeRequest.from_gitlab(mr) for mr in mrs]
+        if fields or tabular:
+            return project_items(items, MergeRequest, fields, tabular, next_page_token)
 
-        return [MergeRequest.from_gitlab(mr) for mr in mrs]
+        return MergeRequestPage(items=items, next_page_token=next_page_token)
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def get_merge_request(
         project_id: str,
         mr_iid: int,
+        include: list[DetailSection] | None = None,
     ) -> MergeRequestDetails:
         client = get_client(service_client, url)
         project = client.get_project(project_id)
         mr = project.mergerequests.get(mr_iid)
 
-        return MergeRequestDetails.from_gitlab(mr)
+        return MergeRequestDetails.from_gitlab(mr, DETAIL_SECTIONS if include is None else include)
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def get_merge_request_changes(
         project_id: str,
         mr_iid: int,
+        paths: list[str] | None = None,
+        max_file_bytes: int = DEFAULT_MAX_FILE_DIFF_BYTES,
+        max_total_bytes: int = DEFAULT_MAX_TOTAL_DIFF_BYTES,
+        limit: int = DEFAULT_PAGE_SIZE,
+        page_token: str | None = None,
     ) -> MergeRequestChanges:
         client = get_client(service_client, url)
         project = client.get_project(project_id)
-        mr = project.mergerequests.get(mr_iid)
-        changes = mr.changes()
+        mr = project.mergerequests.get(mr_iid, lazy=True)
+        result = collect_changes(mr, paths, max_file_bytes, max_total_bytes, limit, page_token)
+        if prefetcher is not None:
+            prefetcher.prefetch_changes(project, mr, result.changes)
 
-        return MergeRequestChanges(
-            changes=[MergeRequestChange.from_dict(c) for c in changes['changes']]
-        )
+        return result
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def get_mr_commits(
         project_id: str,
         mr_iid: int,
-    ) -> list[Commit]:
+        fields: list[str] | None = None,
+        tabular: bool = False,
+    ) -> list[Commit] | ProjectedPage | Table:
         client = get_client(service_client, url)
         project = client.get_project(project_id)
-        mr = project.mergerequests.get(mr_iid)
+        mr = project.mergerequests.get(mr_iid, lazy=True)
         commits = mr.commits()
+        items = [Commit.from_gitlab(c) for c in commits]
+        if fields or tabular:
+            return project_items(items, Commit, fields, tabular)
 
-        return [Commit.from_gitlab(c) for c in commits]
+        return items
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def get_mr_pipelines(
         project_id: str,
         mr_iid: int,
-    ) -> list[Pipeline]:
+        fields: list[str] | None = None,
+        tabular: bool = False,
+    ) -> list[Pipeline] | ProjectedPage | Table:
         client = get_client(service_client, url)
         project = client.get_project(project_id)
-        mr = project.mergerequests.get(mr_iid)
+        mr = project.mergerequests.get(mr_iid, lazy=True)
         pipelines = mr.pipelines.list()
+        items = [Pipeline.from_dict(p.attributes) for p in pipelines]
+        if fields or tabular:
+            return project_items(items, Pipeline, fields, tabular)
 
-        return [Pipeline.from_dict(p) for p in pipelines]
+        return items
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def get_mr_discussions(
         project_id: str,
@@ -355,19 +666,102 @@ def register_tools(
     ) -> list[Discussion]:
         client = get_client(service_client, url)
         project = client.get_project(project_id)
-        mr = project.mergerequests.get(mr_iid)
+        mr = project.mergerequests.get(mr_iid, lazy=True)
         discussions = mr.discussions.list(iterator=True)
 
-        return [
-            Discussion(
-                id=d.id,
-                individual_note=d.individual_note,
-                notes=[Note.from_dict(n) for n in d.attributes['notes']],
-            )
-            for d in discussions
+        return [Discussion.from_gitlab(d) for d in discussions]
+
+    @mcp.tool
+    @run_in_worker
+    @handle_gitlab_errors
+    def get_merge_request_review_context(
+        project_id: str,
+        mr_iid: int,
+        include: list[ReviewSection] | None = None,
+        exclude: list[ReviewSection] | None = None,
+        paths: list[str] | None = None,
+        max_file_bytes: int = DEFAULT_MAX_FILE_DIFF_BYTES,
+        max_total_bytes: int = DEFAULT_MAX_TOTAL_DIFF_BYTES,
+        max_changes: int = DEFAULT_PAGE_SIZE,
+        max_commits: int = DEFAULT_PAGE_SIZE,
+        max_pipelines: int = DEFAULT_REVIEW_PIPELINES,
+        max_discussions: int = DEFAULT_PAGE_SIZE,
+    ) -> MergeRequestReviewContext:
+        client = get_client(service_client, url)
+        project = client.get_project(project_id)
+        mr = project.mergerequests.get(mr_iid)
+        fetchers = {
+            'approvals': lambda: fetch_approved_by(mr),
+            'reactions': lambda: fetch_reactions(mr),
+            'changes': lambda: collect_changes(mr, paths, max_file_bytes, max_total_bytes, max_changes, None),
+            'commits': lambda: take(mr.commits(), max_commits),
+            'pipelines': lambda: take(mr.pipelines.list(iterator=True), max_pipelines),
+            'discussions': lambda: take(mr.discussions.list(iterator=True), max_discussions),
+        }
+        sections = [
+            name for name in REVIEW_SECTIONS
+            if (include is None or name in include) and name not in (exclude or ())
         ]
+        results = dict(zip(sections, gather(*(fetchers[name] for name in sections))))
+
+        context = MergeRequestReviewContext(
+            merge_request=replace(
+                MergeRequestDetails.from_gitlab(mr, ()),
+                approved_by=results.get('approvals'),
+                reactions=results.get('reactions'),
+            ),
+            changes=results.get('changes'),
+        )
+        if context.changes is not None:
+            if prefetcher is not None:
+                prefetcher.prefetch_changes(project, mr, context.changes.changes)
+            if context.changes.next_page_token is not None:
+                context.truncated_sections.append('changes')
+
+        converters = {
+            'commits': Commit.from_gitlab,
+            'pipelines': lambda p: Pipeline.from_dict(p.attributes),
+            'discussions': Discussion.from_gitlab,
+        }
+        for name, convert in converters.items():
+            if name not in results:
+                continue
+
+            items, truncated = results[name]
+            setattr(context, name, [convert(item) for item in items])
+            if truncated:
+                context.truncated_sections.append(name)
+
+        return context
+
+    @mcp.tool
+    @run_in_worker
+    @handle_gitlab_errors
+    def get_merge_request_updates(
+        project_id: str,
+        cursor: str | None = None,
+    ) -> MergeRequestUpdates:
+        client = get_client(service_client, url)
+        project = client.get_project(project_id)
+        user = client.get_user_id()
+        if cursor:
+            snapshot_key = decode_page_token(cursor).get('snapshot')
+            snapshot = snapshots.get(user, project.id, snapshot_key) if snapshot_key else None
+            if snapshot is None:
+                raise InvalidArgument(f'Cursor has expired or does not belong to this project: {cursor}')
+        else:
+            snapshot = snapshots.get(user, project.id)
+
+        if snapshot is None or snapshot['updated_after'] is None:
+            events, snapshot, has_more = [], baseline_snapshot(project), False
+        else:
+            events, snapshot, has_more = collect_updates(project, snapshot, snapshot['updated_after'])
+        next_cursor = encode_page_token({'snapshot': snapshots.set(user, project.id, snapshot)})
+
+        return MergeRequestUpdates(events, next_cursor, has_more)
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def add_mr_discussion(
         project_id: str,
@@ -377,7 +771,7 @@ def register_tools(
     ) -> Discussion:
         client = get_client(service_client, url)
         project = client.get_user_project(project_id)
-        mr = project.mergerequests.get(mr_iid)
+        mr = project.mergerequests.get(mr_iid, lazy=True)
         params = {'body': body}
         if position:
             pos_dict = asdict(position)
@@ -392,6 +786,7 @@ def register_tools(
         )
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def add_merge_request_comment(
         project_id: str,
@@ -400,7 +795,7 @@ def register_tools(
     ) -> Note:
         client = get_client(service_client, url)
         project = client.get_user_project(project_id)
-        mr = project.mergerequests.get(mr_iid)
+        mr = project.mergerequests.get(mr_iid, lazy=True)
         note = mr.notes.create({'body': body})
 
         return Note(
@@ -411,6 +806,7 @@ def register_tools(
         )
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def create_merge_request(
         project_id: str,
@@ -418,6 +814,7 @@ def register_tools(
         target_branch: str,
         title: str,
         description: str | None = None,
+        include: list[DetailSection] | None = None,
     ) -> MergeRequestDetails:
         client = get_client(service_client, url)
         project = client.get_user_project(project_id)
@@ -431,9 +828,10 @@ def register_tools(
 
         mr = project.mergerequests.create(params)
 
-        return MergeRequestDetails.from_gitlab(mr)
+        return MergeRequestDetails.from_gitlab(mr, DETAIL_SECTIONS if include is None else include)
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def approve_merge_request(
         project_id: str,
@@ -441,12 +839,13 @@ def register_tools(
     ) -> ActionResult:
         client = get_client(service_client, url)
         project = client.get_user_project(project_id)
-        mr = project.mergerequests.get(mr_iid)
+        mr = project.mergerequests.get(mr_iid, lazy=True)
         mr.approve()
 
         return ActionResult(status='approved', mr_iid=mr_iid)
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def unapprove_merge_request(
         project_id: str,
@@ -454,12 +853,13 @@ def register_tools(
     ) -> ActionResult:
         client = get_client(service_client, url)
         project = client.get_user_project(project_id)
-        mr = project.mergerequests.get(mr_iid)
+        mr = project.mergerequests.get(mr_iid, lazy=True)
         mr.unapprove()
 
         return ActionResult(status='unapproved', mr_iid=mr_iid)
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def merge_merge_request(
         project_id: str,
@@ -468,7 +868,7 @@ def register_tools(
     ) -> ActionResult:
         client = get_client(service_client, url)
         project = client.get_user_project(project_id)
-        mr = project.mergerequests.get(mr_iid)
+        mr = project.mergerequests.get(mr_iid, lazy=True)
         params = {}
         if should_remove_source_branch:
             params['should_remove_source_branch'] = True
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import asdict
+from typing import Iterable, Iterator
+
+import gitlab.exceptions
+import requests
+from gitlab.v4.objects import Project as GitLabProject, ProjectMergeRequest
+
+from gitlab_mcp.cache import TTLCache
+from gitlab_mcp.content_cache import ContentCache
+from gitlab_mcp.mirror import RepositoryMirror
+from gitlab_mcp.scheduler import current_user, set_current_user
+from gitlab_mcp.tools.repository import DEFAULT_MAX_FILE_BYTES, file_cache_key, read_raw_file
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFETCH_CONCURRENCY = 4
+PLANNER_THREADS = 2
+SESSION_CACHE_SIZE = 4096
+SESSION_TTL = 30 * 60
+
+
+def merge_request_files(changes: Iterable, diff_refs: dict) -> Iterator[tuple[str, str]]:
+    seen = set()
+    for change in changes:
+        files = []
+        if not change.new_file:
+            files.append((diff_refs['base_sha'], change.old_path))
+        if not change.deleted_file:
+            files.append((diff_refs['head_sha'], change.new_path))
+        for file in files:
+            if file not in seen:
+                seen.add(file)
+                yield file
+
+
+class Prefetcher:
+    def __init__(
+        self,
+        content_cache: ContentCache,
+        session_bytes: int,
+        mirror: RepositoryMirror | None = None,
+        max_concurrency: int = DEFAULT_PREFETCH_CONCURRENCY,
+    ):
+        self._content_cache = content_cache
+        self._session_bytes = session_bytes
+        self._mirror = mirror
+        self._spent = TTLCache(SESSION_CACHE_SIZE, SESSION_TTL)
+        self._lock = threading.Lock()
+        self._planner = ThreadPoolExecutor(max_workers=PLANNER_THREADS, thread_name_prefix='gitlab-mcp-prefetch-plan')
+        self._fetcher = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='gitlab-mcp-prefetch')
+
+    def prefetch_changes(self, project: GitLabProject, mr: ProjectMergeRequest, changes: list) -> None:
+        if not changes or (self._mirror is not None and self._mirror.covers(project)):
+            return
+
+        user = current_user()
+        if self._remaining(user) > 0:
+            self._planner.submit(self._prefetch_changes, user, project, mr, changes)
+
+    def _prefetch_changes(self, user: str, project: GitLabProject, mr: ProjectMergeRequest, changes: list) -> None:
+        set_current_user(user)
+        diff_refs = mr.attributes.get('diff_refs')
+        if diff_refs is None:
+            try:
+                diff_refs = mr.manager.get(mr.iid).diff_refs
+            except (gitlab.exceptions.GitlabError, requests.RequestException) as e:
+                logger.debug('Skipping prefetch for !%s: %s', mr.iid, e)
+                return
+        if not diff_refs:
+            return
+
+        wait([
+            self._fetcher.submit(self._prefetch_file, user, project, sha, file_path)
+            for sha, file_path in merge_request_files(changes, diff_refs)
+        ])
+
+    def _prefetch_file(self, user: str, project: GitLabProject, sha: str, file_path: str) -> None:
+        key = file_cache_key(project.id, sha, file_path)
+        if self._remaining(user) <= 0 or self._content_cache.get(key) is not None:
+            return
+
+        set_current_user(user)
+        try:
+            content = read_raw_file(project, file_path, sha, max_bytes=DEFAULT_MAX_FILE_BYTES)
+        except (gitlab.exceptions.GitlabError, requests.RequestException) as e:
+            logger.debug('Failed to prefetch %s@%s: %s', file_path, sha, e)
+            return
+
+        self._content_cache.set(key, asdict(content))
+        self._charge(user, len(content.content.encode()))
+
+    def _remaining(self, user: str) -> int:
+        return self._session_bytes - self._spent.get(user, 0)
+
+    def _charge(self, user: str, size: int) -> None:
+        with self._lock:
+            self._spent.set(user, self._spent.get(user, 0) + size)
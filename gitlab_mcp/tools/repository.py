@@ -1,12 +1,47 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import posixpath
+from dataclasses import asdict, dataclass, replace
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator
 
 from fastmcp import FastMCP
+import gitlab.exceptions
+import requests
+from gitlab import utils
 from gitlab.v4.objects import Project as GitLabProject, ProjectBranch, ProjectCommit
 
+from gitlab_mcp.cache import TTLCache
 from gitlab_mcp.client import TokenGitLabClient
-from gitlab_mcp.tools.common import get_client, handle_gitlab_errors
+from gitlab_mcp.content_cache import ContentCache, is_commit_sha
+from gitlab_mcp.mirror import GitError, MirrorRepository, RepositoryMirror
+from gitlab_mcp.search_index import IndexTooLarge, InvalidPattern, SearchIndexCache, read_tar
+from gitlab_mcp.tools.common import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidArgument,
+    InvalidPageToken,
+    ProjectedPage,
+    Table,
+    gather,
+    get_client,
+    handle_gitlab_errors,
+    keyset_page,
+    decode_page_token,
+    encode_page_token,
+    list_page,
+    project_items,
+    run_in_worker,
+)
+
+MAX_BATCH_FILES = 100
+FILE_BATCH_CONCURRENCY = 16
+DEFAULT_MAX_FILE_BYTES = 1024 * 1024
+RAW_CHUNK_SIZE = 64 * 1024
+BINARY_SNIFF_BYTES = 8000
+SEARCH_RESULT_LIMIT = 20
+TREE_LISTING_CACHE_SIZE = 8
+TREE_LISTING_TTL = 300
 
 
 @dataclass
@@ -18,16 +53,22 @@ class Project:
     description: str | None
 
     @staticmethod
-    def from_gitlab(p: GitLabProject) -> Project:
+    def from_dict(p: dict) -> Project:
         return Project(
-            id=p.id,
-            name=p.name,
-            path_with_namespace=p.path_with_namespace,
-            web_url=p.web_url,
-            description=p.description,
+            id=p['id'],
+            name=p['name'],
+            path_with_namespace=p['path_with_namespace'],
+            web_url=p['web_url'],
+            description=p['description'],
         )
 
 
+@dataclass
+class ProjectPage:
+    items: list[Project]
+    next_page_token: str | None
+
+
 @dataclass
 class TreeItem:
     id: str
@@ -47,6 +88,12 @@ class TreeItem:
         )
 
 
+@dataclass
+class TreePage:
+    items: list[TreeItem]
+    next_page_token: str | None
+
+
 @dataclass
 class FileContent:
     file_path: str
@@ -56,6 +103,17 @@ class FileContent:
     content: str
     ref: str
     last_commit_id: str
+    start_line: int | None = None
+    end_line: int | None = None
+    truncated: bool = False
+    binary: bool = False
+
+
+@dataclass
+class FileResult:
+    file_path: str
+    file: FileContent | None = None
+    error: str | None = None
 
 
 @dataclass
@@ -66,6 +124,16 @@ class BlameCommit:
     message: str
     committed_date: str
 
+    @staticmethod
+    def from_dict(c: dict) -> BlameCommit:
+        return BlameCommit(
+            id=c['id'],
+            author_name=c['author_name'],
+            author_email=c['author_email'],
+            message=c['message'],
+            committed_date=c['committed_date'],
+        )
+
 
 @dataclass
 class BlameEntry:
@@ -73,6 +141,40 @@ class BlameEntry:
     lines: list[str]
 
 
+@dataclass
+class BlameRange:
+    start_line: int
+    end_line: int
+    commit: int
+
+
+@dataclass
+class CompactBlame:
+    commits: list[BlameCommit]
+    ranges: list[BlameRange]
+
+    @staticmethod
+    def from_blame(blame: list[dict], first_line: int) -> CompactBlame:
+        commits = []
+        indices = {}
+        ranges = []
+        line_no = first_line
+        for entry in blame:
+            commit_id = entry['commit']['id']
+            if commit_id not in indices:
+                indices[commit_id] = len(commits)
+                commits.append(BlameCommit.from_dict(entry['commit']))
+
+            end_line = line_no + len(entry['lines']) - 1
+            if ranges and ranges[-1].commit == indices[commit_id]:
+                ranges[-1].end_line = end_line
+            else:
+                ranges.append(BlameRange(start_line=line_no, end_line=end_line, commit=indices[commit_id]))
+            line_no = end_line + 1
+
+        return CompactBlame(commits=commits, ranges=ranges)
+
+
 @dataclass
 class CodeSearchResult:
     basename: str
@@ -95,6 +197,18 @@ class CodeSearchResult:
             project_id=r['project_id'],
         )
 
+    @staticmethod
+    def from_match(project_id: int, ref: str, path: str, line_no: int, text: str) -> CodeSearchResult:
+        return CodeSearchResult(
+            basename=posixpath.splitext(path)[0],
+            data=text,
+            path=path,
+            filename=path,
+            ref=ref,
+            startline=line_no,
+            project_id=project_id,
+        )
+
 
 @dataclass
 class BranchCommit:
@@ -126,6 +240,12 @@ class Branch:
         )
 
 
+@dataclass
+class BranchPage:
+    items: list[Branch]
+    next_page_token: str | None
+
+
 @dataclass
 class CommitListItem:
     id: str
@@ -155,6 +275,12 @@ class CommitListItem:
         )
 
 
+@dataclass
+class CommitPage:
+    items: list[CommitListItem]
+    next_page_token: str | None
+
+
 @dataclass
 class CommitDetails:
     id: str
@@ -188,21 +314,346 @@ class CommitDetails:
         )
 
 
+def validate_line_range(start_line: int | None, end_line: int | None) -> None:
+    if start_line is not None and start_line < 1:
+        raise InvalidArgument('start_line must be at least 1')
+    if end_line is not None and end_line < (start_line or 1):
+        raise InvalidArgument('end_line must not be before start_line')
+
+
+def trim_blame(blame: list[dict], start_line: int) -> list[dict]:
+    trimmed = []
+    line_no = 1
+    for entry in blame:
+        skip = start_line - line_no
+        line_no += len(entry['lines'])
+        if skip < len(entry['lines']):
+            trimmed.append({**entry, 'lines': entry['lines'][max(skip, 0):]})
+
+    return trimmed
+
+
+def read_lines(
+    chunks: Iterable[bytes],
+    start_line: int | None = None,
+    end_line: int | None = None,
+    max_bytes: int | None = None,
+) -> tuple[bytes, bool, bool]:
+    first_line = start_line or 1
+    lines = []
+    size = 0
+    line_no = 1
+    pending = bytearray()
+    binary = False
+    truncated = False
+    done = False
+    sniffed = False
+    for chunk in chunks:
+        if not sniffed:
+            sniffed = True
+            if b'\0' in chunk[:BINARY_SNIFF_BYTES]:
+                binary = True
+                break
+
+        *complete, rest = chunk.split(b'\n')
+        for piece in complete:
+            if end_line is not None and line_no > end_line:
+                done = True
+                break
+            if line_no >= first_line:
+                pending += piece
+                lines.append(bytes(pending) + b'\n')
+                size += len(pending) + 1
+                if max_bytes is not None and size > max_bytes:
+                    truncated = done = True
+                    break
+            pending.clear()
+            line_no += 1
+
+        if done or (end_line is not None and line_no > end_line):
+            break
+        if line_no >= first_line:
+            pending += rest
+            if max_bytes is not None and size + len(pending) > max_bytes:
+                lines.append(bytes(pending))
+                truncated = True
+                break
+    else:
+        if pending:
+            lines.append(bytes(pending))
+            size += len(pending)
+            truncated = max_bytes is not None and size > max_bytes
+
+    content = b''.join(lines)
+    if truncated:
+        content = content[:max_bytes]
+        content = content[:content.rfind(b'\n') + 1] or content
+
+    return content, truncated, binary
+
+
+def file_cache_key(
+    project_id: int,
+    sha: str,
+    file_path: str,
+    start_line: int | None = None,
+    end_line: int | None = None,
+    max_bytes: int | None = DEFAULT_MAX_FILE_BYTES,
+) -> tuple:
+    return ('file', project_id, sha, file_path, start_line, end_line, max_bytes)
+
+
+def read_raw_file(
+    project: GitLabProject,
+    file_path: str,
+    ref: str,
+    start_line: int | None = None,
+    end_line: int | None = None,
+    max_bytes: int | None = None,
+) -> FileContent:
+    response = project.manager.gitlab.http_get(
+        f'{project.files.path}/{utils.EncodedId(file_path)}/raw',
+        query_data={'ref': ref},
+        streamed=True,
+        raw=True,
+    )
+    try:
+        content, truncated, binary = read_lines(
+            response.iter_content(RAW_CHUNK_SIZE), start_line, end_line, max_bytes,
+        )
+        headers = response.headers
+    finally:
+        response.close()
+
+    return FileContent(
+        file_path=headers.get('X-Gitlab-File-Path', file_path),
+        file_name=headers.get('X-Gitlab-File-Name', file_path.rsplit('/', 1)[-1]),
+        size=int(headers.get('X-Gitlab-Size', 0)),
+        encoding='binary' if binary else 'utf-8',
+        content='' if binary else content.decode('utf-8', 'replace'),
+        ref=headers.get('X-Gitlab-Ref', ref),
+        last_commit_id=headers.get('X-Gitlab-Last-Commit-Id', ''),
+        start_line=start_line,
+        end_line=end_line,
+        truncated=truncated,
+        binary=binary,
+    )
+
+
+def read_mirror_file(
+    repository: MirrorRepository,
+    sha: str,
+    file_path: str,
+    start_line: int | None = None,
+    end_line: int | None = None,
+    max_bytes: int | None = None,
+) -> FileContent:
+    size = repository.blob_size(sha, file_path)
+    if size is None:
+        raise gitlab.exceptions.GitlabGetError('404 File Not Found', 404)
+
+    with repository.read_blob(sha, file_path) as chunks:
+        content, truncated, binary = read_lines(chunks, start_line, end_line, max_bytes)
+
+    return FileContent(
+        file_path=file_path,
+        file_name=file_path.rsplit('/', 1)[-1],
+        size=size,
+        encoding='binary' if binary else 'utf-8',
+        content='' if binary else content.decode('utf-8', 'replace'),
+        ref=sha,
+        last_commit_id=repository.last_commit(sha, file_path),
+        start_line=start_line,
+        end_line=end_line,
+        truncated=truncated,
+        binary=binary,
+    )
+
+
+def local_blame(
+    repository: MirrorRepository,
+    sha: str,
+    file_path: str,
+    start_line: int | None,
+    end_line: int | None,
+) -> list[dict]:
+    if repository.blob_size(sha, file_path) is None:
+        raise gitlab.exceptions.GitlabGetError('404 File Not Found', 404)
+
+    return repository.blame(sha, file_path, start_line, end_line)
+
+
+def archive_files(project: GitLabProject, sha: str) -> Iterator[tuple[str, bytes]]:
+    response = project.manager.gitlab.http_get(
+        f'/projects/{project.encoded_id}/repository/archive.tar.gz',
+        query_data={'sha': sha},
+        streamed=True,
+        raw=True,
+    )
+    try:
+        yield from read_tar(response.raw, strip_components=1)
+    finally:
+        response.close()
+
+
+def local_tree(repository: MirrorRepository, sha: str, path: str | None, recursive: bool) -> list[dict]:
+    if path and path.strip('/') and repository.object_type(sha, path.strip('/')) != 'tree':
+        raise gitlab.exceptions.GitlabGetError('404 Tree Not Found', 404)
+
+    return repository.tree(sha, path, recursive)
+
+
+def mirror_archive_files(repository: MirrorRepository, sha: str) -> Iterator[tuple[str, bytes]]:
+    with repository.archive(sha) as stream:
+        yield from read_tar(stream)
+
+
+def mirror_tree_page(
+    listing: tuple[list[dict], dict[str, int]],
+    sha: str,
+    limit: int,
+    page_token: str | None,
+) -> tuple[list[dict], str | None]:
+    per_page = max(1, min(limit, MAX_PAGE_SIZE))
+    cursor = decode_page_token(page_token)
+    if not cursor.keys() <= {'path_after', 'sha'}:
+        raise InvalidPageToken(f'Invalid page_token: {page_token}')
+
+    items, positions = listing
+    start = 0
+    if 'path_after' in cursor:
+        if cursor['path_after'] not in positions:
+            raise InvalidPageToken(f'Invalid page_token: {page_token}')
+        start = positions[cursor['path_after']] + 1
+
+    page = items[start:start + per_page]
+    if start + per_page >= len(items):
+        return page, None
+
+    return page, encode_page_token({'path_after': page[-1]['path'], 'sha': sha})
+
+
 def register_tools(
     mcp: FastMCP,
     service_client: TokenGitLabClient,
     url: str,
+    content_cache: ContentCache | None = None,
+    mirror: RepositoryMirror | None = None,
+    search_indexes: SearchIndexCache | None = None,
 ):
+    tree_listings = TTLCache(TREE_LISTING_CACHE_SIZE, TREE_LISTING_TTL)
+
+    def tree_listing(
+        repository: MirrorRepository,
+        sha: str,
+        path: str | None,
+        recursive: bool,
+    ) -> tuple[list[dict], dict[str, int]]:
+        key = (str(repository.path), sha, path, recursive)
+        listing = tree_listings.get(key)
+        if listing is None:
+            items = local_tree(repository, sha, path, recursive)
+            listing = (items, {item['path']: i for i, item in enumerate(items)})
+            tree_listings.set(key, listing)
+
+        return listing
+
+    def local_repository(project: GitLabProject, ref: str | None) -> tuple[MirrorRepository, str] | None:
+        if mirror is None:
+            return None
+
+        repository = mirror.repository(project)
+        if repository is None:
+            return None
+
+        sha = repository.resolve(ref or project.default_branch)
+        if sha is None:
+            mirror.refresh(project)
+
+        return None if sha is None else (repository, sha)
+
+    def pin_ref(project: GitLabProject, ref: str | None) -> str:
+        ref = ref or project.default_branch
+        if content_cache is None:
+            return ref
+
+        return content_cache.resolve_ref(project, ref)
+
+    def resolve_sha(project: GitLabProject, ref: str | None) -> str:
+        ref = ref or project.default_branch
+        if is_commit_sha(ref):
+            return ref
+        if content_cache is not None:
+            return content_cache.resolve_ref(project, ref)
+
+        return project.commits.get(ref).id
+
+    def index_search(
+        project: GitLabProject,
+        ref: str | None,
+        local: tuple[MirrorRepository, str] | None,
+        query: str,
+        regex: bool,
+    ) -> list[tuple[str, int, str]] | None:
+        if local is not None:
+            sha = local[1]
+            files = partial(mirror_archive_files, *local)
+        else:
+            sha = resolve_sha(project, ref)
+            files = partial(archive_files, project, sha)
+
+        try:
+            index = search_indexes.get_or_build((project.id, sha), files)
+            return index.search(query, regex, SEARCH_RESULT_LIMIT)
+        except IndexTooLarge:
+            return None
+        except InvalidPattern as e:
+            raise InvalidArgument(str(e))
+
+    def fetch_pinned(
+        project: GitLabProject,
+        pinned_ref: str,
+        kind: str,
+        params: tuple,
+        fetch: Callable[[str], Any],
+    ) -> Any:
+        if content_cache is None:
+            return fetch(pinned_ref)
+
+        return content_cache.get_or_fetch((kind, project.id, pinned_ref, *params), lambda: fetch(pinned_ref))
+
+    def read_file(
+        project: GitLabProject,
+        file_path: str,
+        pinned_ref: str,
+        start_line: int | None,
+        end_line: int | None,
+        max_bytes: int | None,
+    ) -> FileContent:
+        def fetch() -> dict:
+            return asdict(read_raw_file(project, file_path, pinned_ref, start_line, end_line, max_bytes))
+
+        if content_cache is None:
+            return FileContent(**fetch())
+
+        key = file_cache_key(project.id, pinned_ref, file_path, start_line, end_line, max_bytes)
+
+        return FileContent(**content_cache.get_or_fetch(key, fetch))
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def list_projects(
         search: str | None = None,
         owned: bool | None = None,
         membership: bool | None = None,
-    ) -> list[Project]:
+        limit: int = DEFAULT_PAGE_SIZE,
+        page_token: str | None = None,
+        fields: list[str] | None = None,
+        tabular: bool = False,
+    ) -> ProjectPage | ProjectedPage | Table:
         client = get_client(service_client, url)
-        params = {'iterator': True}
+        params = {'pagination': 'keyset', 'order_by': 'id', 'sort': 'asc'}
         if search:
             params['search'] = search
         if owned is not None:
@@ -210,79 +661,202 @@ def register_tools(
         if membership is not None:
             params['membership'] = membership
 
-        projects = client.list_projects(**params)
+        projects, next_page_token = list_page(
+            client.list_projects,
+            params,
+            limit,
+            page_token,
+            lambda cursor, items: {'id_after': items[-1]['id']},
+        )
 
-        return [Project.from_gitlab(p) for p in projects]
+        items = [Project.from_dict(p) for p in projects]
+        if fields or tabular:
+            return project_items(items, Project, fields, tabular, next_page_token)
+
+        return ProjectPage(items=items, next_page_token=next_page_token)
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def get_repository_tree(
         project_id: str,
         path: str | None = None,
         ref: str | None = None,
         recursive: bool = False,
-    ) -> list[TreeItem]:
+        limit: int = DEFAULT_PAGE_SIZE,
+        page_token: str | None = None,
+        fields: list[str] | None = None,
+        tabular: bool = False,
+    ) -> TreePage | ProjectedPage | Table:
         client = get_client(service_client, url)
         project = client.get_project(project_id)
-        params = {'iterator': True, 'recursive': recursive}
-        if path:
-            params['path'] = path
-        if ref:
-            params['ref'] = ref
-
-        items = project.repository_tree(**params)
-
-        return [TreeItem.from_dict(item) for item in items]
+        cursor = decode_page_token(page_token)
+        local = None if 'page_token' in cursor else local_repository(project, ref)
+        if 'path_after' in cursor and local is None:
+            raise InvalidPageToken(f'page_token belongs to a local mirror listing that is unavailable: {page_token}')
+
+        def fetch(tree_ref: str) -> dict:
+            if local is not None:
+                sha = cursor.get('sha', tree_ref)
+                items, next_page_token = mirror_tree_page(
+                    tree_listing(local[0], sha, path, recursive),
+                    sha,
+                    limit,
+                    page_token,
+                )
+            else:
+                params = {'pagination': 'keyset', 'recursive': recursive, 'ref': tree_ref}
+                if path:
+                    params['path'] = path
+                items, next_page_token = keyset_page(
+                    project.manager.gitlab,
+                    f'/projects/{project.encoded_id}/repository/tree',
+                    params,
+                    limit,
+                    page_token,
+                )
+
+            return {'items': items, 'next_page_token': next_page_token}
+
+        if local is not None:
+            page = fetch(local[1])
+        else:
+            page = fetch_pinned(project, pin_ref(project, ref), 'tree', (path, recursive, limit, page_token), fetch)
+
+        items = [TreeItem.from_dict(item) for item in page['items']]
+        if fields or tabular:
+            return project_items(items, TreeItem, fields, tabular, page['next_page_token'])
+
+        return TreePage(items=items, next_page_token=page['next_page_token'])
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def get_file_content(
         project_id: str,
         file_path: str,
         ref: str | None = None,
+        start_line: int | None = None,
+        end_line: int | None = None,
+        max_bytes: int | None = DEFAULT_MAX_FILE_BYTES,
     ) -> FileContent:
+        validate_line_range(start_line, end_line)
         client = get_client(service_client, url)
         project = client.get_project(project_id)
-        file = project.files.get(file_path, ref or project.default_branch)
-
-        return FileContent(
-            file_path=file.file_path,
-            file_name=file.file_name,
-            size=file.size,
-            encoding=file.encoding,
-            content=file.decode().decode('utf-8'),
-            ref=file.ref,
-            last_commit_id=file.last_commit_id,
+        local = local_repository(project, ref)
+        if local is not None:
+            content = read_mirror_file(*local, file_path, start_line, end_line, max_bytes)
+        else:
+            content = read_file(project, file_path, pin_ref(project, ref), start_line, end_line, max_bytes)
+
+        return replace(content, ref=ref or project.default_branch)
+
+    @mcp.tool
+    @run_in_worker
+    @handle_gitlab_errors
+    def get_files(
+        project_id: str,
+        file_paths: list[str],
+        ref: str | None = None,
+        max_bytes: int | None = DEFAULT_MAX_FILE_BYTES,
+    ) -> list[FileResult]:
+        if len(file_paths) > MAX_BATCH_FILES:
+            raise InvalidArgument(f'At most {MAX_BATCH_FILES} files can be fetched per call')
+
+        client = get_client(service_client, url)
+        project = client.get_project(project_id)
+        local = local_repository(project, ref)
+        pinned_ref = None if local is not None else pin_ref(project, ref)
+        ref = ref or project.default_branch
+
+        def fetch(file_path: str) -> FileResult:
+            try:
+                if local is not None:
+                    content = read_mirror_file(*local, file_path, None, None, max_bytes)
+                else:
+                    content = read_file(project, file_path, pinned_ref, None, None, max_bytes)
+            except (gitlab.exceptions.GitlabError, GitError, requests.RequestException) as e:
+                return FileResult(file_path=file_path, error=str(e))
+
+            return FileResult(file_path=file_path, file=replace(content, ref=ref))
+
+        return gather(
+            *(partial(fetch, file_path) for file_path in file_paths),
+            max_concurrency=FILE_BATCH_CONCURRENCY,
         )
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def get_file_blame(
         project_id: str,
         file_path: str,
         ref: str | None = None,
-    ) -> list[BlameEntry]:
+        start_line: int | None = None,
+        end_line: int | None = None,
+        compact: bool = False,
+    ) -> list[BlameEntry] | CompactBlame:
+        validate_line_range(start_line, end_line)
         client = get_client(service_client, url)
         project = client.get_project(project_id)
-        blame = project.files.blame(file_path, ref or project.default_branch)
+        blame_range = None if end_line is None else (start_line or 1, end_line)
+
+        def fetch(blame_ref: str) -> list[dict]:
+            if blame_range is None:
+                return project.files.blame(file_path, blame_ref)
+
+            return project.files.blame(
+                file_path,
+                blame_ref,
+                query_parameters={'range[start]': blame_range[0], 'range[end]': blame_range[1]},
+            )
+
+        local = local_repository(project, ref)
+        if local is not None:
+            blame = local_blame(*local, file_path, start_line, end_line)
+        else:
+            blame = fetch_pinned(project, pin_ref(project, ref), 'blame', (file_path, blame_range), fetch)
+            if start_line is not None and end_line is None:
+                blame = trim_blame(blame, start_line)
+
+        if compact:
+            return CompactBlame.from_blame(blame, start_line or 1)
 
         return [
             BlameEntry(
-                commit=BlameCommit(**entry['commit']),
+                commit=BlameCommit.from_dict(entry['commit']),
                 lines=entry['lines'],
             )
             for entry in blame
         ]
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def search_code(
         project_id: str,
         query: str,
         ref: str | None = None,
+        regex: bool = False,
     ) -> list[CodeSearchResult]:
         client = get_client(service_client, url)
         project = client.get_project(project_id)
+        local = local_repository(project, ref)
+        matches = None
+        if search_indexes is not None:
+            matches = index_search(project, ref, local, query, regex)
+        if matches is None and regex:
+            raise InvalidArgument('Regex search requires the search index')
+        if matches is None and local is not None:
+            repository, sha = local
+            matches = repository.grep(sha, query, SEARCH_RESULT_LIMIT)
+
+        if matches is not None:
+            return [
+                CodeSearchResult.from_match(project.id, ref or project.default_branch, path, line_no, text)
+                for path, line_no, text in matches
+            ]
+
         params = {'scope': 'blobs', 'search': query}
         if ref:
             params['ref'] = ref
@@ -292,44 +866,70 @@ def register_tools(
         return [CodeSearchResult.from_dict(r) for r in results]
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def list_branches(
         project_id: str,
         search: str | None = None,
-    ) -> list[Branch]:
+        limit: int = DEFAULT_PAGE_SIZE,
+        page_token: str | None = None,
+        fields: list[str] | None = None,
+        tabular: bool = False,
+    ) -> BranchPage | ProjectedPage | Table:
         client = get_client(service_client, url)
         project = client.get_project(project_id)
-        params = {'iterator': True}
+        params = {}
         if search:
             params['search'] = search
 
-        branches = project.branches.list(**params)
+        branches, next_page_token = list_page(project.branches.list, params, limit, page_token)
 
-        return [Branch.from_gitlab(b) for b in branches]
+        items = [Branch.from_gitlab(b) for b in branches]
+        if fields or tabular:
+            return project_items(items, Branch, fields, tabular, next_page_token)
+
+        return BranchPage(items=items, next_page_token=next_page_token)
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def list_commits(
         project_id: str,
         ref_name: str | None = None,
         since: str | None = None,
         until: str | None = None,
-    ) -> list[CommitListItem]:
+        limit: int = DEFAULT_PAGE_SIZE,
+        page_token: str | None = None,
+        fields: list[str] | None = None,
+        tabular: bool = False,
+    ) -> CommitPage | ProjectedPage | Table:
         client = get_client(service_client, url)
         project = client.get_project(project_id)
-        params = {'iterator': True}
-        if ref_name:
-            params['ref_name'] = ref_name
+        params = {}
         if since:
             params['since'] = since
         if until:
             params['until'] = until
 
-        commits = project.commits.list(**params)
+        local = local_repository(project, ref_name)
+        if local is not None:
+            repository, sha = local
+            commits, next_page_token = list_page(partial(repository.commits, sha), params, limit, page_token)
+            web_url = f'{url.rstrip("/")}/{project.path_with_namespace}/-/commit'
+            items = [CommitListItem(**c, web_url=f'{web_url}/{c["id"]}') for c in commits]
+        else:
+            if ref_name:
+                params['ref_name'] = ref_name
+            commits, next_page_token = list_page(project.commits.list, params, limit, page_token)
+            items = [CommitListItem.from_gitlab(c) for c in commits]
+
+        if fields or tabular:
+            return project_items(items, CommitListItem, fields, tabular, next_page_token)
 
-        return [CommitListItem.from_gitlab(c) for c in commits]
+        return CommitPage(items=items, next_page_token=next_page_token)
 
     @mcp.tool
+    @run_in_worker
     @handle_gitlab_errors
     def get_commit(
         project_id: str,
@@ -337,6 +937,12 @@ def register_tools(
     ) -> CommitDetails:
         client = get_client(service_client, url)
         project = client.get_project(project_id)
-        commit = project.commits.get(sha)
+        if content_cache is None or not is_commit_sha(sha):
+            return CommitDetails.from_gitlab(project.commits.get(sha))
+
+        commit = content_cache.get_or_fetch(
+            ('commit', project.id, sha),
+            lambda: asdict(CommitDetails.from_gitlab(project.commits.get(sha))),
+        )
 
-        return CommitDetails.from_gitlab(commit)
+        return CommitDetails(**commit)
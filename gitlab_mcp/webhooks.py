@@ -0,0 +1,70 @@
+import asyncio
+import hmac
+import logging
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from gitlab_mcp.client import ProjectInfo
+from gitlab_mcp.content_cache import ContentCache
+from gitlab_mcp.metrics import record_webhook_event
+from gitlab_mcp.mirror import RepositoryMirror
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_PATH = '/webhooks/gitlab'
+WEBHOOK_KINDS = frozenset({'push', 'tag_push', 'merge_request', 'note', 'pipeline'})
+REF_PREFIXES = ('refs/heads/', 'refs/tags/')
+MIRRORED_KINDS = frozenset({'push', 'tag_push', 'merge_request'})
+
+
+def ref_name(ref: str) -> str:
+    for prefix in REF_PREFIXES:
+        if ref.startswith(prefix):
+            return ref[len(prefix):]
+
+    return ref
+
+
+class WebhookHandler:
+    def __init__(
+        self,
+        secret: str,
+        content_cache: ContentCache | None = None,
+        mirror: RepositoryMirror | None = None,
+    ):
+        self._secret = secret
+        self._content_cache = content_cache
+        self._mirror = mirror
+
+    async def endpoint(self, request: Request) -> Response:
+        if not hmac.compare_digest(request.headers.get('X-Gitlab-Token', '').encode(), self._secret.encode()):
+            return Response('Invalid webhook token', status_code=401)
+
+        try:
+            payload = await request.json()
+        except ValueError:
+            return Response('Invalid webhook payload', status_code=400)
+        if not isinstance(payload, dict):
+            return Response('Invalid webhook payload', status_code=400)
+
+        await asyncio.to_thread(self.handle, payload)
+
+        return Response(status_code=204)
+
+    def handle(self, payload: dict) -> None:
+        kind = payload.get('object_kind')
+        record_webhook_event(kind if kind in WEBHOOK_KINDS else 'other')
+        project = payload.get('project')
+        if not isinstance(project, dict) or 'id' not in project:
+            logger.debug('Ignoring %s webhook without a project', kind)
+            return
+
+        if kind in ('push', 'tag_push') and self._content_cache is not None:
+            self._content_cache.update_ref(project['id'], ref_name(payload['ref']), payload.get('checkout_sha'))
+        if kind in MIRRORED_KINDS and self._mirror is not None:
+            self._mirror.invalidate(ProjectInfo(
+                id=project['id'],
+                path_with_namespace=project['path_with_namespace'],
+                default_branch=project.get('default_branch'),
+            ))
@@ -0,0 +1,32 @@
+import subprocess
+from pathlib import Path
+
+GIT_IDENTITY = ('-c', 'user.name=Reviewer', '-c', 'user.email=reviewer@example.com')
+
+
+def git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(['git', *GIT_IDENTITY, *args], cwd=cwd, capture_output=True, check=True)
+
+    return result.stdout.decode().strip()
+
+
+class GitRemote:
+    def __init__(self, root: Path, path_with_namespace: str):
+        self.url = root.as_uri()
+        self.bare = root / f'{path_with_namespace}.git'
+        self.work = root / 'work' / path_with_namespace
+        self.bare.mkdir(parents=True)
+        self.work.mkdir(parents=True)
+        git(self.bare, 'init', '--quiet', '--bare', '--initial-branch=main')
+        git(self.work, 'init', '--quiet', '--initial-branch=main')
+
+    def commit(self, files: dict[str, str], message: str) -> str:
+        for name, content in files.items():
+            path = self.work / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        git(self.work, 'add', '--all')
+        git(self.work, 'commit', '--quiet', '--message', message)
+        git(self.work, 'push', '--quiet', str(self.bare), 'HEAD:main')
+
+        return git(self.work, 'rev-parse', 'HEAD')
@@ -0,0 +1,261 @@
+import io
+import json
+import tarfile
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+API_PREFIX = '/api/v4'
+
+USER = {'id': 7, 'username': 'reviewer', 'name': 'Reviewer'}
+
+PROJECT = {
+    'id': 1,
+    'name': 'test-project',
+    'path_with_namespace': 'group/test-project',
+    'default_branch': 'main',
+    'web_url': 'https://gitlab.example.com/group/test-project',
+    'description': 'Test project',
+}
+
+MERGE_REQUEST = {
+    'id': 101,
+    'iid': 1,
+    'project_id': 1,
+    'title': 'Test MR',
+    'description': 'Test description',
+    'state': 'opened',
+    'draft': False,
+    'work_in_progress': False,
+    'author': USER,
+    'source_branch': 'feature',
+    'target_branch': 'main',
+    'web_url': 'https://gitlab.example.com/group/test-project/-/merge_requests/1',
+    'created_at': '2024-01-01T00:00:00Z',
+    'updated_at': '2024-01-01T00:00:00Z',
+    'user_notes_count': 1,
+    'merged_by': None,
+    'merged_at': None,
+    'labels': [],
+    'milestone': None,
+    'assignees': [],
+    'reviewers': [USER],
+    'has_conflicts': False,
+    'blocking_discussions_resolved': True,
+    'diff_refs': {'base_sha': 'a' * 40, 'head_sha': 'b' * 40, 'start_sha': 'a' * 40},
+}
+
+COMMIT = {
+    'id': 'b' * 40,
+    'short_id': 'bbbbbbbb',
+    'title': 'Add feature',
+    'message': 'Add feature\n',
+    'author_name': 'Reviewer',
+    'author_email': 'reviewer@example.com',
+    'authored_date': '2024-01-01T00:00:00Z',
+    'committer_name': 'Reviewer',
+    'committed_date': '2024-01-01T00:00:00Z',
+    'web_url': 'https://gitlab.example.com/group/test-project/-/commit/' + 'b' * 40,
+    'parent_ids': ['a' * 40],
+}
+
+PIPELINE = {
+    'id': 55,
+    'sha': 'b' * 40,
+    'ref': 'feature',
+    'status': 'success',
+    'web_url': 'https://gitlab.example.com/group/test-project/-/pipelines/55',
+    'created_at': '2024-01-01T00:00:00Z',
+    'updated_at': '2024-01-01T00:00:00Z',
+}
+
+NOTE = {
+    'id': 9,
+    'body': 'Looks good',
+    'author': USER,
+    'created_at': '2024-01-01T00:00:00Z',
+    'updated_at': '2024-01-01T00:00:00Z',
+    'system': False,
+    'resolvable': True,
+    'resolved': False,
+}
+
+DISCUSSION = {'id': 'disc1', 'individual_note': False, 'notes': [NOTE]}
+
+DIFF = {
+    'old_path': 'app.py',
+    'new_path': 'app.py',
+    'a_mode': '100644',
+    'b_mode': '100644',
+    'new_file': False,
+    'renamed_file': False,
+    'deleted_file': False,
+    'diff': '@@ -1 +1 @@\n-old\n+new\n',
+}
+
+MR_PATH = '/projects/1/merge_requests/1'
+
+ROUTES = {
+    ('GET', '/user'): {'id': 7, 'username': 'reviewer'},
+    ('GET', '/projects/1'): PROJECT,
+    ('GET', '/projects/group%2Ftest-project'): PROJECT,
+    ('GET', MR_PATH): MERGE_REQUEST,
+    ('GET', f'{MR_PATH}/commits'): [COMMIT],
+    ('GET', f'{MR_PATH}/pipelines'): [PIPELINE],
+    ('GET', f'{MR_PATH}/discussions'): [DISCUSSION],
+    ('GET', f'{MR_PATH}/diffs'): [DIFF],
+    ('GET', f'{MR_PATH}/approvals'): {'approved_by': [{'user': USER}]},
+    ('GET', f'{MR_PATH}/award_emoji'): [],
+    ('POST', f'{MR_PATH}/discussions'): DISCUSSION,
+    ('POST', f'{MR_PATH}/notes'): NOTE,
+    ('POST', f'{MR_PATH}/approve'): {'approved_by': [{'user': USER}]},
+    ('POST', f'{MR_PATH}/unapprove'): {},
+    ('PUT', f'{MR_PATH}/merge'): {**MERGE_REQUEST, 'state': 'merged'},
+}
+
+
+@dataclass
+class StubResponse:
+    body: Any
+    status: int = 200
+    headers: dict[str, str] = field(default_factory=dict)
+    next_query: dict | None = None
+
+
+def paginate(items: list, query: dict[str, str]) -> StubResponse:
+    page = int(query.get('page', 1))
+    per_page = int(query.get('per_page', 20))
+    start = (page - 1) * per_page
+    has_next = start + per_page < len(items)
+
+    return StubResponse(
+        items[start:start + per_page],
+        headers={'X-Page': str(page), 'X-Per-Page': str(per_page), 'X-Total': str(len(items))},
+        next_query={**query, 'page': page + 1} if has_next else None,
+    )
+
+
+def paginate_keyset(items: list[dict], query: dict[str, str]) -> StubResponse:
+    id_after = int(query.get('id_after', 0))
+    per_page = int(query.get('per_page', 20))
+    remaining = [item for item in items if item['id'] > id_after]
+    page = remaining[:per_page]
+    has_next = len(remaining) > per_page
+
+    return StubResponse(page, next_query={**query, 'id_after': page[-1]['id']} if has_next else None)
+
+
+def make_tar(files: list[tuple[str, bytes]], compression: str = '') -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode=f'w:{compression}') as archive:
+        for name, data in files:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+    return buffer.getvalue()
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        pass
+
+
+class GitLabStub:
+    def __init__(self, routes: dict | None = None, latency: float = 0.0):
+        self.routes = dict(ROUTES if routes is None else routes)
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._server = StubServer(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.01,), daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+
+        return f'http://{host}:{port}'
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.bytes_sent = 0
+
+    def __enter__(self) -> 'GitLabStub':
+        self._thread.start()
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _record(self, method: str, path: str, size: int) -> None:
+        with self._lock:
+            self.calls[(method, path)] += 1
+            self.bytes_sent += size
+
+    def _resolve(self, method: str, path: str, query: dict[str, str]) -> StubResponse:
+        route = self.routes.get((method, path))
+        if route is None:
+            return StubResponse({'message': '404 Not Found'}, status=404)
+        if callable(route):
+            route = route(query)
+
+        return route if isinstance(route, StubResponse) else StubResponse(route)
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def _respond(self) -> None:
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
+
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                url = urlsplit(self.path)
+                path = url.path.removeprefix(API_PREFIX)
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                response = stub._resolve(self.command, path, query)
+                if isinstance(response.body, bytes):
+                    data = response.body
+                    content_type = 'application/octet-stream'
+                else:
+                    data = json.dumps(response.body).encode()
+                    content_type = 'application/json'
+                stub._record(self.command, path, len(data))
+
+                self.send_response(response.status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                if response.next_query is not None:
+                    next_url = f'http://{self.headers["Host"]}{url.path}?{urlencode(response.next_query)}'
+                    self.send_header('Link', f'<{next_url}>; rel="next"')
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+        return Handler
@@ -0,0 +1,139 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+from fastmcp.server.auth import AccessToken
+from fastmcp.server.auth.providers.introspection import IntrospectionTokenVerifier
+from key_value.aio.wrappers.encryption import FernetEncryptionWrapper
+
+from gitlab_mcp.auth import CachingIntrospectionTokenVerifier, create_oauth_proxy
+from gitlab_mcp.config import Config, Secrets
+from gitlab_mcp.store import SQLiteStore
+
+
+def make_verifier(**kwargs) -> CachingIntrospectionTokenVerifier:
+    return CachingIntrospectionTokenVerifier(
+        introspection_url='https://gitlab.example.com/oauth/introspect',
+        client_id='client-id',
+        client_secret='client-secret',
+        **kwargs,
+    )
+
+
+def make_access_token(expires_at: int | None = None) -> AccessToken:
+    return AccessToken(token='user-token', client_id='client-id', scopes=['api'], expires_at=expires_at)
+
+
+@patch.object(IntrospectionTokenVerifier, 'verify_token', new_callable=AsyncMock)
+def test_verifier_caches_valid_token(mock_verify_token):
+    mock_verify_token.return_value = make_access_token(int(time.time()) + 3600)
+    verifier = make_verifier()
+
+    async def verify_twice():
+        return await verifier.verify_token('user-token'), await verifier.verify_token('user-token')
+
+    first, second = asyncio.run(verify_twice())
+
+    assert first is second
+    mock_verify_token.assert_awaited_once_with('user-token')
+
+
+@patch.object(IntrospectionTokenVerifier, 'verify_token', new_callable=AsyncMock)
+def test_verifier_cache_capped_by_token_expiry(mock_verify_token):
+    mock_verify_token.return_value = make_access_token(int(time.time()) - 1)
+    verifier = make_verifier()
+
+    async def verify_twice():
+        await verifier.verify_token('user-token')
+        await verifier.verify_token('user-token')
+
+    asyncio.run(verify_twice())
+
+    assert mock_verify_token.await_count == 2
+
+
+@patch.object(IntrospectionTokenVerifier, 'verify_token', new_callable=AsyncMock)
+def test_verifier_negative_cache(mock_verify_token):
+    mock_verify_token.return_value = None
+    verifier = make_verifier(negative_cache_ttl=5)
+
+    async def verify_twice():
+        return await verifier.verify_token('bad-token'), await verifier.verify_token('bad-token')
+
+    assert asyncio.run(verify_twice()) == (None, None)
+    mock_verify_token.assert_awaited_once()
+
+
+@patch.object(IntrospectionTokenVerifier, 'verify_token', new_callable=AsyncMock)
+def test_verifier_coalesces_concurrent_introspections(mock_verify_token):
+    async def slow_verify(token):
+        await asyncio.sleep(0.01)
+        return make_access_token()
+
+    mock_verify_token.side_effect = slow_verify
+    verifier = make_verifier()
+
+    async def verify_concurrently():
+        return await asyncio.gather(*(verifier.verify_token('user-token') for _ in range(5)))
+
+    results = asyncio.run(verify_concurrently())
+
+    assert all(r is results[0] for r in results)
+    mock_verify_token.assert_awaited_once()
+
+
+def test_create_oauth_proxy_uses_caching_verifier():
+    config = Config(
+        url='https://gitlab.example.com',
+        secrets=Secrets('id', 'secret', 'token'),
+        server_bind_url='http://0.0.0.0:8080',
+        server_advertised_url='https://mcp.example.com:443',
+        ssl_cert_path=None,
+        ssl_key_path=None,
+    )
+
+    proxy = create_oauth_proxy(config)
+
+    assert isinstance(proxy._token_validator, CachingIntrospectionTokenVerifier)
+
+
+@patch.object(IntrospectionTokenVerifier, 'verify_token', new_callable=AsyncMock)
+def test_verifier_shares_verdicts_through_store(mock_verify_token, tmp_path):
+    mock_verify_token.return_value = make_access_token(int(time.time()) + 3600)
+    first = make_verifier(shared_store=SQLiteStore(tmp_path / 'state.db'))
+    second = make_verifier(shared_store=SQLiteStore(tmp_path / 'state.db'))
+
+    asyncio.run(first.verify_token('user-token'))
+    result = asyncio.run(second.verify_token('user-token'))
+
+    assert result == mock_verify_token.return_value
+    mock_verify_token.assert_awaited_once()
+
+
+@patch.object(IntrospectionTokenVerifier, 'verify_token', new_callable=AsyncMock)
+def test_verifier_shares_negative_verdicts_through_store(mock_verify_token, tmp_path):
+    mock_verify_token.return_value = None
+    first = make_verifier(shared_store=SQLiteStore(tmp_path / 'state.db'))
+    second = make_verifier(shared_store=SQLiteStore(tmp_path / 'state.db'))
+
+    asyncio.run(first.verify_token('bad-token'))
+
+    assert asyncio.run(second.verify_token('bad-token')) is None
+    mock_verify_token.assert_awaited_once()
+
+
+def test_create_oauth_proxy_uses_state_dir(tmp_path):
+    config = Config(
+        url='https://gitlab.example.com',
+        secrets=Secrets('id', 'secret', 'token'),
+        server_bind_url='http://0.0.0.0:8080',
+        server_advertised_url='https://mcp.example.com:443',
+        ssl_cert_path=None,
+        ssl_key_path=None,
+        state_dir=tmp_path,
+    )
+
+    proxy = create_oauth_proxy(config)
+
+    assert isinstance(proxy._client_storage, FernetEncryptionWrapper)
+    assert (tmp_path / 'oauth-proxy').is_dir()
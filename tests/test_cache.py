@@ -0,0 +1,119 @@
+from unittest.mock import patch
+
+from gitlab_mcp.cache import ByteBudgetCache, TTLCache
+
+
+def test_ttl_cache_get_set():
+    cache = TTLCache(max_size=2, ttl=60)
+
+    cache.set('a', 1)
+
+    assert cache.get('a') == 1
+    assert cache.get('missing') is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+@patch('gitlab_mcp.cache.time.time')
+def test_ttl_cache_expires_entries(mock_time):
+    mock_time.return_value = 1000
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2, ttl=10)
+
+    mock_time.return_value = 1030
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert len(cache) == 1
+
+
+def test_ttl_cache_entry_ttl_capped_by_default():
+    cache = TTLCache(max_size=2, ttl=60)
+
+    with patch('gitlab_mcp.cache.time.time', return_value=1000):
+        cache.set('a', 1, ttl=3600)
+
+    with patch('gitlab_mcp.cache.time.time', return_value=1061):
+        assert cache.get('a') is None
+
+
+def test_ttl_cache_get_or_set():
+    cache = TTLCache(max_size=2, ttl=60)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return object()
+
+    first = cache.get_or_set('a', factory)
+    second = cache.get_or_set('a', factory)
+
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_ttl_cache_non_positive_ttl_not_stored():
+    cache = TTLCache(max_size=2, ttl=60)
+
+    value = cache.get_or_set('a', lambda: 1, ttl=0)
+
+    assert value == 1
+    assert cache.get('a') is None
+
+
+def test_ttl_cache_pop_and_clear():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    assert cache.pop('a') == 1
+    assert cache.pop('a') is None
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_byte_budget_cache_evicts_to_budget():
+    cache = ByteBudgetCache(max_bytes=10)
+    cache.set('a', 'a', 4)
+    cache.set('b', 'b', 4)
+    cache.get('a')
+
+    cache.set('c', 'c', 4)
+
+    assert cache.get('a') == 'a'
+    assert cache.get('b') is None
+    assert cache.get('c') == 'c'
+    assert cache.total_bytes == 8
+
+
+def test_byte_budget_cache_skips_oversized_values():
+    cache = ByteBudgetCache(max_bytes=10)
+
+    cache.set('a', 'a', 11)
+
+    assert cache.get('a') is None
+    assert cache.total_bytes == 0
+
+
+def test_byte_budget_cache_replace_and_pop():
+    cache = ByteBudgetCache(max_bytes=10)
+    cache.set('a', 'a', 4)
+    cache.set('a', 'b', 6)
+
+    assert cache.total_bytes == 6
+    assert cache.pop('a') == 'b'
+    assert cache.total_bytes == 0
@@ -1,9 +1,17 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import gitlab.exceptions
 
-from gitlab_mcp.client import CompositeGitLabClient, PermissionDenied, ProjectNotFound, TokenGitLabClient
+from gitlab_mcp.client import (
+    ClientPool,
+    CompositeGitLabClient,
+    PermissionDenied,
+    ProjectInfo,
+    ProjectNotFound,
+    TokenGitLabClient,
+)
+from tests.gitlab_stub import PROJECT, GitLabStub, paginate_keyset
 
 
 @patch('gitlab_mcp.client.gitlab.Gitlab')
@@ -17,6 +25,7 @@ def test_token_client_init(mock_gitlab_class):
         url='https://gitlab.example.com',
         private_token='test-token',
         ssl_verify=True,
+        session=ANY,
     )
 
 
@@ -38,6 +47,54 @@ def test_composite_client_get_project_success(mock_oauth_client_class):
     assert result == mock_project
 
 
+@patch('gitlab_mcp.client.OAuthGitLabClient')
+def test_composite_client_get_project_cached(mock_oauth_client_class):
+    mock_service_client = MagicMock()
+    mock_project = MagicMock()
+    mock_project.id = 1
+    mock_project.path_with_namespace = 'group/test-project'
+    mock_project.default_branch = 'main'
+    mock_service_client.get_project.return_value = mock_project
+
+    client = CompositeGitLabClient(
+        'user_token',
+        mock_service_client,
+        'https://gitlab.example.com',
+    )
+
+    client.get_project('group/test-project')
+    by_path = client.get_project('group/test-project')
+    by_id = client.get_project(1)
+
+    mock_service_client.get_project.assert_called_once_with('group/test-project')
+    info = ProjectInfo(id=1, path_with_namespace='group/test-project', default_branch='main')
+    mock_service_client.get_lazy_project.assert_called_with(info)
+    assert mock_service_client.get_lazy_project.call_count == 2
+    assert by_path == mock_service_client.get_lazy_project.return_value
+    assert by_id == mock_service_client.get_lazy_project.return_value
+
+
+@patch('gitlab_mcp.client.OAuthGitLabClient')
+def test_composite_client_denied_project_not_cached(mock_oauth_client_class):
+    mock_service_client = MagicMock()
+    mock_service_client.get_project.side_effect = gitlab.exceptions.GitlabGetError(
+        error_message='Forbidden', response_code=403
+    )
+
+    client = CompositeGitLabClient(
+        'user_token',
+        mock_service_client,
+        'https://gitlab.example.com',
+    )
+
+    for _ in range(2):
+        with pytest.raises(PermissionDenied):
+            client.get_project('1')
+
+    assert mock_service_client.get_project.call_count == 2
+    mock_service_client.get_lazy_project.assert_not_called()
+
+
 @patch('gitlab_mcp.client.OAuthGitLabClient')
 def test_composite_client_service_denied(mock_oauth_client_class):
     mock_service_client = MagicMock()
@@ -96,6 +153,11 @@ def test_composite_client_get_user_project(mock_oauth_client_class):
     mock_user_client.get_project.assert_called_once_with('1')
     assert result == mock_project
 
+    cached = client.get_user_project('1')
+
+    mock_user_client.get_project.assert_called_once()
+    assert cached == mock_user_client.get_lazy_project.return_value
+
 
 @patch('gitlab_mcp.client.OAuthGitLabClient')
 def test_composite_client_get_user_project_denied(mock_oauth_client_class):
@@ -152,3 +214,86 @@ def test_composite_client_list_projects(mock_oauth_client_class):
 
     mock_service_client.list_projects.assert_called_once()
     assert len(result) == 1
+
+
+@patch('gitlab_mcp.client.OAuthGitLabClient')
+def test_composite_client_resolves_user_id_once(mock_oauth_client_class):
+    mock_oauth_client_class.return_value.get_user_id.return_value = 7
+    client = CompositeGitLabClient('user_token', MagicMock(), 'https://gitlab.example.com')
+
+    assert client.get_user_id() == 7
+    assert client.get_user_id() == 7
+    mock_oauth_client_class.return_value.get_user_id.assert_called_once()
+
+
+@patch('gitlab_mcp.client.OAuthGitLabClient')
+def test_client_pool_reuses_client_for_same_token(mock_oauth_client_class):
+    pool = ClientPool(max_size=10, ttl=60)
+    mock_service_client = MagicMock()
+
+    first = pool.get('user_token', mock_service_client, 'https://gitlab.example.com')
+    second = pool.get('user_token', mock_service_client, 'https://gitlab.example.com')
+
+    assert first is second
+    mock_oauth_client_class.assert_called_once_with(
+        'https://gitlab.example.com', 'user_token', mock_service_client.response_cache
+    )
+
+
+@patch('gitlab_mcp.client.OAuthGitLabClient')
+def test_client_pool_separates_tokens(mock_oauth_client_class):
+    pool = ClientPool(max_size=10, ttl=60)
+    mock_service_client = MagicMock()
+
+    first = pool.get('token_a', mock_service_client, 'https://gitlab.example.com')
+    second = pool.get('token_b', mock_service_client, 'https://gitlab.example.com')
+
+    assert first is not second
+
+
+@patch('gitlab_mcp.client.OAuthGitLabClient')
+def test_client_pool_does_not_reuse_expired_token(mock_oauth_client_class):
+    pool = ClientPool(max_size=10, ttl=60)
+    mock_service_client = MagicMock()
+
+    with patch('time.time', return_value=1000):
+        first = pool.get('user_token', mock_service_client, 'https://gitlab.example.com', expires_at=1010)
+
+    with patch('time.time', return_value=1011):
+        second = pool.get('user_token', mock_service_client, 'https://gitlab.example.com', expires_at=1010)
+
+    assert first is not second
+
+
+def test_token_client_get_lazy_project():
+    client = TokenGitLabClient('https://gitlab.example.com', 'test-token')
+
+    project = client.get_lazy_project(
+        ProjectInfo(id=5, path_with_namespace='group/test-project', default_branch='main')
+    )
+
+    assert project.id == 5
+    assert project.default_branch == 'main'
+    assert project.files.path == '/projects/5/repository/files'
+
+
+def test_token_client_list_projects_returns_raw_pages():
+    projects = [{**PROJECT, 'id': i} for i in range(1, 4)]
+    with GitLabStub({('GET', '/projects'): lambda query: paginate_keyset(projects, query)}) as stub:
+        client = TokenGitLabClient(stub.url, 'test-token')
+
+        page = client.list_projects(pagination='keyset', id_after=1, per_page=1, get_all=False)
+
+    assert page == [projects[1]]
+
+
+@patch('gitlab_mcp.client.OAuthGitLabClient')
+def test_client_pool_shares_project_cache(mock_oauth_client_class):
+    pool = ClientPool(max_size=10, ttl=60)
+    mock_service_client = MagicMock()
+    mock_service_client.get_project.return_value = MagicMock(id=1)
+
+    pool.get('token_a', mock_service_client, 'https://gitlab.example.com').get_project('1')
+    pool.get('token_b', mock_service_client, 'https://gitlab.example.com').get_project('1')
+
+    mock_service_client.get_project.assert_called_once_with('1')
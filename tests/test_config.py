@@ -19,6 +19,19 @@ def test_secrets_from_file(tmp_path):
     assert secrets.oauth_client_id == 'test-client-id'
     assert secrets.oauth_client_secret == 'test-client-secret'
     assert secrets.service_token == 'test-service-token'
+    assert secrets.webhook_secret is None
+
+
+def test_secrets_from_file_webhook_secret(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+        'webhook_secret': 'test-webhook-secret',
+    }))
+
+    assert Secrets.from_file(secrets_file).webhook_secret == 'test-webhook-secret'
 
 
 def test_secrets_from_file_missing_field(tmp_path):
@@ -277,3 +290,266 @@ def test_config_from_env_http_advertised_url_logs_warning(tmp_path, caplog):
             Config.from_env()
 
         assert 'MCP_SERVER_ADVERTISED_URL uses http' in caplog.text
+
+
+def test_config_from_env_response_cache_bytes(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+    }))
+
+    with patch.dict('os.environ', {
+        'GITLAB_URL': 'https://gitlab.example.com',
+        'GITLAB_SECRETS_PATH': str(secrets_file),
+        'MCP_SERVER_BIND_URL': 'http://0.0.0.0:8080',
+        'MCP_SERVER_ADVERTISED_URL': 'https://mcp.example.com:443',
+        'GITLAB_RESPONSE_CACHE_BYTES': '1024',
+    }, clear=True):
+        config = Config.from_env()
+
+        assert config.response_cache_bytes == 1024
+
+
+def test_config_from_env_invalid_response_cache_bytes(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+    }))
+
+    with patch.dict('os.environ', {
+        'GITLAB_URL': 'https://gitlab.example.com',
+        'GITLAB_SECRETS_PATH': str(secrets_file),
+        'MCP_SERVER_BIND_URL': 'http://0.0.0.0:8080',
+        'MCP_SERVER_ADVERTISED_URL': 'https://mcp.example.com:443',
+        'GITLAB_RESPONSE_CACHE_BYTES': 'lots',
+    }, clear=True):
+        with pytest.raises(ValueError, match='GITLAB_RESPONSE_CACHE_BYTES must be an integer'):
+            Config.from_env()
+
+
+def test_config_from_env_server_workers_and_state_dir(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+    }))
+
+    with patch.dict('os.environ', {
+        'GITLAB_URL': 'https://gitlab.example.com',
+        'GITLAB_SECRETS_PATH': str(secrets_file),
+        'MCP_SERVER_BIND_URL': 'http://0.0.0.0:8080',
+        'MCP_SERVER_ADVERTISED_URL': 'https://mcp.example.com:443',
+        'MCP_SERVER_WORKERS': '4',
+        'MCP_WORKER_THREADS': '16',
+        'MCP_FANOUT_THREADS': '8',
+        'MCP_STATE_DIR': str(tmp_path / 'state'),
+    }, clear=True):
+        config = Config.from_env()
+
+        assert config.server_workers == 4
+        assert config.worker_threads == 16
+        assert config.fanout_threads == 8
+        assert config.state_dir == tmp_path / 'state'
+
+
+def test_config_from_env_invalid_server_workers(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+    }))
+
+    with patch.dict('os.environ', {
+        'GITLAB_URL': 'https://gitlab.example.com',
+        'GITLAB_SECRETS_PATH': str(secrets_file),
+        'MCP_SERVER_BIND_URL': 'http://0.0.0.0:8080',
+        'MCP_SERVER_ADVERTISED_URL': 'https://mcp.example.com:443',
+        'MCP_SERVER_WORKERS': '0',
+    }, clear=True):
+        with pytest.raises(ValueError, match='MCP_SERVER_WORKERS must be at least 1'):
+            Config.from_env()
+
+
+def test_config_from_env_invalid_worker_threads(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+    }))
+
+    with patch.dict('os.environ', {
+        'GITLAB_URL': 'https://gitlab.example.com',
+        'GITLAB_SECRETS_PATH': str(secrets_file),
+        'MCP_SERVER_BIND_URL': 'http://0.0.0.0:8080',
+        'MCP_SERVER_ADVERTISED_URL': 'https://mcp.example.com:443',
+        'MCP_FANOUT_THREADS': '0',
+    }, clear=True):
+        with pytest.raises(ValueError, match='MCP_FANOUT_THREADS must be at least 1'):
+            Config.from_env()
+
+
+def test_config_from_env_rate_limit(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+    }))
+
+    with patch.dict('os.environ', {
+        'GITLAB_URL': 'https://gitlab.example.com',
+        'GITLAB_SECRETS_PATH': str(secrets_file),
+        'MCP_SERVER_BIND_URL': 'http://0.0.0.0:8080',
+        'MCP_SERVER_ADVERTISED_URL': 'https://mcp.example.com:443',
+        'GITLAB_RATE_LIMIT_RPS': '5',
+        'GITLAB_RATE_LIMIT_BURST': '15',
+    }, clear=True):
+        config = Config.from_env()
+
+        assert config.rate_limit_rps == 5
+        assert config.rate_limit_burst == 15
+
+
+def test_config_from_env_mirror(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+    }))
+
+    with patch.dict('os.environ', {
+        'GITLAB_URL': 'https://gitlab.example.com',
+        'GITLAB_SECRETS_PATH': str(secrets_file),
+        'MCP_SERVER_BIND_URL': 'http://0.0.0.0:8080',
+        'MCP_SERVER_ADVERTISED_URL': 'https://mcp.example.com:443',
+        'GITLAB_MIRROR_PROJECTS': 'group/app, 42,',
+        'GITLAB_MIRROR_DIR': str(tmp_path / 'mirrors'),
+        'GITLAB_MIRROR_FETCH_INTERVAL': '300',
+    }, clear=True):
+        config = Config.from_env()
+
+        assert config.mirror_projects == ('group/app', '42')
+        assert config.mirror_dir == tmp_path / 'mirrors'
+        assert config.mirror_fetch_interval == 300
+
+
+def test_config_from_env_mirror_requires_directory(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+    }))
+
+    with patch.dict('os.environ', {
+        'GITLAB_URL': 'https://gitlab.example.com',
+        'GITLAB_SECRETS_PATH': str(secrets_file),
+        'MCP_SERVER_BIND_URL': 'http://0.0.0.0:8080',
+        'MCP_SERVER_ADVERTISED_URL': 'https://mcp.example.com:443',
+        'GITLAB_MIRROR_PROJECTS': 'group/app',
+    }, clear=True):
+        with pytest.raises(ValueError, match='GITLAB_MIRROR_PROJECTS requires'):
+            Config.from_env()
+
+
+def test_config_from_env_search_index(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+    }))
+
+    with patch.dict('os.environ', {
+        'GITLAB_URL': 'https://gitlab.example.com',
+        'GITLAB_SECRETS_PATH': str(secrets_file),
+        'MCP_SERVER_BIND_URL': 'http://0.0.0.0:8080',
+        'MCP_SERVER_ADVERTISED_URL': 'https://mcp.example.com:443',
+        'GITLAB_SEARCH_INDEX_BYTES': '1048576',
+    }, clear=True):
+        config = Config.from_env()
+
+        assert config.search_index_bytes == 1048576
+
+
+def test_config_from_env_prefetch(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+    }))
+    env = {
+        'GITLAB_URL': 'https://gitlab.example.com',
+        'GITLAB_SECRETS_PATH': str(secrets_file),
+        'MCP_SERVER_BIND_URL': 'http://0.0.0.0:8080',
+        'MCP_SERVER_ADVERTISED_URL': 'https://mcp.example.com:443',
+        'GITLAB_PREFETCH_BYTES': '4194304',
+    }
+
+    with patch.dict('os.environ', env, clear=True):
+        assert Config.from_env().prefetch_bytes == 4194304
+
+    with patch.dict('os.environ', {**env, 'GITLAB_CONTENT_CACHE_BYTES': '0'}, clear=True):
+        with pytest.raises(ValueError, match='GITLAB_PREFETCH_BYTES requires GITLAB_CONTENT_CACHE_BYTES'):
+            Config.from_env()
+
+
+def test_config_from_env_ref_cache_ttl(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+    }))
+
+    with patch.dict('os.environ', {
+        'GITLAB_URL': 'https://gitlab.example.com',
+        'GITLAB_SECRETS_PATH': str(secrets_file),
+        'MCP_SERVER_BIND_URL': 'http://0.0.0.0:8080',
+        'MCP_SERVER_ADVERTISED_URL': 'https://mcp.example.com:443',
+        'GITLAB_REF_CACHE_TTL': '3600',
+    }, clear=True):
+        config = Config.from_env()
+
+        assert config.ref_cache_ttl == 3600
+
+
+def test_config_content_cache_disk_tier(tmp_path):
+    secrets_file = tmp_path / 'secrets.json'
+    secrets_file.write_text(json.dumps({
+        'oauth_client_id': 'test-client-id',
+        'oauth_client_secret': 'test-client-secret',
+        'service_token': 'test-service-token',
+    }))
+    env = {
+        'GITLAB_URL': 'https://gitlab.example.com',
+        'GITLAB_SECRETS_PATH': str(secrets_file),
+        'MCP_SERVER_BIND_URL': 'http://0.0.0.0:8080',
+        'MCP_SERVER_ADVERTISED_URL': 'https://mcp.example.com:443',
+        'MCP_STATE_DIR': str(tmp_path / 'state'),
+    }
+
+    with patch.dict('os.environ', env, clear=True):
+        config = Config.from_env()
+
+        assert config.content_cache_dir is None
+        assert config.content_cache_disk_bytes == 1024 * 1024 * 1024
+
+    with patch.dict('os.environ', {
+        **env,
+        'GITLAB_CONTENT_CACHE_DIR': str(tmp_path / 'cache'),
+        'GITLAB_CONTENT_CACHE_DISK_BYTES': '1048576',
+    }, clear=True):
+        config = Config.from_env()
+
+        assert config.content_cache_dir == tmp_path / 'cache'
+        assert config.content_cache_disk_bytes == 1048576
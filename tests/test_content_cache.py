@@ -0,0 +1,107 @@
+import os
+from unittest.mock import MagicMock
+
+from gitlab_mcp.content_cache import ContentCache, is_commit_sha
+from gitlab_mcp.store import SQLiteStore
+
+SHA = 'a' * 40
+
+
+def test_is_commit_sha():
+    assert is_commit_sha(SHA)
+    assert is_commit_sha('b' * 64)
+    assert not is_commit_sha('main')
+    assert not is_commit_sha('abc123')
+
+
+def test_resolve_ref_passes_through_sha():
+    project = MagicMock()
+    cache = ContentCache(max_bytes=1024)
+
+    assert cache.resolve_ref(project, SHA) == SHA
+    project.commits.get.assert_not_called()
+
+
+def test_resolve_ref_caches_branch_resolution():
+    project = MagicMock()
+    project.id = 1
+    project.commits.get.return_value.id = SHA
+    cache = ContentCache(max_bytes=1024)
+
+    assert cache.resolve_ref(project, 'main') == SHA
+    assert cache.resolve_ref(project, 'main') == SHA
+    project.commits.get.assert_called_once_with('main')
+
+
+def test_get_or_fetch_memory():
+    cache = ContentCache(max_bytes=1024)
+    fetch = MagicMock(return_value={'content': 'hello'})
+
+    first = cache.get_or_fetch(('file', 1, SHA, 'README.md'), fetch)
+    second = cache.get_or_fetch(('file', 1, SHA, 'README.md'), fetch)
+
+    assert first == second == {'content': 'hello'}
+    fetch.assert_called_once()
+
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    ContentCache(max_bytes=1024, directory=tmp_path).set(('file', 1, SHA, 'README.md'), {'content': 'hello'})
+
+    cache = ContentCache(max_bytes=1024, directory=tmp_path)
+
+    assert cache.get(('file', 1, SHA, 'README.md')) == {'content': 'hello'}
+    assert cache.get(('file', 1, SHA, 'other.md')) is None
+
+
+def test_disk_tier_prunes_least_recently_used_entries(tmp_path):
+    cache = ContentCache(max_bytes=1, directory=tmp_path, disk_bytes=250)
+    cache.set(('file', 1, SHA, 'a.py'), {'content': 'a' * 80})
+    cache.set(('file', 1, SHA, 'b.py'), {'content': 'b' * 80})
+    for path in tmp_path.glob('*/*'):
+        os.utime(path, (1000, 1000))
+
+    assert cache.get(('file', 1, SHA, 'a.py')) == {'content': 'a' * 80}
+    cache.set(('file', 1, SHA, 'c.py'), {'content': 'c' * 80})
+
+    assert cache.get(('file', 1, SHA, 'b.py')) is None
+    assert cache.get(('file', 1, SHA, 'a.py')) is not None
+    assert cache.get(('file', 1, SHA, 'c.py')) is not None
+    assert len(list(tmp_path.glob('*/*'))) == 2
+
+
+def test_disk_tier_prunes_on_open(tmp_path):
+    ContentCache(max_bytes=1, directory=tmp_path).set(('file', 1, SHA, 'a.py'), {'content': 'a' * 80})
+
+    ContentCache(max_bytes=1, directory=tmp_path, disk_bytes=50)
+
+    assert list(tmp_path.glob('*/*')) == []
+
+
+def test_update_ref_replaces_and_drops_cached_resolution():
+    project = MagicMock()
+    project.id = 1
+    project.commits.get.return_value.id = SHA
+    cache = ContentCache(max_bytes=1024)
+
+    cache.update_ref(1, 'main', 'b' * 40)
+    assert cache.resolve_ref(project, 'main') == 'b' * 40
+
+    cache.update_ref(1, 'main', None)
+    assert cache.resolve_ref(project, 'main') == SHA
+    project.commits.get.assert_called_once_with('main')
+
+
+def test_ref_store_is_shared_between_instances(tmp_path):
+    project = MagicMock()
+    project.id = 1
+    project.commits.get.return_value.id = SHA
+    first = ContentCache(max_bytes=1024, ref_store=SQLiteStore(tmp_path / 'state.db'))
+    second = ContentCache(max_bytes=1024, ref_store=SQLiteStore(tmp_path / 'state.db'))
+
+    assert first.resolve_ref(project, 'main') == SHA
+    assert second.resolve_ref(project, 'main') == SHA
+
+    first.update_ref(1, 'main', 'b' * 40)
+
+    assert second.resolve_ref(project, 'main') == 'b' * 40
+    project.commits.get.assert_called_once_with('main')
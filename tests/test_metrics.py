@@ -0,0 +1,43 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from gitlab_mcp.metrics import record_cache_hit, track_tool
+from gitlab_mcp.session import GitLabSession
+from tests.gitlab_stub import GitLabStub
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_track_tool_records_call():
+    before = sample('gitlab_mcp_tool_calls_total', tool='metrics_ok', outcome='ok')
+
+    with track_tool('metrics_ok'):
+        record_cache_hit('content')
+
+    assert sample('gitlab_mcp_tool_calls_total', tool='metrics_ok', outcome='ok') == before + 1
+    assert sample('gitlab_mcp_tool_duration_seconds_count', tool='metrics_ok') >= 1
+    assert sample('gitlab_mcp_cache_hits_total', tool='metrics_ok', cache='content') >= 1
+
+
+def test_track_tool_records_error():
+    with pytest.raises(RuntimeError):
+        with track_tool('metrics_error'):
+            raise RuntimeError('boom')
+
+    assert sample('gitlab_mcp_tool_calls_total', tool='metrics_error', outcome='error') >= 1
+
+
+def test_session_records_upstream_requests_per_tool():
+    session = GitLabSession()
+
+    with GitLabStub() as stub:
+        with track_tool('metrics_http') as stats:
+            session.get(f'{stub.url}/api/v4/projects/1')
+            session.get(f'{stub.url}/api/v4/projects/1/merge_requests/1')
+
+    assert stats.requests == 2
+    assert sample('gitlab_mcp_upstream_requests_total', tool='metrics_http', status='200') == 2
+    assert sample('gitlab_mcp_upstream_bytes_total', tool='metrics_http') > 0
+    assert sample('gitlab_mcp_tool_upstream_requests_sum', tool='metrics_http') == 2
@@ -0,0 +1,135 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from gitlab_mcp.mirror import RepositoryMirror
+from tests.git_remote import GitRemote
+
+PATH_WITH_NAMESPACE = 'group/test-project'
+
+
+@pytest.fixture
+def remote(tmp_path):
+    remote = GitRemote(tmp_path / 'remote', PATH_WITH_NAMESPACE)
+    remote.first = remote.commit({'README.md': 'hello\n', 'src/app.py': 'import os\nprint(1)\n'}, 'Initial commit')
+    remote.second = remote.commit({'src/app.py': 'import os\nprint(2)\nprint(3)\n'}, 'Update app\n\nDetails')
+
+    return remote
+
+
+@pytest.fixture
+def project():
+    project = MagicMock()
+    project.id = 1
+    project.path_with_namespace = PATH_WITH_NAMESPACE
+    project.default_branch = 'main'
+
+    return project
+
+
+@pytest.fixture
+def mirror(tmp_path, remote):
+    return RepositoryMirror(tmp_path / 'mirrors', remote.url, None, [PATH_WITH_NAMESPACE])
+
+
+@pytest.fixture
+def repository(mirror, project):
+    return mirror.sync(project)
+
+
+def test_mirror_covers_projects_by_id_or_path(tmp_path, project):
+    by_id = RepositoryMirror(tmp_path / 'a', 'https://gitlab.example.com', None, ['1'])
+    by_path = RepositoryMirror(tmp_path / 'b', 'https://gitlab.example.com', None, [PATH_WITH_NAMESPACE])
+    other = RepositoryMirror(tmp_path / 'c', 'https://gitlab.example.com', None, ['2'])
+
+    assert by_id.covers(project)
+    assert by_path.covers(project)
+    assert not other.covers(project)
+    assert other.repository(project) is None
+
+
+def test_repository_clones_in_background(mirror, project):
+    assert mirror.repository(project) is None
+
+    mirror._pool.shutdown(wait=True)
+
+    assert mirror.repository(project).resolve('main') is not None
+
+
+def test_invalidate_during_sync_fetches_again(mirror, project, repository, remote):
+    mirror.refresh(project)
+    third = remote.commit({'NEW.md': 'new\n'}, 'Add file')
+    mirror.invalidate(project)
+
+    mirror._pool.shutdown(wait=True)
+
+    assert repository.resolve('main') == third
+
+
+def test_resolve(repository, remote):
+    assert repository.resolve('main') == remote.second
+    assert repository.resolve(remote.first) == remote.first
+    assert repository.resolve('missing') is None
+
+
+def test_sync_fetches_new_commits(mirror, project, repository, remote):
+    third = remote.commit({'NEW.md': 'new\n'}, 'Add file')
+    assert repository.resolve('main') == remote.second
+
+    mirror.sync(project)
+
+    assert repository.resolve('main') == third
+
+
+def test_tree(repository, remote):
+    top = repository.tree(remote.second)
+    nested = repository.tree(remote.second, path='src')
+    recursive = repository.tree(remote.second, recursive=True)
+
+    assert [(i['path'], i['type']) for i in top] == [('README.md', 'blob'), ('src', 'tree')]
+    assert [(i['name'], i['path'], i['mode']) for i in nested] == [('app.py', 'src/app.py', '100644')]
+    assert [i['path'] for i in recursive] == ['README.md', 'src', 'src/app.py']
+
+
+def test_read_blob(repository, remote):
+    with repository.read_blob(remote.first, 'src/app.py') as chunks:
+        content = b''.join(chunks)
+
+    assert content == b'import os\nprint(1)\n'
+    assert repository.blob_size(remote.first, 'src/app.py') == len(content)
+    assert repository.blob_size(remote.first, 'missing.py') is None
+    assert repository.last_commit(remote.second, 'README.md') == remote.first
+
+
+def test_blame(repository, remote):
+    blame = repository.blame(remote.second, 'src/app.py')
+
+    assert [(e['commit']['id'], e['lines']) for e in blame] == [
+        (remote.first, ['import os']),
+        (remote.second, ['print(2)', 'print(3)']),
+    ]
+    assert blame[1]['commit']['author_name'] == 'Reviewer'
+    assert blame[1]['commit']['message'] == 'Update app\n\nDetails\n'
+
+
+def test_blame_line_range(repository, remote):
+    blame = repository.blame(remote.second, 'src/app.py', start_line=2, end_line=2)
+
+    assert [(e['commit']['id'], e['lines']) for e in blame] == [(remote.second, ['print(2)'])]
+
+
+def test_commits(repository, remote):
+    first_page = repository.commits(remote.second, per_page=1)
+    second_page = repository.commits(remote.second, page=2, per_page=1)
+
+    assert [c['id'] for c in first_page + second_page] == [remote.second, remote.first]
+    assert first_page[0]['short_id'] == remote.second[:8]
+    assert first_page[0]['title'] == 'Update app'
+    assert first_page[0]['author_email'] == 'reviewer@example.com'
+
+
+def test_grep(repository, remote):
+    matches = repository.grep(remote.second, 'PRINT', limit=10)
+
+    assert matches == [('src/app.py', 2, 'print(2)'), ('src/app.py', 3, 'print(3)')]
+    assert repository.grep(remote.second, 'print', limit=1) == [('src/app.py', 2, 'print(2)')]
@@ -0,0 +1,104 @@
+import threading
+import time
+
+import requests
+
+from gitlab_mcp.scheduler import RateLimitScheduler
+
+
+def make_response(status_code, headers=None, method='GET'):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.request = requests.Request(method, 'https://gitlab.example.com/api/v4/projects').prepare()
+
+    return response
+
+
+def test_scheduler_allows_burst():
+    scheduler = RateLimitScheduler(rate=1, burst=3)
+    start = time.monotonic()
+
+    for _ in range(3):
+        scheduler.acquire('user')
+
+    assert time.monotonic() - start < 0.1
+
+
+def test_scheduler_paces_after_burst():
+    scheduler = RateLimitScheduler(rate=20, burst=1)
+    start = time.monotonic()
+
+    for _ in range(3):
+        scheduler.acquire('user')
+
+    assert time.monotonic() - start >= 0.09
+
+
+def test_scheduler_pauses_when_remaining_exhausted():
+    scheduler = RateLimitScheduler(rate=1000, burst=10)
+    scheduler.observe(make_response(200, {
+        'RateLimit-Remaining': '0',
+        'RateLimit-Reset': str(time.time() + 0.2),
+    }))
+    start = time.monotonic()
+
+    scheduler.acquire('user')
+
+    assert time.monotonic() - start >= 0.15
+
+
+def test_scheduler_adapts_rate_to_remaining_budget():
+    scheduler = RateLimitScheduler(rate=1000, burst=10)
+
+    scheduler.observe(make_response(200, {
+        'RateLimit-Remaining': '5',
+        'RateLimit-Reset': str(int(time.time()) + 10),
+    }))
+
+    assert scheduler._rate < 0.6
+    assert scheduler._tokens <= 5
+
+
+def test_scheduler_serves_users_round_robin():
+    scheduler = RateLimitScheduler(rate=50, burst=1)
+    scheduler.acquire('warmup')
+    order = []
+
+    def request(user):
+        scheduler.acquire(user)
+        order.append(user)
+
+    threads = [threading.Thread(target=request, args=('busy',)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.002)
+    quiet = threading.Thread(target=request, args=('quiet',))
+    quiet.start()
+    for thread in [*threads, quiet]:
+        thread.join()
+
+    assert order.index('quiet') <= 2
+
+
+def test_retry_delay_uses_retry_after():
+    scheduler = RateLimitScheduler(rate=10, burst=10, backoff_base=0.5)
+
+    delay = scheduler.retry_delay(make_response(429, {'Retry-After': '2'}), attempt=0)
+
+    assert 2 <= delay <= 2.5
+
+
+def test_retry_delay_stops_after_max_retries():
+    scheduler = RateLimitScheduler(rate=10, burst=10, max_retries=2)
+
+    assert scheduler.retry_delay(make_response(503), attempt=1) is not None
+    assert scheduler.retry_delay(make_response(503), attempt=2) is None
+
+
+def test_retry_delay_skips_unsafe_and_successful_requests():
+    scheduler = RateLimitScheduler(rate=10, burst=10)
+
+    assert scheduler.retry_delay(make_response(503, method='POST'), attempt=0) is None
+    assert scheduler.retry_delay(make_response(429, method='POST'), attempt=0) is not None
+    assert scheduler.retry_delay(make_response(200), attempt=0) is None
@@ -0,0 +1,135 @@
+import io
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gitlab_mcp.search_index import (
+    MAX_INDEXED_FILE_BYTES,
+    MAX_PATTERN_LENGTH,
+    IndexTooLarge,
+    InvalidPattern,
+    SearchIndexCache,
+    TrigramIndex,
+    read_tar,
+    required_literals,
+)
+from tests.gitlab_stub import make_tar
+
+FILES = [
+    ('src/app.py', b'import os\n\ndef Handler():\n    return os.getcwd()\n'),
+    ('src/util.py', b'def helper():\n    return 42\n'),
+    ('README.md', b'# App\nCall handler() to start.\n'),
+]
+
+
+def test_substring_search_is_case_insensitive():
+    index = TrigramIndex(FILES)
+
+    assert index.search('handler') == [
+        ('src/app.py', 3, 'def Handler():'),
+        ('README.md', 2, 'Call handler() to start.'),
+    ]
+
+
+def test_search_limit():
+    index = TrigramIndex(FILES)
+
+    assert index.search('return', limit=1) == [('src/app.py', 4, '    return os.getcwd()')]
+
+
+def test_short_queries_scan_all_files():
+    index = TrigramIndex(FILES)
+
+    assert [m[0] for m in index.search('42')] == ['src/util.py']
+
+
+def test_regex_search():
+    index = TrigramIndex(FILES)
+
+    assert index.search(r'def \w+\(\)', regex=True) == [
+        ('src/app.py', 3, 'def Handler():'),
+        ('src/util.py', 1, 'def helper():'),
+    ]
+    assert [m[0] for m in index.search('helper|getcwd', regex=True)] == ['src/app.py', 'src/util.py']
+
+
+def test_required_literals():
+    assert required_literals(r'def \w+\(') == ['def ', '(']
+    assert required_literals('foo|bar') == []
+
+    with pytest.raises(InvalidPattern):
+        required_literals('(')
+
+
+@pytest.mark.parametrize('pattern', [
+    r'(a+)+b',
+    r'(a|aa)*c',
+    r'(?:a{1,2})*c',
+    r'(?:\w+\s?)*$',
+    r'(a|b)\1',
+    r'foo(?=bar)',
+    r'(?<!x)y',
+    'a' * (MAX_PATTERN_LENGTH + 1),
+])
+def test_required_literals_rejects_unbounded_patterns(pattern):
+    with pytest.raises(InvalidPattern):
+        required_literals(pattern)
+
+
+def test_required_literals_allows_bounded_nesting():
+    assert required_literals(r'(\d{1,3}\.){3}\d+') == []
+    assert required_literals(r'(?:foo|ba+r)\s+\w+') == []
+
+
+def test_regex_search_skips_long_lines():
+    index = TrigramIndex([('min.js', b'x' * 2000 + b'needle\nneedle\n')])
+
+    assert index.search('needle', regex=True) == [('min.js', 2, 'needle')]
+    assert len(index.search('needle')) == 2
+
+
+def test_regex_search_stops_runaway_matches():
+    index = TrigramIndex([('slow.txt', b'a' * 1000 + b'\n')])
+
+    with patch('gitlab_mcp.search_index.REGEX_SEARCH_TIMEOUT', 0.2):
+        with pytest.raises(InvalidPattern, match='longer than'):
+            index.search(r'a*a*a*a*a*a*b', regex=True)
+
+
+def test_read_tar_skips_binary_and_large_files():
+    data = make_tar([
+        ('root/src/app.py', b'print(1)\n'),
+        ('root/logo.png', b'\x89PNG\0\0'),
+        ('root/big.txt', b'x' * (MAX_INDEXED_FILE_BYTES + 1)),
+    ], 'gz')
+
+    assert list(read_tar(io.BytesIO(data), strip_components=1)) == [('src/app.py', b'print(1)\n')]
+
+
+def test_cache_builds_each_index_once():
+    cache = SearchIndexCache(max_bytes=1024 * 1024)
+    release = threading.Event()
+    files = MagicMock(side_effect=lambda: (release.wait(5), iter(FILES))[1])
+    threads = [threading.Thread(target=cache.get_or_build, args=(('p', 'sha'), files)) for _ in range(3)]
+
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert cache.get_or_build(('p', 'sha'), files).search('helper')
+    assert files.call_count == 1
+
+
+def test_cache_remembers_oversized_indexes():
+    cache = SearchIndexCache(max_bytes=10)
+    files = MagicMock(return_value=iter(FILES))
+
+    with pytest.raises(IndexTooLarge):
+        cache.get_or_build(('p', 'sha'), files)
+    with pytest.raises(IndexTooLarge):
+        cache.get_or_build(('p', 'sha'), files)
+
+    assert files.call_count == 1
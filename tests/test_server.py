@@ -0,0 +1,99 @@
+from dataclasses import replace
+from unittest.mock import MagicMock, patch
+
+from starlette.testclient import TestClient
+
+from gitlab_mcp import server
+from gitlab_mcp.config import Config, Secrets
+
+
+def make_config(**kwargs) -> Config:
+    return Config(
+        url='https://gitlab.example.com',
+        secrets=Secrets('id', 'secret', 'token'),
+        server_bind_url='http://0.0.0.0:8080',
+        server_advertised_url='https://mcp.example.com:443',
+        ssl_cert_path=None,
+        ssl_key_path=None,
+        **kwargs,
+    )
+
+
+@patch('gitlab_mcp.server.repository.register_tools')
+@patch('gitlab_mcp.server.merge_requests.register_tools')
+def test_create_mcp_registers_tools(mock_mr_register, mock_repo_register, tmp_path):
+    mcp = server.create_mcp(make_config(state_dir=tmp_path))
+
+    mock_mr_register.assert_called_once()
+    mock_repo_register.assert_called_once()
+    assert mock_repo_register.call_args.args[0] is mcp
+    assert (tmp_path / 'state.db').exists()
+    assert not (tmp_path / 'content-cache').exists()
+    assert mock_repo_register.call_args.kwargs['mirror'] is None
+    assert mock_mr_register.call_args.kwargs['prefetcher'] is None
+
+
+@patch('gitlab_mcp.server.repository.register_tools')
+@patch('gitlab_mcp.server.merge_requests.register_tools')
+def test_create_mcp_creates_mirror(mock_mr_register, mock_repo_register, tmp_path):
+    server.create_mcp(make_config(state_dir=tmp_path, mirror_projects=('group/app',)))
+
+    mirror = mock_repo_register.call_args.kwargs['mirror']
+    assert mirror.covers(MagicMock(id=1, path_with_namespace='group/app'))
+    assert (tmp_path / 'mirrors').is_dir()
+
+
+@patch('gitlab_mcp.server.repository.register_tools')
+@patch('gitlab_mcp.server.merge_requests.register_tools')
+def test_create_mcp_creates_prefetcher(mock_mr_register, mock_repo_register, tmp_path):
+    server.create_mcp(make_config(state_dir=tmp_path, prefetch_bytes=1024))
+
+    assert mock_mr_register.call_args.kwargs['prefetcher'] is not None
+
+
+@patch('gitlab_mcp.server.uvicorn.run')
+@patch('gitlab_mcp.server.create_mcp')
+@patch('gitlab_mcp.server.get_config')
+def test_main_single_worker_runs_in_process(mock_get_config, mock_create_mcp, mock_uvicorn_run):
+    mock_get_config.return_value = make_config()
+
+    server.main()
+
+    mock_create_mcp.return_value.run.assert_called_once()
+    mock_uvicorn_run.assert_not_called()
+
+
+@patch('gitlab_mcp.server.uvicorn.run')
+@patch('gitlab_mcp.server.create_mcp')
+@patch('gitlab_mcp.server.get_config')
+def test_main_multiple_workers_uses_app_factory(mock_get_config, mock_create_mcp, mock_uvicorn_run):
+    mock_get_config.return_value = make_config(server_workers=4)
+
+    server.main()
+
+    mock_create_mcp.assert_not_called()
+    mock_uvicorn_run.assert_called_once()
+    assert mock_uvicorn_run.call_args.args == ('gitlab_mcp.server:create_app',)
+    assert mock_uvicorn_run.call_args.kwargs['factory'] is True
+    assert mock_uvicorn_run.call_args.kwargs['workers'] == 4
+
+
+def test_metrics_endpoint(tmp_path):
+    app = server.create_mcp(make_config(state_dir=tmp_path)).http_app(transport='http')
+
+    response = TestClient(app).get('/metrics')
+
+    assert response.status_code == 200
+    assert 'gitlab_mcp_tool_calls_total' in response.text
+
+
+def test_webhook_endpoint_requires_secret(tmp_path):
+    config = make_config(state_dir=tmp_path)
+    webhook_config = replace(config, secrets=replace(config.secrets, webhook_secret='webhook-secret'))
+
+    disabled = TestClient(server.create_mcp(config).http_app(transport='http'))
+    enabled = TestClient(server.create_mcp(webhook_config).http_app(transport='http'))
+
+    assert disabled.post('/webhooks/gitlab', json={}).status_code in (404, 405)
+    assert enabled.post('/webhooks/gitlab', json={}).status_code == 401
+    assert enabled.post('/webhooks/gitlab', json={}, headers={'X-Gitlab-Token': 'webhook-secret'}).status_code == 204
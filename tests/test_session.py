@@ -0,0 +1,188 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from gitlab_mcp.scheduler import RateLimitScheduler
+from gitlab_mcp.session import HTTP_POOL_SIZE, GitLabSession, ResponseCache
+
+API_URL = 'https://gitlab.example.com/api/v4/projects/1'
+
+
+def make_response(request, status_code, content=b'', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    response.url = request.url
+    response.request = request
+
+    return response
+
+
+def test_session_pool_size():
+    session = GitLabSession()
+
+    assert session.get_adapter(API_URL)._pool_maxsize == HTTP_POOL_SIZE
+
+
+@patch.object(HTTPAdapter, 'send')
+def test_session_serves_not_modified_from_cache(mock_send):
+    responses = iter([
+        lambda r: make_response(r, 200, b'{"id": 1}', {'ETag': 'W/"abc"'}),
+        lambda r: make_response(r, 304),
+    ])
+    mock_send.side_effect = lambda request, **kwargs: next(responses)(request)
+    session = GitLabSession(ResponseCache(max_bytes=1024))
+
+    first = session.get(API_URL, headers={'PRIVATE-TOKEN': 'token'})
+    second = session.get(API_URL, headers={'PRIVATE-TOKEN': 'token'})
+
+    assert first.json() == {'id': 1}
+    assert second.status_code == 200
+    assert second.json() == {'id': 1}
+    revalidation = mock_send.call_args_list[1].args[0]
+    assert revalidation.headers['If-None-Match'] == 'W/"abc"'
+
+
+@patch.object(HTTPAdapter, 'send')
+def test_session_cache_scoped_by_credentials(mock_send):
+    mock_send.side_effect = lambda request, **kwargs: make_response(
+        request, 200, b'{"id": 1}', {'ETag': 'W/"abc"'}
+    )
+    session = GitLabSession(ResponseCache(max_bytes=1024))
+
+    session.get(API_URL, headers={'PRIVATE-TOKEN': 'token-a'})
+    session.get(API_URL, headers={'PRIVATE-TOKEN': 'token-b'})
+
+    assert 'If-None-Match' not in mock_send.call_args_list[1].args[0].headers
+
+
+@patch.object(HTTPAdapter, 'send')
+def test_session_does_not_cache_writes_or_streams(mock_send):
+    mock_send.side_effect = lambda request, **kwargs: make_response(
+        request, 200, b'{"id": 1}', {'ETag': 'W/"abc"'}
+    )
+    session = GitLabSession(ResponseCache(max_bytes=1024))
+
+    session.post(API_URL)
+    session.get(API_URL, stream=True)
+    session.get(API_URL)
+
+    assert 'If-None-Match' not in mock_send.call_args_list[2].args[0].headers
+
+
+@patch.object(HTTPAdapter, 'send')
+def test_session_respects_byte_budget(mock_send):
+    mock_send.side_effect = lambda request, **kwargs: make_response(
+        request, 200, b'x' * 2048, {'ETag': 'W/"abc"'}
+    )
+    session = GitLabSession(ResponseCache(max_bytes=1024))
+
+    session.get(API_URL)
+    session.get(API_URL)
+
+    assert 'If-None-Match' not in mock_send.call_args_list[1].args[0].headers
+
+
+@patch.object(HTTPAdapter, 'send')
+def test_session_retries_rate_limited_requests(mock_send):
+    responses = iter([429, 503, 200])
+    mock_send.side_effect = lambda request, **kwargs: make_response(
+        request, next(responses), headers={'Retry-After': '0'},
+    )
+    session = GitLabSession(scheduler=RateLimitScheduler(rate=1000, burst=10, backoff_base=0.01))
+
+    response = session.get(API_URL)
+
+    assert response.status_code == 200
+    assert mock_send.call_count == 3
+
+
+@patch.object(HTTPAdapter, 'send')
+def test_session_gives_up_after_max_retries(mock_send):
+    mock_send.side_effect = lambda request, **kwargs: make_response(request, 429)
+    session = GitLabSession(scheduler=RateLimitScheduler(rate=1000, burst=10, max_retries=1, backoff_base=0.01))
+
+    response = session.get(API_URL)
+
+    assert response.status_code == 429
+    assert mock_send.call_count == 2
+
+
+def run_concurrently(session, count, headers):
+    with ThreadPoolExecutor(count) as executor:
+        futures = [executor.submit(session.get, API_URL, headers=headers(i)) for i in range(count)]
+
+        return [future.result() for future in futures]
+
+
+@patch('gitlab_mcp.session.record_cache_hit')
+@patch.object(HTTPAdapter, 'send')
+def test_session_coalesces_identical_concurrent_reads(mock_send, mock_hit):
+    waiters = threading.Semaphore(0)
+    mock_hit.side_effect = lambda cache: waiters.release()
+
+    def send(request, **kwargs):
+        for _ in range(3):
+            assert waiters.acquire(timeout=5)
+        return make_response(request, 200, b'{"id": 1}')
+
+    mock_send.side_effect = send
+    session = GitLabSession()
+
+    responses = run_concurrently(session, 4, lambda i: {'PRIVATE-TOKEN': 'token'})
+
+    assert mock_send.call_count == 1
+    assert [r.json() for r in responses] == [{'id': 1}] * 4
+    assert len({id(r) for r in responses}) == 4
+    mock_hit.assert_called_with('coalesced')
+
+
+@patch.object(HTTPAdapter, 'send')
+def test_session_coalescing_scoped_by_credentials(mock_send):
+    barrier = threading.Barrier(2)
+
+    def send(request, **kwargs):
+        barrier.wait(timeout=5)
+        return make_response(request, 200, b'{"id": 1}')
+
+    mock_send.side_effect = send
+    session = GitLabSession()
+
+    run_concurrently(session, 2, lambda i: {'PRIVATE-TOKEN': f'token-{i}'})
+
+    assert mock_send.call_count == 2
+
+
+@patch('gitlab_mcp.session.record_cache_hit')
+@patch.object(HTTPAdapter, 'send')
+def test_session_coalesced_waiters_share_errors(mock_send, mock_hit):
+    waiter = threading.Event()
+    mock_hit.side_effect = lambda cache: waiter.set()
+
+    def send(request, **kwargs):
+        assert waiter.wait(timeout=5)
+        raise requests.ConnectionError('boom')
+
+    mock_send.side_effect = send
+    session = GitLabSession()
+
+    with ThreadPoolExecutor(2) as executor:
+        futures = [executor.submit(session.get, API_URL) for _ in range(2)]
+
+    assert all(isinstance(f.exception(), requests.ConnectionError) for f in futures)
+    assert mock_send.call_count == 1
+
+
+@patch.object(HTTPAdapter, 'send')
+def test_session_does_not_coalesce_sequential_reads(mock_send):
+    mock_send.side_effect = lambda request, **kwargs: make_response(request, 200, b'{"id": 1}')
+    session = GitLabSession()
+
+    session.get(API_URL)
+    session.get(API_URL)
+
+    assert mock_send.call_count == 2
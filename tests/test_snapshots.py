@@ -0,0 +1,35 @@
+from gitlab_mcp.snapshots import SnapshotStore
+from gitlab_mcp.store import SQLiteStore
+
+
+def test_snapshots_are_kept_per_user_and_project():
+    snapshots = SnapshotStore()
+
+    key = snapshots.set('alice', 1, {'updated_after': '2024-01-01T00:00:00Z'})
+
+    assert snapshots.get('alice', 1) == {'updated_after': '2024-01-01T00:00:00Z'}
+    assert snapshots.get('alice', 1, key) == {'updated_after': '2024-01-01T00:00:00Z'}
+    assert snapshots.get('alice', 2) is None
+    assert snapshots.get('alice', 2, key) is None
+    assert snapshots.get('bob', 1) is None
+
+
+def test_snapshots_keep_earlier_versions():
+    snapshots = SnapshotStore()
+
+    first = snapshots.set('alice', 1, {'updated_after': '2024-01-01T00:00:00Z'})
+    second = snapshots.set('alice', 1, {'updated_after': '2024-01-02T00:00:00Z'})
+
+    assert first != second
+    assert snapshots.get('alice', 1) == {'updated_after': '2024-01-02T00:00:00Z'}
+    assert snapshots.get('alice', 1, first) == {'updated_after': '2024-01-01T00:00:00Z'}
+
+
+def test_snapshots_are_shared_through_sqlite_store(tmp_path):
+    store = SQLiteStore(tmp_path / 'state.db')
+
+    SnapshotStore(store).set('alice', 1, {'merge_requests': {'1': {'state': 'opened'}}})
+
+    assert SnapshotStore(SQLiteStore(tmp_path / 'state.db')).get('alice', 1) == {
+        'merge_requests': {'1': {'state': 'opened'}},
+    }
@@ -0,0 +1,72 @@
+import sqlite3
+import time
+from unittest.mock import patch
+
+from gitlab_mcp.store import SQLiteStore
+
+
+def stored_keys(path) -> list[str]:
+    with sqlite3.connect(path) as conn:
+        return [key for key, in conn.execute('SELECT key FROM entries ORDER BY key')]
+
+
+def test_store_set_and_get(tmp_path):
+    store = SQLiteStore(tmp_path / 'state.db')
+
+    store.set('ns', 'key', {'value': 1})
+
+    assert store.get('ns', 'key') == {'value': 1}
+    assert store.get('other', 'key') is None
+
+
+def test_store_shared_between_instances(tmp_path):
+    SQLiteStore(tmp_path / 'state.db').set('ns', 'key', [1, 2])
+
+    assert SQLiteStore(tmp_path / 'state.db').get('ns', 'key') == [1, 2]
+
+
+def test_store_expires_entries(tmp_path):
+    store = SQLiteStore(tmp_path / 'state.db')
+    store.set('ns', 'key', 'value', ttl=10)
+
+    with patch('gitlab_mcp.store.time.time', return_value=time.time() + 11):
+        assert store.get('ns', 'key', 'missing') == 'missing'
+
+
+def test_store_non_positive_ttl_deletes(tmp_path):
+    store = SQLiteStore(tmp_path / 'state.db')
+    store.set('ns', 'key', 'value')
+
+    store.set('ns', 'key', 'new', ttl=0)
+
+    assert store.get('ns', 'key') is None
+
+
+def test_store_purge_expired(tmp_path):
+    store = SQLiteStore(tmp_path / 'state.db')
+    store.set('ns', 'stale', 'value', ttl=10)
+    store.set('ns', 'fresh', 'value')
+
+    with patch('gitlab_mcp.store.time.time', return_value=time.time() + 11):
+        assert store.purge_expired() == 1
+
+    assert store.get('ns', 'fresh') == 'value'
+
+
+def test_store_purges_expired_entries_on_open(tmp_path):
+    SQLiteStore(tmp_path / 'state.db').set('ns', 'stale', 'value', ttl=10)
+
+    with patch('gitlab_mcp.store.time.time', return_value=time.time() + 11):
+        SQLiteStore(tmp_path / 'state.db')
+
+    assert stored_keys(tmp_path / 'state.db') == []
+
+
+def test_store_purges_expired_entries_periodically(tmp_path):
+    store = SQLiteStore(tmp_path / 'state.db', purge_every=2)
+    store.set('ns', 'stale', 'value', ttl=10)
+
+    with patch('gitlab_mcp.store.time.time', return_value=time.time() + 11):
+        store.set('ns', 'other', 'value')
+
+    assert stored_keys(tmp_path / 'state.db') == ['other']
@@ -0,0 +1,106 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from gitlab_mcp.content_cache import ContentCache
+from gitlab_mcp.webhooks import WEBHOOK_PATH, WebhookHandler
+
+PAYLOADS = Path(__file__).parent / 'webhooks'
+SECRET = 'webhook-secret'
+HEAD_SHA = 'da1560886d4f094c3e6c9ef40349f7d38b5d27d7'
+
+
+@pytest.fixture
+def project():
+    project = MagicMock()
+    project.id = 1
+    project.commits.get.return_value.id = 'a' * 40
+
+    return project
+
+
+@pytest.fixture
+def content_cache():
+    return ContentCache(max_bytes=1024)
+
+
+@pytest.fixture
+def mirror():
+    return MagicMock()
+
+
+@pytest.fixture
+def client(content_cache, mirror):
+    handler = WebhookHandler(SECRET, content_cache, mirror)
+
+    return TestClient(Starlette(routes=[Route(WEBHOOK_PATH, handler.endpoint, methods=['POST'])]))
+
+
+def post(client: TestClient, name: str, token: str = SECRET):
+    return client.post(
+        WEBHOOK_PATH,
+        content=(PAYLOADS / f'{name}.json').read_bytes(),
+        headers={'X-Gitlab-Token': token, 'Content-Type': 'application/json'},
+    )
+
+
+def test_rejects_wrong_token(client, content_cache, project):
+    response = post(client, 'push', token='wrong')
+
+    assert response.status_code == 401
+    assert content_cache.resolve_ref(project, 'main') == 'a' * 40
+
+
+def test_rejects_invalid_payload(client):
+    response = client.post(WEBHOOK_PATH, content=b'not json', headers={'X-Gitlab-Token': SECRET})
+
+    assert response.status_code == 400
+
+
+def test_push_updates_branch_ref_and_refreshes_mirror(client, content_cache, mirror, project):
+    content_cache.resolve_ref(project, 'main')
+
+    response = post(client, 'push')
+
+    assert response.status_code == 204
+    assert content_cache.resolve_ref(project, 'main') == HEAD_SHA
+    assert project.commits.get.call_count == 1
+    assert mirror.invalidate.call_args.args[0].path_with_namespace == 'group/test-project'
+
+
+def test_branch_delete_drops_ref(client, content_cache, project):
+    content_cache.update_ref(1, 'feature', HEAD_SHA)
+
+    post(client, 'branch_delete')
+
+    assert content_cache.resolve_ref(project, 'feature') == 'a' * 40
+
+
+def test_tag_push_caches_tagged_commit(client, content_cache, project):
+    post(client, 'tag_push')
+
+    assert content_cache.resolve_ref(project, 'v1.0.0') == HEAD_SHA
+    project.commits.get.assert_not_called()
+
+
+def test_merge_request_refreshes_mirror(client, mirror):
+    assert post(client, 'merge_request').status_code == 204
+
+    assert mirror.invalidate.call_args.args[0].id == 1
+
+
+@pytest.mark.parametrize('name', ['note', 'pipeline'])
+def test_note_and_pipeline_events_are_accepted(client, content_cache, mirror, name):
+    assert post(client, name).status_code == 204
+
+    mirror.invalidate.assert_not_called()
+
+
+def test_handle_ignores_events_without_project(content_cache, mirror):
+    WebhookHandler(SECRET, content_cache, mirror).handle({'object_kind': 'push', 'ref': 'refs/heads/main'})
+
+    mirror.invalidate.assert_not_called()
@@ -1,8 +1,32 @@
+import asyncio
+import contextvars
+import threading
+from dataclasses import dataclass
+from unittest.mock import MagicMock, patch
+
 import gitlab.exceptions
+import pytest
 from mcp.types import CallToolResult, TextContent
 
 from gitlab_mcp.client import PermissionDenied, ProjectNotFound
-from gitlab_mcp.tools.common import handle_gitlab_errors
+from gitlab_mcp.tools.common import (
+    FANOUT_THREADS,
+    WORKER_THREADS,
+    InvalidArgument,
+    InvalidPageToken,
+    ProjectedPage,
+    Table,
+    configure_pools,
+    decode_page_token,
+    encode_page_token,
+    gather,
+    get_client,
+    handle_gitlab_errors,
+    list_page,
+    project_items,
+    run_in_worker,
+    select_fields,
+)
 
 
 def test_handle_gitlab_errors_success():
@@ -51,3 +75,172 @@ def test_handle_gitlab_errors_gitlab_error():
     assert isinstance(result, CallToolResult)
     assert result.isError is True
     assert '500' in result.content[0].text
+
+
+@patch('gitlab_mcp.client.OAuthGitLabClient')
+@patch('gitlab_mcp.tools.common.get_access_token')
+def test_get_client_reuses_pooled_client(mock_get_access_token, mock_oauth_client_class):
+    mock_get_access_token.return_value = MagicMock(token='pooled-token', expires_at=None)
+    mock_service_client = MagicMock()
+
+    first = get_client(mock_service_client, 'https://gitlab.example.com')
+    second = get_client(mock_service_client, 'https://gitlab.example.com')
+
+    assert first is second
+    mock_oauth_client_class.assert_called_once()
+
+
+def test_run_in_worker_runs_off_event_loop_thread():
+    @run_in_worker
+    def blocking(value):
+        return value, threading.current_thread()
+
+    value, thread = asyncio.run(blocking('result'))
+
+    assert value == 'result'
+    assert thread is not threading.current_thread()
+
+
+def test_run_in_worker_propagates_context():
+    request_id = contextvars.ContextVar('request_id')
+
+    @run_in_worker
+    def read_context():
+        return request_id.get()
+
+    async def call():
+        request_id.set('abc')
+        return await read_context()
+
+    assert asyncio.run(call()) == 'abc'
+
+
+def test_run_in_worker_returns_handled_errors():
+    @run_in_worker
+    @handle_gitlab_errors
+    def raise_permission_denied():
+        raise PermissionDenied('Access denied')
+
+    result = asyncio.run(raise_permission_denied())
+
+    assert result.isError is True
+
+
+def test_gather_runs_calls_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait(value):
+        barrier.wait()
+        return value
+
+    result = gather(lambda: wait('a'), lambda: wait('b'))
+
+    assert result == ['a', 'b']
+
+
+def test_gather_bounds_concurrency():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def track(value):
+        with lock:
+            running.append(value)
+            peak.append(len(running))
+        threading.Event().wait(0.01)
+        with lock:
+            running.remove(value)
+        return value
+
+    result = gather(*(lambda i=i: track(i) for i in range(8)), max_concurrency=2)
+
+    assert result == list(range(8))
+    assert max(peak) <= 2
+
+
+def test_configure_pools_resizes_thread_pools():
+    @run_in_worker
+    def worker_thread():
+        return threading.current_thread().name
+
+    configure_pools(1, 1)
+    try:
+        workers = {asyncio.run(worker_thread()) for _ in range(3)}
+        fanout = set(gather(*(lambda: threading.current_thread().name for _ in range(3))))
+    finally:
+        configure_pools(WORKER_THREADS, FANOUT_THREADS)
+
+    assert len(workers) == 1
+    assert len(fanout) == 1
+
+
+def test_gather_propagates_errors():
+    def fail():
+        raise PermissionDenied('Access denied')
+
+    with pytest.raises(PermissionDenied):
+        gather(lambda: 'ok', fail)
+
+
+def test_page_token_round_trip():
+    token = encode_page_token({'page': 3})
+
+    assert decode_page_token(token) == {'page': 3}
+    assert decode_page_token(None) == {}
+
+
+def test_decode_page_token_rejects_unknown_keys():
+    token = encode_page_token({'sudo': 'root'})
+
+    with pytest.raises(InvalidPageToken):
+        decode_page_token(token)
+
+
+def test_list_page_offset_pagination():
+    list_fn = MagicMock(return_value=['a', 'b'])
+
+    items, token = list_page(list_fn, {'state': 'opened'}, 2, encode_page_token({'page': 2}))
+
+    list_fn.assert_called_once_with(state='opened', page=2, per_page=2, get_all=False)
+    assert items == ['a', 'b']
+    assert decode_page_token(token) == {'page': 3}
+
+
+def test_list_page_last_page_has_no_token():
+    list_fn = MagicMock(return_value=['a'])
+
+    items, token = list_page(list_fn, {}, 500, None)
+
+    list_fn.assert_called_once_with(per_page=100, get_all=False)
+    assert token is None
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+    url: str
+
+
+def test_select_fields_defaults_to_all_fields():
+    assert select_fields(Row, None) == ['id', 'name', 'url']
+    assert select_fields(Row, ['name', 'id', 'name']) == ['name', 'id']
+
+
+def test_select_fields_rejects_unknown_fields():
+    with pytest.raises(InvalidArgument, match='Unknown fields: size'):
+        select_fields(Row, ['id', 'size'])
+
+
+def test_project_items_tabular():
+    rows = [Row(1, 'a', 'u1'), Row(2, 'b', 'u2')]
+
+    table = project_items(rows, Row, ['id', 'name'], tabular=True, next_page_token='next')
+
+    assert table == Table(columns=['id', 'name'], rows=[[1, 'a'], [2, 'b']], next_page_token='next')
+
+
+def test_project_items_projection():
+    page = project_items([Row(1, 'a', 'u1')], Row, ['name'], tabular=False)
+
+    assert page == ProjectedPage(items=[{'name': 'a'}], next_page_token=None)
@@ -0,0 +1,121 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastmcp import FastMCP
+
+from gitlab_mcp.client import CompositeGitLabClient, TokenGitLabClient
+from gitlab_mcp.content_cache import ContentCache
+from gitlab_mcp.tools import merge_requests, repository
+from gitlab_mcp.tools.prefetch import Prefetcher
+from tests.gitlab_stub import DIFF, MERGE_REQUEST, MR_PATH, GitLabStub, StubResponse, paginate
+
+
+@pytest.fixture
+def gitlab_stub():
+    with GitLabStub() as stub:
+        yield stub
+
+
+@pytest.fixture
+def tools(gitlab_stub):
+    mcp = FastMCP('test')
+    service_client = TokenGitLabClient(gitlab_stub.url, 'service-token')
+    client = CompositeGitLabClient('user-token', service_client, gitlab_stub.url)
+    client.get_project('1')
+    client.get_user_project('1')
+    gitlab_stub.reset()
+
+    with patch('gitlab_mcp.tools.merge_requests.get_client', return_value=client):
+        merge_requests.register_tools(mcp, service_client, gitlab_stub.url)
+        yield {t.name: t for t in mcp._tool_manager._tools.values()}
+
+
+@pytest.mark.parametrize(('tool_name', 'kwargs', 'expected_call'), [
+    ('get_mr_commits', {}, ('GET', f'{MR_PATH}/commits')),
+    ('get_mr_pipelines', {}, ('GET', f'{MR_PATH}/pipelines')),
+    ('get_mr_discussions', {}, ('GET', f'{MR_PATH}/discussions')),
+    ('get_merge_request_changes', {}, ('GET', f'{MR_PATH}/diffs')),
+    ('add_mr_discussion', {'body': 'Looks good'}, ('POST', f'{MR_PATH}/discussions')),
+    ('add_merge_request_comment', {'body': 'Looks good'}, ('POST', f'{MR_PATH}/notes')),
+    ('approve_merge_request', {}, ('POST', f'{MR_PATH}/approve')),
+    ('unapprove_merge_request', {}, ('POST', f'{MR_PATH}/unapprove')),
+    ('merge_merge_request', {}, ('PUT', f'{MR_PATH}/merge')),
+])
+def test_merge_request_sub_resource_tools_issue_one_request(gitlab_stub, tools, tool_name, kwargs, expected_call):
+    result = asyncio.run(tools[tool_name].fn(project_id='1', mr_iid=1, **kwargs))
+
+    assert not getattr(result, 'isError', False)
+    assert dict(gitlab_stub.calls) == {expected_call: 1}
+
+
+def test_get_merge_request_issues_one_request_without_sections(gitlab_stub, tools):
+    asyncio.run(tools['get_merge_request'].fn(project_id='1', mr_iid=1, include=[]))
+
+    assert dict(gitlab_stub.calls) == {('GET', MR_PATH): 1}
+
+
+def test_review_context_fetches_merge_request_once(gitlab_stub, tools):
+    asyncio.run(tools['get_merge_request_review_context'].fn(project_id='1', mr_iid=1))
+
+    assert gitlab_stub.calls[('GET', MR_PATH)] == 1
+    assert gitlab_stub.total_calls == 7
+
+
+def test_full_changes_page_does_not_read_ahead(gitlab_stub, tools):
+    gitlab_stub.routes[('GET', f'{MR_PATH}/diffs')] = lambda query: paginate([DIFF] * 3, query)
+
+    first = asyncio.run(tools['get_merge_request_changes'].fn(project_id='1', mr_iid=1, limit=2))
+    second = asyncio.run(tools['get_merge_request_changes'].fn(
+        project_id='1', mr_iid=1, limit=2, page_token=first.next_page_token,
+    ))
+
+    assert len(first.changes) == 2
+    assert len(second.changes) == 1
+    assert second.next_page_token is None
+    assert dict(gitlab_stub.calls) == {('GET', f'{MR_PATH}/diffs'): 2}
+
+
+def test_prefetched_review_files_are_served_from_cache(gitlab_stub):
+    mcp = FastMCP('test')
+    service_client = TokenGitLabClient(gitlab_stub.url, 'service-token')
+    client = CompositeGitLabClient('user-token', service_client, gitlab_stub.url)
+    client.get_project('1')
+    content_cache = ContentCache(max_bytes=1024 * 1024)
+    prefetcher = Prefetcher(content_cache, session_bytes=1024 * 1024)
+    raw_path = '/projects/1/repository/files/app.py/raw'
+    gitlab_stub.routes[('GET', raw_path)] = lambda query: StubResponse(f'{query["ref"]}\n'.encode())
+    gitlab_stub.reset()
+    diff_refs = MERGE_REQUEST['diff_refs']
+
+    with (
+        patch('gitlab_mcp.tools.merge_requests.get_client', return_value=client),
+        patch('gitlab_mcp.tools.repository.get_client', return_value=client),
+    ):
+        merge_requests.register_tools(mcp, service_client, gitlab_stub.url, prefetcher=prefetcher)
+        repository.register_tools(mcp, service_client, gitlab_stub.url, content_cache=content_cache)
+        tools = {t.name: t for t in mcp._tool_manager._tools.values()}
+
+        asyncio.run(tools['get_merge_request_changes'].fn(project_id='1', mr_iid=1))
+        prefetcher._planner.shutdown(wait=True)
+        assert gitlab_stub.calls[('GET', raw_path)] == 2
+        gitlab_stub.reset()
+
+        base = asyncio.run(tools['get_file_content'].fn(project_id='1', file_path='app.py', ref=diff_refs['base_sha']))
+        head = asyncio.run(tools['get_file_content'].fn(project_id='1', file_path='app.py', ref=diff_refs['head_sha']))
+
+    assert base.content == f'{diff_refs["base_sha"]}\n'
+    assert head.content == f'{diff_refs["head_sha"]}\n'
+    assert gitlab_stub.total_calls == 0
+
+
+def test_merge_request_updates_poll_without_changes_issues_one_request(gitlab_stub, tools):
+    mr = {**MERGE_REQUEST, 'sha': 'b' * 40}
+    gitlab_stub.routes[('GET', '/projects/1/merge_requests')] = lambda query: [] if 'updated_after' in query else [mr]
+
+    baseline = asyncio.run(tools['get_merge_request_updates'].fn(project_id='1'))
+    gitlab_stub.reset()
+    updates = asyncio.run(tools['get_merge_request_updates'].fn(project_id='1', cursor=baseline.cursor))
+
+    assert updates.events == []
+    assert dict(gitlab_stub.calls) == {('GET', '/projects/1/merge_requests'): 1}
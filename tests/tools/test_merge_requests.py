@@ -1,12 +1,29 @@
+import asyncio
 from unittest.mock import MagicMock, patch
 
 from fastmcp import FastMCP
 
 from gitlab_mcp.tools import merge_requests
+from gitlab_mcp.tools.common import encode_page_token
 
 GITLAB_URL = 'https://gitlab.example.com'
 
 
+def make_pipeline(pipeline_id: int) -> MagicMock:
+    pipeline = MagicMock()
+    pipeline.attributes = {
+        'id': pipeline_id,
+        'sha': 'abc123',
+        'ref': 'feature',
+        'status': 'success',
+        'web_url': f'https://gitlab.example.com/group/test-project/-/pipelines/{pipeline_id}',
+        'created_at': '2024-01-01T00:00:00Z',
+        'updated_at': '2024-01-01T00:00:00Z',
+    }
+
+    return pipeline
+
+
 @patch('gitlab_mcp.tools.merge_requests.get_client')
 def test_search_merge_requests(mock_get_client, mock_client, mock_merge_request):
     mcp = FastMCP('test')
@@ -15,14 +32,15 @@ def test_search_merge_requests(mock_get_client, mock_client, mock_merge_request)
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'search_merge_requests')
-    result = tool.fn(state='opened', scope='all')
+    result = asyncio.run(tool.fn(state='opened', scope='all'))
 
-    assert len(result) == 1
-    assert result[0].iid == 1
-    assert result[0].title == 'Test MR'
+    assert len(result.items) == 1
+    assert result.items[0].iid == 1
+    assert result.items[0].title == 'Test MR'
     mock_get_client.return_value.list_merge_requests.assert_called_once_with(
-        iterator=True, state='opened', scope='all'
+        state='opened', scope='all', per_page=50, get_all=False
     )
+    assert result.next_page_token is None
 
 
 @patch('gitlab_mcp.tools.merge_requests.get_client')
@@ -35,12 +53,28 @@ def test_list_merge_requests(mock_get_client, mock_client, mock_merge_request):
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'list_merge_requests')
-    result = tool.fn(project_id='1')
+    result = asyncio.run(tool.fn(project_id='1'))
 
-    assert len(result) == 1
-    assert result[0].iid == 1
-    assert result[0].title == 'Test MR'
-    assert result[0].state == 'opened'
+    assert len(result.items) == 1
+    assert result.items[0].iid == 1
+    assert result.items[0].title == 'Test MR'
+    assert result.items[0].state == 'opened'
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_list_merge_requests_projects_fields(mock_get_client, mock_client, mock_merge_request):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.mergerequests.list.return_value = [mock_merge_request]
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'list_merge_requests')
+    result = asyncio.run(tool.fn(project_id='1', fields=['iid', 'title']))
+
+    assert result.items == [{'iid': 1, 'title': 'Test MR'}]
+    assert result.next_page_token is None
 
 
 @patch('gitlab_mcp.tools.merge_requests.get_client')
@@ -53,42 +87,97 @@ def test_get_merge_request(mock_get_client, mock_client, mock_merge_request):
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request')
-    result = tool.fn(project_id='1', mr_iid=1)
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1))
 
     assert result.iid == 1
     assert result.title == 'Test MR'
     assert result.description == 'Test description'
 
 
+def make_diff(path, diff='@@ -1 +1 @@\n-old\n+new'):
+    return {
+        'old_path': path,
+        'new_path': path,
+        'a_mode': '100644',
+        'b_mode': '100644',
+        'new_file': False,
+        'renamed_file': False,
+        'deleted_file': False,
+        'diff': diff,
+    }
+
+
 @patch('gitlab_mcp.tools.merge_requests.get_client')
 def test_get_merge_request_changes(mock_get_client, mock_client, mock_merge_request):
     mcp = FastMCP('test')
     mock_project = MagicMock()
-    mock_merge_request.changes.return_value = {
-        'changes': [
-            {
-                'old_path': 'file.py',
-                'new_path': 'file.py',
-                'a_mode': '100644',
-                'b_mode': '100644',
-                'new_file': False,
-                'renamed_file': False,
-                'deleted_file': False,
-                'diff': '@@ -1 +1 @@\n-old\n+new',
-            }
-        ]
-    }
+    mock_merge_request.manager.path = '/projects/1/merge_requests'
+    mock_merge_request.encoded_id = 1
+    mock_merge_request.manager.gitlab.http_list.return_value = iter([make_diff('file.py')])
     mock_project.mergerequests.get.return_value = mock_merge_request
     mock_get_client.return_value.get_project.return_value = mock_project
 
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request_changes')
-    result = tool.fn(project_id='1', mr_iid=1)
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1))
 
     assert len(result.changes) == 1
     assert result.changes[0].old_path == 'file.py'
     assert '@@ -1 +1 @@' in result.changes[0].diff
+    assert result.next_page_token is None
+    mock_project.mergerequests.get.assert_called_once_with(1, lazy=True)
+    mock_merge_request.manager.gitlab.http_list.assert_called_once_with(
+        '/projects/1/merge_requests/1/diffs',
+        query_data={'page': 1, 'per_page': 50},
+        iterator=True,
+    )
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_get_merge_request_changes_filters_and_pages(mock_get_client, mock_client, mock_merge_request):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    http_list = mock_merge_request.manager.gitlab.http_list
+    http_list.side_effect = lambda *args, **kwargs: iter(
+        [make_diff('a.py'), make_diff('b.md'), make_diff('c.py'), make_diff('d.py')]
+    )
+    mock_project.mergerequests.get.return_value = mock_merge_request
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request_changes')
+    first = asyncio.run(tool.fn(project_id='1', mr_iid=1, paths=['*.py'], limit=2))
+    second = asyncio.run(tool.fn(project_id='1', mr_iid=1, paths=['*.py'], limit=2, page_token=first.next_page_token))
+
+    assert [c.new_path for c in first.changes] == ['a.py', 'c.py']
+    assert first.next_page_token is not None
+    assert http_list.call_args.kwargs['query_data'] == {'page': 2, 'per_page': 2}
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_get_merge_request_changes_byte_budgets(mock_get_client, mock_client, mock_merge_request):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    big_diff = ''.join(f'+line {i}\n' for i in range(100))
+    mock_merge_request.manager.gitlab.http_list.return_value = iter(
+        [make_diff('a.py', big_diff), make_diff('b.py', big_diff), make_diff('c.py', big_diff)]
+    )
+    mock_project.mergerequests.get.return_value = mock_merge_request
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request_changes')
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1, max_file_bytes=100, max_total_bytes=150))
+
+    assert len(result.changes) == 1
+    assert result.changes[0].truncated is True
+    assert len(result.changes[0].diff.encode()) <= 100
+    assert result.changes[0].diff.endswith('\n')
+    assert result.truncated is True
+    assert result.next_page_token is not None
 
 
 @patch('gitlab_mcp.tools.merge_requests.get_client')
@@ -111,7 +200,7 @@ def test_get_mr_commits(mock_get_client, mock_client, mock_merge_request):
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_mr_commits')
-    result = tool.fn(project_id='1', mr_iid=1)
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1))
 
     assert len(result) == 1
     assert result[0].id == 'abc123'
@@ -122,24 +211,14 @@ def test_get_mr_commits(mock_get_client, mock_client, mock_merge_request):
 def test_get_mr_pipelines(mock_get_client, mock_client, mock_merge_request):
     mcp = FastMCP('test')
     mock_project = MagicMock()
-    mock_merge_request.pipelines.list.return_value = [
-        {
-            'id': 123,
-            'sha': 'abc123',
-            'ref': 'feature',
-            'status': 'success',
-            'web_url': 'https://gitlab.example.com/group/test-project/-/pipelines/123',
-            'created_at': '2024-01-01T00:00:00Z',
-            'updated_at': '2024-01-01T00:00:00Z',
-        }
-    ]
+    mock_merge_request.pipelines.list.return_value = [make_pipeline(123)]
     mock_project.mergerequests.get.return_value = mock_merge_request
     mock_get_client.return_value.get_project.return_value = mock_project
 
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_mr_pipelines')
-    result = tool.fn(project_id='1', mr_iid=1)
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1))
 
     assert len(result) == 1
     assert result[0].id == 123
@@ -175,7 +254,7 @@ def test_get_mr_discussions(mock_get_client, mock_client, mock_merge_request):
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_mr_discussions')
-    result = tool.fn(project_id='1', mr_iid=1)
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1))
 
     assert len(result) == 1
     assert result[0].id == 'disc123'
@@ -206,7 +285,7 @@ def test_add_mr_discussion(mock_get_client, mock_client, mock_merge_request):
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'add_mr_discussion')
-    result = tool.fn(project_id='1', mr_iid=1, body='New discussion')
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1, body='New discussion'))
 
     assert result.id == 'disc123'
     assert len(result.notes) == 1
@@ -228,7 +307,7 @@ def test_add_merge_request_comment(mock_get_client, mock_client, mock_merge_requ
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'add_merge_request_comment')
-    result = tool.fn(project_id='1', mr_iid=1, body='Test comment')
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1, body='Test comment'))
 
     assert result.id == 1
     assert result.body == 'Test comment'
@@ -244,12 +323,12 @@ def test_create_merge_request(mock_get_client, mock_client, mock_merge_request):
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'create_merge_request')
-    result = tool.fn(
+    result = asyncio.run(tool.fn(
         project_id='1',
         source_branch='feature',
         target_branch='main',
         title='Test MR',
-    )
+    ))
 
     assert result.iid == 1
     assert result.title == 'Test MR'
@@ -266,7 +345,7 @@ def test_approve_merge_request(mock_get_client, mock_client, mock_merge_request)
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'approve_merge_request')
-    result = tool.fn(project_id='1', mr_iid=1)
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1))
 
     mock_merge_request.approve.assert_called_once()
     assert result.status == 'approved'
@@ -283,7 +362,7 @@ def test_unapprove_merge_request(mock_get_client, mock_client, mock_merge_reques
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'unapprove_merge_request')
-    result = tool.fn(project_id='1', mr_iid=1)
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1))
 
     mock_merge_request.unapprove.assert_called_once()
     assert result.status == 'unapproved'
@@ -300,8 +379,300 @@ def test_merge_merge_request(mock_get_client, mock_client, mock_merge_request):
     merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'merge_merge_request')
-    result = tool.fn(project_id='1', mr_iid=1)
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1))
 
     mock_merge_request.merge.assert_called_once()
     assert result.status == 'merged'
     assert result.mr_iid == 1
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_get_merge_request_fetches_sub_resources(mock_get_client, mock_client, mock_merge_request):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_merge_request.approvals.get.return_value.approved_by = [{'user': {'username': 'reviewer'}}]
+    mock_emoji = MagicMock()
+    mock_emoji.name = 'thumbsup'
+    mock_merge_request.awardemojis.list.return_value = [mock_emoji]
+    mock_project.mergerequests.get.return_value = mock_merge_request
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request')
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1))
+
+    assert result.approved_by == ['reviewer']
+    assert result.reactions == ['thumbsup']
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_get_merge_request_include_skips_sections(mock_get_client, mock_client, mock_merge_request):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_merge_request.approvals.get.return_value.approved_by = [{'user': {'username': 'reviewer'}}]
+    mock_project.mergerequests.get.return_value = mock_merge_request
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request')
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1, include=['approvals']))
+
+    assert result.approved_by == ['reviewer']
+    assert result.reactions is None
+    mock_merge_request.awardemojis.list.assert_not_called()
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_get_merge_request_review_context(mock_get_client, mock_client, mock_merge_request):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_merge_request.manager.path = '/projects/1/merge_requests'
+    mock_merge_request.encoded_id = 1
+    mock_merge_request.manager.gitlab.http_list.return_value = iter([make_diff('a.py'), make_diff('b.py')])
+    mock_merge_request.approvals.get.return_value.approved_by = [{'user': {'username': 'reviewer'}}]
+    mock_merge_request.commits.return_value = iter([MagicMock(id='c1'), MagicMock(id='c2')])
+    mock_merge_request.pipelines.list.return_value = iter([make_pipeline(1), make_pipeline(2), make_pipeline(3)])
+    mock_project.mergerequests.get.return_value = mock_merge_request
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request_review_context')
+    result = asyncio.run(tool.fn(
+        project_id='1',
+        mr_iid=1,
+        exclude=['reactions', 'discussions'],
+        max_changes=1,
+        max_pipelines=2,
+    ))
+
+    assert result.merge_request.iid == 1
+    assert result.merge_request.approved_by == ['reviewer']
+    assert result.merge_request.reactions is None
+    assert [c.new_path for c in result.changes.changes] == ['a.py']
+    assert [c.id for c in result.commits] == ['c1', 'c2']
+    assert [p.id for p in result.pipelines] == [1, 2]
+    assert result.discussions is None
+    assert result.truncated_sections == ['changes', 'pipelines']
+    mock_project.mergerequests.get.assert_called_once_with(1)
+    mock_merge_request.awardemojis.list.assert_not_called()
+    mock_merge_request.discussions.list.assert_not_called()
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_get_merge_request_review_context_include(mock_get_client, mock_client, mock_merge_request):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_merge_request.commits.return_value = iter([])
+    mock_project.mergerequests.get.return_value = mock_merge_request
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request_review_context')
+    result = asyncio.run(tool.fn(project_id='1', mr_iid=1, include=['commits']))
+
+    assert result.commits == []
+    assert result.changes is None
+    assert result.pipelines is None
+    assert result.merge_request.approved_by is None
+    mock_merge_request.approvals.get.assert_not_called()
+
+
+def make_synced_mr(iid: int, updated_at: str, state: str = 'opened', sha: str = 'a' * 40, notes: int = 0):
+    mr = MagicMock()
+    mr.iid = iid
+    mr.title = f'MR {iid}'
+    mr.state = state
+    mr.web_url = f'https://gitlab.example.com/group/test-project/-/merge_requests/{iid}'
+    mr.created_at = '2024-01-01T00:00:00.000Z'
+    mr.updated_at = updated_at
+    mr.sha = sha
+    mr.user_notes_count = notes
+    mr.pipelines.list.return_value = iter([])
+
+    return mr
+
+
+def make_note(note_id: int, created_at: str, system: bool = False) -> MagicMock:
+    note = MagicMock()
+    note.created_at = created_at
+    note.system = system
+    note.attributes = {
+        'id': note_id,
+        'body': f'Note {note_id}',
+        'author': {'username': 'reviewer'},
+        'created_at': created_at,
+        'system': system,
+    }
+
+    return note
+
+
+def list_synced(baseline: list, updated: list):
+    def list_merge_requests(**kwargs):
+        if 'updated_after' in kwargs:
+            return iter(updated)
+        if kwargs.get('state') == 'opened':
+            return iter(baseline)
+
+        return baseline[-1:]
+
+    return list_merge_requests
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_get_merge_request_updates(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.id = 1
+    mock_get_client.return_value.get_project.return_value = mock_project
+    first = make_synced_mr(1, '2024-01-02T00:00:00.000Z', notes=1)
+    mock_project.mergerequests.list.side_effect = list_synced([first], [])
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request_updates')
+    baseline = asyncio.run(tool.fn(project_id='1'))
+
+    merged = make_synced_mr(1, '2024-01-03T00:00:00.000Z', state='merged', notes=2)
+    merged.notes.list.return_value = iter([
+        make_note(12, '2024-01-03T00:00:00.000Z'),
+        make_note(11, '2024-01-02T12:00:00.000Z', system=True),
+        make_note(10, '2024-01-01T00:00:00.000Z'),
+    ])
+    created = make_synced_mr(2, '2024-01-04T00:00:00.000Z')
+    created.created_at = '2024-01-04T00:00:00.000Z'
+    mock_project.mergerequests.list.side_effect = list_synced([], [first, merged, created])
+    updates = asyncio.run(tool.fn(project_id='1'))
+
+    assert baseline.events == []
+    assert [(e.type, e.mr_iid) for e in updates.events] == [
+        ('state_changed', 1),
+        ('note_added', 1),
+        ('opened', 2),
+    ]
+    assert updates.events[0].previous_state == 'opened'
+    assert updates.events[1].note.id == 12
+    assert updates.has_more is False
+    assert mock_project.mergerequests.list.call_args.kwargs == {
+        'updated_after': '2024-01-02T00:00:00.000Z',
+        'order_by': 'updated_at',
+        'sort': 'asc',
+        'iterator': True,
+    }
+
+    mock_project.mergerequests.list.side_effect = list_synced([], [created])
+    assert asyncio.run(tool.fn(project_id='1', cursor=updates.cursor)).events == []
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_get_merge_request_updates_tracks_running_pipelines(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.id = 1
+    mock_get_client.return_value.get_project.return_value = mock_project
+    mr = make_synced_mr(1, '2024-01-02T00:00:00.000Z')
+    mock_project.mergerequests.list.side_effect = list_synced([mr], [])
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request_updates')
+    asyncio.run(tool.fn(project_id='1'))
+
+    pushed = make_synced_mr(1, '2024-01-03T00:00:00.000Z', sha='b' * 40)
+    running = make_pipeline(55)
+    running.attributes['status'] = 'running'
+    pushed.pipelines.list.return_value = iter([running])
+    mock_project.mergerequests.list.side_effect = list_synced([], [pushed])
+    started = asyncio.run(tool.fn(project_id='1'))
+
+    mock_project.mergerequests.list.side_effect = list_synced([], [])
+    mock_project.mergerequests.get.return_value.pipelines.list.return_value = iter([make_pipeline(55)])
+    finished = asyncio.run(tool.fn(project_id='1'))
+
+    assert [(e.type, e.pipeline and e.pipeline.status) for e in started.events] == [
+        ('updated', None),
+        ('pipeline_changed', 'running'),
+    ]
+    assert [(e.type, e.pipeline.status) for e in finished.events] == [('pipeline_changed', 'success')]
+    mock_project.mergerequests.get.assert_called_once_with(1, lazy=True)
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_get_merge_request_updates_survive_token_refresh(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.id = 1
+    mock_get_client.return_value.get_project.return_value = mock_project
+    mock_get_client.return_value.get_user_id.return_value = 7
+    mr = make_synced_mr(1, '2024-01-02T00:00:00.000Z')
+    mock_project.mergerequests.list.side_effect = list_synced([mr], [])
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request_updates')
+    asyncio.run(tool.fn(project_id='1'))
+
+    refreshed = MagicMock()
+    refreshed.get_project.return_value = mock_project
+    refreshed.get_user_id.return_value = 7
+    mock_get_client.return_value = refreshed
+    merged = make_synced_mr(1, '2024-01-03T00:00:00.000Z', state='merged')
+    mock_project.mergerequests.list.side_effect = list_synced([], [merged])
+    updates = asyncio.run(tool.fn(project_id='1'))
+
+    assert [(e.type, e.mr_iid) for e in updates.events] == [('state_changed', 1)]
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_get_merge_request_updates_replays_repeated_cursor(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.id = 1
+    mock_get_client.return_value.get_project.return_value = mock_project
+    mr = make_synced_mr(1, '2024-01-02T00:00:00.000Z')
+    mock_project.mergerequests.list.side_effect = list_synced([mr], [])
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request_updates')
+    baseline = asyncio.run(tool.fn(project_id='1'))
+
+    merged = make_synced_mr(1, '2024-01-03T00:00:00.000Z', state='merged')
+    mock_project.mergerequests.list.side_effect = list_synced([], [merged])
+    first = asyncio.run(tool.fn(project_id='1', cursor=baseline.cursor))
+    retry = asyncio.run(tool.fn(project_id='1', cursor=baseline.cursor))
+
+    assert [e.type for e in first.events] == ['state_changed']
+    assert [e.type for e in retry.events] == ['state_changed']
+    assert retry.cursor == first.cursor
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_get_merge_request_updates_rejects_unknown_cursor(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_get_client.return_value.get_project.return_value.id = 1
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request_updates')
+    result = asyncio.run(tool.fn(project_id='1', cursor=encode_page_token({'snapshot': '0' * 16})))
+
+    assert result.isError is True
+    assert 'expired' in result.content[0].text
+
+
+@patch('gitlab_mcp.tools.merge_requests.get_client')
+def test_get_merge_request_updates_rejects_invalid_cursor(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_get_client.return_value.get_project.return_value.id = 1
+
+    merge_requests.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_merge_request_updates')
+    result = asyncio.run(tool.fn(project_id='1', cursor='eyJ1cGRhdGVkX2FmdGVyIjogIm5vdCBhIGRhdGUifQ=='))
+
+    assert result.isError is True
@@ -0,0 +1,140 @@
+from unittest.mock import MagicMock, patch
+
+import gitlab.exceptions
+
+from gitlab_mcp.content_cache import ContentCache
+from gitlab_mcp.tools.merge_requests import MergeRequestChange
+from gitlab_mcp.tools.prefetch import Prefetcher
+from gitlab_mcp.tools.repository import FileContent, file_cache_key
+
+BASE_SHA = 'a' * 40
+HEAD_SHA = 'b' * 40
+DIFF_REFS = {'base_sha': BASE_SHA, 'head_sha': HEAD_SHA, 'start_sha': BASE_SHA}
+
+
+def make_change(old_path: str, new_path: str | None = None, new_file: bool = False, deleted_file: bool = False):
+    return MergeRequestChange(
+        old_path=old_path,
+        new_path=new_path or old_path,
+        a_mode='100644',
+        b_mode='100644',
+        new_file=new_file,
+        renamed_file=new_path is not None,
+        deleted_file=deleted_file,
+        diff='',
+    )
+
+
+def make_content(project, file_path: str, ref: str, max_bytes: int | None = None) -> FileContent:
+    return FileContent(
+        file_path=file_path,
+        file_name=file_path.rsplit('/', 1)[-1],
+        size=10,
+        encoding='utf-8',
+        content=f'{ref[:1]}:{file_path}\n',
+        ref=ref,
+        last_commit_id=ref,
+    )
+
+
+def make_project() -> MagicMock:
+    project = MagicMock()
+    project.id = 1
+    project.path_with_namespace = 'group/test-project'
+
+    return project
+
+
+def make_merge_request(diff_refs: dict | None = DIFF_REFS) -> MagicMock:
+    mr = MagicMock()
+    mr.iid = 1
+    mr.attributes = {'iid': 1} if diff_refs is None else {'iid': 1, 'diff_refs': diff_refs}
+
+    return mr
+
+
+def run(prefetcher: Prefetcher, project, mr, changes) -> None:
+    prefetcher.prefetch_changes(project, mr, changes)
+    prefetcher._planner.shutdown(wait=True)
+
+
+@patch('gitlab_mcp.tools.prefetch.read_raw_file', side_effect=make_content)
+def test_prefetch_reads_base_and_head_blobs(mock_read):
+    cache = ContentCache(max_bytes=1024 * 1024)
+    project = make_project()
+    changes = [
+        make_change('app.py'),
+        make_change('new.py', new_file=True),
+        make_change('old.py', deleted_file=True),
+        make_change('before.py', 'after.py'),
+    ]
+
+    run(Prefetcher(cache, session_bytes=1024), project, make_merge_request(), changes)
+
+    assert sorted(c.args[1:3] for c in mock_read.call_args_list) == [
+        ('after.py', HEAD_SHA),
+        ('app.py', BASE_SHA),
+        ('app.py', HEAD_SHA),
+        ('before.py', BASE_SHA),
+        ('new.py', HEAD_SHA),
+        ('old.py', BASE_SHA),
+    ]
+    assert cache.get(file_cache_key(1, HEAD_SHA, 'app.py'))['content'] == 'b:app.py\n'
+    assert cache.get(file_cache_key(1, BASE_SHA, 'app.py'))['content'] == 'a:app.py\n'
+
+
+@patch('gitlab_mcp.tools.prefetch.read_raw_file', side_effect=make_content)
+def test_prefetch_fetches_diff_refs_for_lazy_merge_request(mock_read):
+    mr = make_merge_request(diff_refs=None)
+    mr.manager.get.return_value.diff_refs = DIFF_REFS
+
+    run(Prefetcher(ContentCache(max_bytes=1024 * 1024), session_bytes=1024), make_project(), mr, [make_change('a.py')])
+
+    mr.manager.get.assert_called_once_with(1)
+    assert mock_read.call_count == 2
+
+
+@patch('gitlab_mcp.tools.prefetch.read_raw_file', side_effect=make_content)
+def test_prefetch_skips_cached_files(mock_read):
+    cache = ContentCache(max_bytes=1024 * 1024)
+    cache.set(file_cache_key(1, BASE_SHA, 'a.py'), {'content': 'cached'})
+
+    run(Prefetcher(cache, session_bytes=1024), make_project(), make_merge_request(), [make_change('a.py')])
+
+    assert [c.args[1:3] for c in mock_read.call_args_list] == [('a.py', HEAD_SHA)]
+
+
+@patch('gitlab_mcp.tools.prefetch.read_raw_file', side_effect=make_content)
+def test_prefetch_stops_at_session_budget(mock_read):
+    prefetcher = Prefetcher(ContentCache(max_bytes=1024 * 1024), session_bytes=10, max_concurrency=1)
+    changes = [make_change('a.py'), make_change('b.py')]
+
+    run(prefetcher, make_project(), make_merge_request(), changes)
+
+    assert mock_read.call_count == 2
+
+    prefetcher._planner = MagicMock()
+    prefetcher.prefetch_changes(make_project(), make_merge_request(), changes)
+
+    prefetcher._planner.submit.assert_not_called()
+
+
+@patch('gitlab_mcp.tools.prefetch.read_raw_file')
+def test_prefetch_skips_mirrored_projects(mock_read):
+    mirror = MagicMock()
+    mirror.covers.return_value = True
+    prefetcher = Prefetcher(ContentCache(max_bytes=1024), session_bytes=1024, mirror=mirror)
+
+    run(prefetcher, make_project(), make_merge_request(), [make_change('a.py')])
+
+    mock_read.assert_not_called()
+
+
+@patch('gitlab_mcp.tools.prefetch.read_raw_file', side_effect=gitlab.exceptions.GitlabGetError('404 Not Found', 404))
+def test_prefetch_ignores_fetch_errors(mock_read):
+    cache = ContentCache(max_bytes=1024)
+
+    run(Prefetcher(cache, session_bytes=1024), make_project(), make_merge_request(), [make_change('a.py')])
+
+    assert mock_read.call_count == 2
+    assert cache.get(file_cache_key(1, HEAD_SHA, 'a.py')) is None
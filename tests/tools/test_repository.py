@@ -1,44 +1,79 @@
+import asyncio
+import io
 from unittest.mock import MagicMock, patch
 
+import gitlab.exceptions
+import pytest
+import requests
 from fastmcp import FastMCP
 
+from gitlab_mcp.client import TokenGitLabClient
+from gitlab_mcp.content_cache import ContentCache
+from gitlab_mcp.mirror import GitError, MirrorRepository, RepositoryMirror
+from gitlab_mcp.search_index import SearchIndexCache
 from gitlab_mcp.tools import repository
+from gitlab_mcp.tools.common import encode_page_token
+from tests.git_remote import GitRemote
+from tests.gitlab_stub import PROJECT, ROUTES, GitLabStub, StubResponse, make_tar
 
 GITLAB_URL = 'https://gitlab.example.com'
+EMPTY_BLOB = 'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391'
+
+
+def make_tree_response(items: list[dict]) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = items
+    response.links = {}
+
+    return response
+
+
+def make_raw_response(file_path: str, content: bytes, chunk_size: int = 4) -> MagicMock:
+    response = MagicMock()
+    response.headers = {
+        'X-Gitlab-File-Path': file_path,
+        'X-Gitlab-File-Name': file_path.rsplit('/', 1)[-1],
+        'X-Gitlab-Size': str(len(content)),
+        'X-Gitlab-Ref': 'main',
+        'X-Gitlab-Last-Commit-Id': 'abc123',
+    }
+    response.iter_content.return_value = iter([content[i:i + chunk_size] for i in range(0, len(content), chunk_size)])
+
+    return response
 
 
 @patch('gitlab_mcp.tools.repository.get_client')
-def test_list_projects(mock_get_client, mock_client, mock_project):
+def test_list_projects(mock_get_client, mock_client):
     mcp = FastMCP('test')
-    mock_get_client.return_value.list_projects.return_value = [mock_project]
+    mock_get_client.return_value.list_projects.return_value = [PROJECT]
 
     repository.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'list_projects')
-    result = tool.fn()
+    result = asyncio.run(tool.fn())
 
-    assert len(result) == 1
-    assert result[0].id == 1
-    assert result[0].name == 'test-project'
+    assert len(result.items) == 1
+    assert result.items[0].id == 1
+    assert result.items[0].name == 'test-project'
 
 
 @patch('gitlab_mcp.tools.repository.get_client')
 def test_get_repository_tree(mock_get_client, mock_client):
     mcp = FastMCP('test')
     mock_project = MagicMock()
-    mock_project.repository_tree.return_value = [
+    mock_project.manager.gitlab.http_request.return_value = make_tree_response([
         {'id': 'abc123', 'name': 'README.md', 'type': 'blob', 'path': 'README.md', 'mode': '100644'},
-    ]
+    ])
     mock_get_client.return_value.get_project.return_value = mock_project
 
     repository.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_repository_tree')
-    result = tool.fn(project_id='1')
+    result = asyncio.run(tool.fn(project_id='1'))
 
-    assert len(result) == 1
-    assert result[0].name == 'README.md'
-    assert result[0].type == 'blob'
+    assert len(result.items) == 1
+    assert result.items[0].name == 'README.md'
+    assert result.items[0].type == 'blob'
     mock_get_client.assert_called_once()
 
 
@@ -46,21 +81,13 @@ def test_get_repository_tree(mock_get_client, mock_client):
 def test_get_file_content(mock_get_client, mock_client):
     mcp = FastMCP('test')
     mock_project = MagicMock()
-    mock_file = MagicMock()
-    mock_file.file_path = 'README.md'
-    mock_file.file_name = 'README.md'
-    mock_file.size = 100
-    mock_file.encoding = 'base64'
-    mock_file.decode.return_value = b'# Test'
-    mock_file.ref = 'main'
-    mock_file.last_commit_id = 'abc123'
-    mock_project.files.get.return_value = mock_file
+    mock_project.manager.gitlab.http_get.return_value = make_raw_response('README.md', b'# Test')
     mock_get_client.return_value.get_project.return_value = mock_project
 
     repository.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_file_content')
-    result = tool.fn(project_id='1', file_path='README.md')
+    result = asyncio.run(tool.fn(project_id='1', file_path='README.md'))
 
     assert result.file_path == 'README.md'
     assert result.content == '# Test'
@@ -87,7 +114,7 @@ def test_get_file_blame(mock_get_client, mock_client):
     repository.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_file_blame')
-    result = tool.fn(project_id='1', file_path='README.md')
+    result = asyncio.run(tool.fn(project_id='1', file_path='README.md'))
 
     assert len(result) == 1
     assert result[0].commit.id == 'abc123'
@@ -114,7 +141,7 @@ def test_search_code(mock_get_client, mock_client):
     repository.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'search_code')
-    result = tool.fn(project_id='1', query='def test')
+    result = asyncio.run(tool.fn(project_id='1', query='def test'))
 
     assert len(result) == 1
     assert result[0].path == 'src/test.py'
@@ -144,11 +171,11 @@ def test_list_branches(mock_get_client, mock_client):
     repository.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'list_branches')
-    result = tool.fn(project_id='1')
+    result = asyncio.run(tool.fn(project_id='1'))
 
-    assert len(result) == 1
-    assert result[0].name == 'main'
-    assert result[0].default is True
+    assert len(result.items) == 1
+    assert result.items[0].name == 'main'
+    assert result.items[0].default is True
 
 
 @patch('gitlab_mcp.tools.repository.get_client')
@@ -172,11 +199,46 @@ def test_list_commits(mock_get_client, mock_client):
     repository.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'list_commits')
-    result = tool.fn(project_id='1')
+    result = asyncio.run(tool.fn(project_id='1'))
 
-    assert len(result) == 1
-    assert result[0].id == 'abc123'
-    assert result[0].title == 'Test commit'
+    assert len(result.items) == 1
+    assert result.items[0].id == 'abc123'
+    assert result.items[0].title == 'Test commit'
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_get_repository_tree_tabular(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.default_branch = 'main'
+    mock_project.manager.gitlab.http_request.return_value = make_tree_response([
+        {'id': 'a1', 'name': 'a.py', 'type': 'blob', 'path': 'src/a.py', 'mode': '100644'},
+        {'id': 'b2', 'name': 'b.py', 'type': 'blob', 'path': 'src/b.py', 'mode': '100644'},
+    ])
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_repository_tree')
+    result = asyncio.run(tool.fn(project_id='1', recursive=True, fields=['path', 'type'], tabular=True))
+
+    assert result.columns == ['path', 'type']
+    assert result.rows == [['src/a.py', 'blob'], ['src/b.py', 'blob']]
+    assert result.next_page_token is None
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_list_commits_unknown_field(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_get_client.return_value.get_project.return_value.commits.list.return_value = []
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'list_commits')
+    result = asyncio.run(tool.fn(project_id='1', fields=['sha']))
+
+    assert result.isError is True
+    assert 'Unknown fields: sha' in result.content[0].text
 
 
 @patch('gitlab_mcp.tools.repository.get_client')
@@ -202,8 +264,576 @@ def test_get_commit(mock_get_client, mock_client):
     repository.register_tools(mcp, mock_client, GITLAB_URL)
 
     tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_commit')
-    result = tool.fn(project_id='1', sha='abc123')
+    result = asyncio.run(tool.fn(project_id='1', sha='abc123'))
 
     assert result.id == 'abc123'
     assert result.stats['additions'] == 10
     assert result.parent_ids == ['parent123']
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_list_projects_keyset_pagination(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    list_projects_mock = mock_get_client.return_value.list_projects
+    list_projects_mock.return_value = [PROJECT]
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'list_projects')
+    first = asyncio.run(tool.fn(limit=1))
+    asyncio.run(tool.fn(limit=1, page_token=first.next_page_token))
+
+    assert first.next_page_token is not None
+    list_projects_mock.assert_called_with(
+        pagination='keyset',
+        order_by='id',
+        sort='asc',
+        id_after=1,
+        per_page=1,
+        get_all=False,
+    )
+
+
+def test_get_repository_tree_follows_keyset_link():
+    items = [
+        {'id': EMPTY_BLOB, 'name': '__init__.py', 'type': 'blob', 'path': f'{name}/__init__.py', 'mode': '100644'}
+        for name in ('a', 'b', 'c')
+    ]
+
+    def tree(query):
+        start = int(query.get('page_token', 'cursor-0').removeprefix('cursor-'))
+        per_page = int(query['per_page'])
+        end = start + per_page
+        next_query = {**query, 'page_token': f'cursor-{end}'} if end < len(items) else None
+
+        return StubResponse(items[start:end], next_query=next_query)
+
+    with GitLabStub({**ROUTES, ('GET', '/projects/1/repository/tree'): tree}) as stub:
+        mcp = FastMCP('test')
+        client = TokenGitLabClient(stub.url, 'test-token')
+        with patch('gitlab_mcp.tools.repository.get_client', return_value=client):
+            repository.register_tools(mcp, client, stub.url)
+            tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_repository_tree')
+            first = asyncio.run(tool.fn(project_id='1', recursive=True, limit=2))
+            second = asyncio.run(tool.fn(project_id='1', recursive=True, limit=2, page_token=first.next_page_token))
+
+    assert [i.path for i in first.items] == ['a/__init__.py', 'b/__init__.py']
+    assert [i.path for i in second.items] == ['c/__init__.py']
+    assert second.next_page_token is None
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_list_commits_invalid_page_token(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'list_commits')
+    result = asyncio.run(tool.fn(project_id='1', page_token='not-a-token'))
+
+    assert result.isError is True
+    assert 'Invalid page_token' in result.content[0].text
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_get_file_content_uses_content_cache(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.id = 1
+    mock_project.default_branch = 'main'
+    mock_project.commits.get.return_value.id = 'a' * 40
+    mock_project.manager.gitlab.http_get.return_value = make_raw_response('README.md', b'# Test')
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL, content_cache=ContentCache(max_bytes=1024))
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_file_content')
+    first = asyncio.run(tool.fn(project_id='1', file_path='README.md'))
+    second = asyncio.run(tool.fn(project_id='1', file_path='README.md'))
+
+    assert first == second
+    assert second.content == '# Test'
+    assert second.ref == 'main'
+    mock_project.manager.gitlab.http_get.assert_called_once()
+    assert mock_project.manager.gitlab.http_get.call_args.kwargs['query_data'] == {'ref': 'a' * 40}
+    mock_project.commits.get.assert_called_once_with('main')
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_get_commit_uses_content_cache_for_sha(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.id = 1
+    mock_commit = MagicMock()
+    mock_commit.id = 'a' * 40
+    mock_commit.short_id = 'aaaaaaaa'
+    mock_commit.title = 'Test commit'
+    mock_commit.message = 'Test commit message'
+    mock_commit.author_name = 'Test User'
+    mock_commit.author_email = 'test@example.com'
+    mock_commit.authored_date = '2024-01-01T00:00:00Z'
+    mock_commit.committer_name = 'Test User'
+    mock_commit.committed_date = '2024-01-01T00:00:00Z'
+    mock_commit.web_url = 'https://gitlab.example.com/group/test-project/-/commit/aaaaaaaa'
+    mock_commit.parent_ids = []
+    mock_commit.stats = {'additions': 1, 'deletions': 0, 'total': 1}
+    mock_project.commits.get.return_value = mock_commit
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL, content_cache=ContentCache(max_bytes=4096))
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_commit')
+    asyncio.run(tool.fn(project_id='1', sha='a' * 40))
+    result = asyncio.run(tool.fn(project_id='1', sha='a' * 40))
+
+    assert result.stats['additions'] == 1
+    mock_project.commits.get.assert_called_once_with('a' * 40)
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_get_files(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.id = 1
+    mock_project.default_branch = 'main'
+    mock_project.commits.get.return_value.id = 'a' * 40
+    mock_project.files.path = '/projects/1/repository/files'
+    files = {'README.md': b'# Test', 'src%2Fapp.py': b'print()'}
+
+    def http_get(path, query_data, streamed, raw):
+        file_path = path.split('/')[-2]
+        if file_path not in files:
+            raise gitlab.exceptions.GitlabHttpError('404 File Not Found', 404)
+        return make_raw_response(file_path, files[file_path])
+
+    mock_project.manager.gitlab.http_get.side_effect = http_get
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL, content_cache=ContentCache(max_bytes=1024))
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_files')
+    result = asyncio.run(tool.fn(project_id='1', file_paths=['README.md', 'missing.txt', 'src/app.py']))
+
+    assert [r.file_path for r in result] == ['README.md', 'missing.txt', 'src/app.py']
+    assert result[0].file.content == '# Test'
+    assert result[0].file.ref == 'main'
+    assert result[1].file is None
+    assert '404' in result[1].error
+    assert result[2].file.content == 'print()'
+    mock_get_client.return_value.get_project.assert_called_once_with('1')
+    mock_project.commits.get.assert_called_once_with('main')
+    mock_project.manager.gitlab.http_get.assert_any_call(
+        '/projects/1/repository/files/src%2Fapp.py/raw',
+        query_data={'ref': 'a' * 40},
+        streamed=True,
+        raw=True,
+    )
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_get_files_reports_connection_errors_per_file(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.commits.get.return_value.id = 'a' * 40
+    mock_project.files.path = '/projects/1/repository/files'
+
+    def http_get(path, query_data, streamed, raw):
+        if 'flaky.py' in path:
+            raise requests.ConnectionError('Connection reset by peer')
+        return make_raw_response('README.md', b'# Test')
+
+    mock_project.manager.gitlab.http_get.side_effect = http_get
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_files')
+    result = asyncio.run(tool.fn(project_id='1', file_paths=['README.md', 'flaky.py']))
+
+    assert result[0].file.content == '# Test'
+    assert result[1].file is None
+    assert 'Connection reset' in result[1].error
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_get_files_rejects_oversized_batch(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_files')
+    result = asyncio.run(tool.fn(project_id='1', file_paths=['f'] * (repository.MAX_BATCH_FILES + 1)))
+
+    assert result.isError is True
+    mock_get_client.assert_not_called()
+
+
+def test_read_raw_file_line_range():
+    mock_project = MagicMock()
+    content = b''.join(b'line %d\n' % i for i in range(1, 101))
+    response = make_raw_response('big.txt', content)
+    mock_project.manager.gitlab.http_get.return_value = response
+
+    result = repository.read_raw_file(mock_project, 'big.txt', 'main', start_line=20, end_line=22)
+
+    assert result.content == 'line 20\nline 21\nline 22\n'
+    assert result.size == len(content)
+    assert result.truncated is False
+    response.close.assert_called_once()
+
+
+def test_read_raw_file_last_line_without_newline():
+    mock_project = MagicMock()
+    mock_project.manager.gitlab.http_get.return_value = make_raw_response('a.txt', b'one\ntwo')
+
+    result = repository.read_raw_file(mock_project, 'a.txt', 'main', start_line=2)
+
+    assert result.content == 'two'
+
+
+def test_read_raw_file_truncates_at_line_boundary():
+    mock_project = MagicMock()
+    mock_project.manager.gitlab.http_get.return_value = make_raw_response('a.txt', b'aaaa\nbbbb\ncccc\n')
+
+    result = repository.read_raw_file(mock_project, 'a.txt', 'main', max_bytes=12)
+
+    assert result.content == 'aaaa\nbbbb\n'
+    assert result.truncated is True
+
+
+def test_read_raw_file_stops_streaming_a_long_single_line():
+    mock_project = MagicMock()
+    chunks = [b'x' * 1024 for _ in range(1000)]
+    response = make_raw_response('bundle.min.js', b'')
+    response.iter_content.return_value = iter(chunks)
+    mock_project.manager.gitlab.http_get.return_value = response
+
+    result = repository.read_raw_file(mock_project, 'bundle.min.js', 'main', max_bytes=4096)
+
+    assert result.content == 'x' * 4096
+    assert result.truncated is True
+    assert len(list(response.iter_content.return_value)) == 995
+
+
+def test_read_raw_file_skips_long_lines_before_range():
+    mock_project = MagicMock()
+    content = b'x' * 100000 + b'\nsecond\nthird\n'
+    mock_project.manager.gitlab.http_get.return_value = make_raw_response('a.txt', content, 1024)
+
+    result = repository.read_raw_file(mock_project, 'a.txt', 'main', start_line=2, end_line=2, max_bytes=64)
+
+    assert result.content == 'second\n'
+    assert result.truncated is False
+
+
+def test_read_raw_file_detects_binary():
+    mock_project = MagicMock()
+    mock_project.manager.gitlab.http_get.return_value = make_raw_response('logo.png', b'\x89PNG\x00\x00data', 64)
+
+    result = repository.read_raw_file(mock_project, 'logo.png', 'main')
+
+    assert result.binary is True
+    assert result.encoding == 'binary'
+    assert result.content == ''
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_get_file_content_rejects_invalid_line_range(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_file_content')
+    result = asyncio.run(tool.fn(project_id='1', file_path='README.md', start_line=10, end_line=5))
+
+    assert result.isError is True
+    mock_get_client.assert_not_called()
+
+
+def make_blame_entry(commit_id: str, lines: list[str]) -> dict:
+    return {
+        'commit': {
+            'id': commit_id,
+            'parent_ids': [],
+            'author_name': 'Test User',
+            'author_email': 'test@example.com',
+            'message': f'Commit {commit_id}',
+            'authored_date': '2024-01-01T00:00:00Z',
+            'committed_date': '2024-01-01T00:00:00Z',
+        },
+        'lines': lines,
+    }
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_get_file_blame_line_range(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.files.blame.return_value = [make_blame_entry('abc123', ['line10'])]
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_file_blame')
+    result = asyncio.run(tool.fn(project_id='1', file_path='README.md', ref='main', start_line=10, end_line=10))
+
+    assert result[0].lines == ['line10']
+    mock_project.files.blame.assert_called_once_with(
+        'README.md',
+        'main',
+        query_parameters={'range[start]': 10, 'range[end]': 10},
+    )
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_get_file_blame_compact(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.files.blame.return_value = [
+        make_blame_entry('aaa', ['1', '2']),
+        make_blame_entry('bbb', ['3']),
+        make_blame_entry('aaa', ['4', '5', '6']),
+        make_blame_entry('aaa', ['7']),
+    ]
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_file_blame')
+    result = asyncio.run(tool.fn(project_id='1', file_path='README.md', start_line=2, compact=True))
+
+    assert [c.id for c in result.commits] == ['aaa', 'bbb']
+    assert [(r.start_line, r.end_line, r.commit) for r in result.ranges] == [(2, 2, 0), (3, 3, 1), (4, 7, 0)]
+    mock_project.files.blame.assert_called_once_with('README.md', mock_project.default_branch)
+
+
+@pytest.fixture
+def mirrored(tmp_path):
+    remote = GitRemote(tmp_path / 'remote', 'group/test-project')
+    remote.commit({'README.md': 'hello\n', 'src/app.py': 'import os\nprint(1)\n'}, 'Initial commit')
+    mirror = RepositoryMirror(tmp_path / 'mirrors', remote.url, None, ['group/test-project'], fetch_interval=3600)
+    project = MagicMock()
+    project.id = 1
+    project.path_with_namespace = 'group/test-project'
+    project.default_branch = 'main'
+    mirror.sync(project)
+
+    return mirror, project
+
+
+def mirrored_tools(mock_get_client, mock_client, mirrored):
+    mirror, project = mirrored
+    mock_get_client.return_value.get_project.return_value = project
+    mcp = FastMCP('test')
+    repository.register_tools(mcp, mock_client, GITLAB_URL, mirror=mirror)
+
+    return {t.name: t for t in mcp._tool_manager._tools.values()}
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_mirrored_tools_read_local_repository(mock_get_client, mock_client, mirrored):
+    tools = mirrored_tools(mock_get_client, mock_client, mirrored)
+    project = mirrored[1]
+
+    content = asyncio.run(tools['get_file_content'].fn(project_id='1', file_path='src/app.py', start_line=2))
+    tree = asyncio.run(tools['get_repository_tree'].fn(project_id='1', recursive=True, limit=2))
+    rest = asyncio.run(tools['get_repository_tree'].fn(project_id='1', recursive=True, page_token=tree.next_page_token))
+    blame = asyncio.run(tools['get_file_blame'].fn(project_id='1', file_path='README.md', compact=True))
+    search = asyncio.run(tools['search_code'].fn(project_id='1', query='print'))
+    commits = asyncio.run(tools['list_commits'].fn(project_id='1'))
+
+    assert content.content == 'print(1)\n'
+    assert content.ref == 'main'
+    assert [i.path for i in tree.items + rest.items] == ['README.md', 'src', 'src/app.py']
+    assert blame.ranges[0].end_line == 1
+    assert [(r.path, r.basename, r.startline, r.data) for r in search] == [('src/app.py', 'src/app', 2, 'print(1)')]
+    assert commits.items[0].title == 'Initial commit'
+    assert commits.items[0].web_url == f'{GITLAB_URL}/group/test-project/-/commit/{commits.items[0].id}'
+    project.files.blame.assert_not_called()
+    project.manager.gitlab.http_request.assert_not_called()
+    project.search.assert_not_called()
+    project.commits.list.assert_not_called()
+    project.manager.gitlab.http_get.assert_not_called()
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_mirrored_tree_pages_past_duplicate_blobs(mock_get_client, mock_client, tmp_path):
+    remote = GitRemote(tmp_path / 'remote', 'group/test-project')
+    remote.commit({'a/__init__.py': '', 'b/__init__.py': '', 'c/__init__.py': ''}, 'Add packages')
+    mirror = RepositoryMirror(tmp_path / 'mirrors', remote.url, None, ['group/test-project'], fetch_interval=3600)
+    project = MagicMock(id=1, path_with_namespace='group/test-project', default_branch='main')
+    mirror.sync(project)
+    tools = mirrored_tools(mock_get_client, mock_client, (mirror, project))
+
+    paths = []
+    page_token = None
+    for _ in range(5):
+        page = asyncio.run(tools['get_repository_tree'].fn(
+            project_id='1', recursive=True, limit=2, page_token=page_token,
+        ))
+        paths += [i.path for i in page.items]
+        page_token = page.next_page_token
+        if page_token is None:
+            break
+
+    assert page_token is None
+    assert paths == ['a', 'a/__init__.py', 'b', 'b/__init__.py', 'c', 'c/__init__.py']
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_mirrored_tree_lists_each_commit_once(mock_get_client, mock_client, mirrored):
+    tools = mirrored_tools(mock_get_client, mock_client, mirrored)
+
+    with patch.object(MirrorRepository, 'tree', autospec=True, side_effect=MirrorRepository.tree) as mock_tree:
+        first = asyncio.run(tools['get_repository_tree'].fn(project_id='1', recursive=True, limit=1))
+        second = asyncio.run(tools['get_repository_tree'].fn(
+            project_id='1', recursive=True, limit=1, page_token=first.next_page_token,
+        ))
+
+    assert [i.path for i in first.items + second.items] == ['README.md', 'src']
+    assert mock_tree.call_count == 1
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_mirrored_tree_continues_api_cursor_through_api(mock_get_client, mock_client, mirrored):
+    tools = mirrored_tools(mock_get_client, mock_client, mirrored)
+    project = mirrored[1]
+    project.manager.gitlab.http_request.return_value = make_tree_response([
+        {'id': EMPTY_BLOB, 'name': 'late.py', 'type': 'blob', 'path': 'late.py', 'mode': '100644'},
+    ])
+
+    page = asyncio.run(tools['get_repository_tree'].fn(
+        project_id='1', page_token=encode_page_token({'page_token': 'cursor-1'}),
+    ))
+
+    assert [i.path for i in page.items] == ['late.py']
+    assert project.manager.gitlab.http_request.call_args.kwargs['query_data']['page_token'] == 'cursor-1'
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_get_repository_tree_rejects_mirror_cursor_without_mirror(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_get_client.return_value.get_project.return_value = mock_project
+
+    repository.register_tools(mcp, mock_client, GITLAB_URL)
+
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'get_repository_tree')
+    result = asyncio.run(tool.fn(project_id='1', page_token=encode_page_token({'path_after': 'README.md'})))
+
+    assert result.isError is True
+    mock_project.manager.gitlab.http_request.assert_not_called()
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_mirrored_get_files_reports_missing_files(mock_get_client, mock_client, mirrored):
+    tools = mirrored_tools(mock_get_client, mock_client, mirrored)
+
+    results = asyncio.run(tools['get_files'].fn(project_id='1', file_paths=['README.md', 'missing.py']))
+
+    assert results[0].file.content == 'hello\n'
+    assert results[1].file is None
+    assert '404' in results[1].error
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_mirrored_tools_report_git_errors(mock_get_client, mock_client, mirrored):
+    tools = mirrored_tools(mock_get_client, mock_client, mirrored)
+
+    blame = asyncio.run(tools['get_file_blame'].fn(project_id='1', file_path='README.md', start_line=10))
+    missing = asyncio.run(tools['get_repository_tree'].fn(project_id='1', path='missing'))
+    file_path = asyncio.run(tools['get_repository_tree'].fn(project_id='1', path='README.md'))
+    directory = asyncio.run(tools['get_repository_tree'].fn(project_id='1', path='src/'))
+
+    assert blame.isError
+    assert 'has only 1 line' in blame.content[0].text
+    assert missing.isError
+    assert missing.content[0].text == '404: 404 Tree Not Found'
+    assert file_path.isError
+    assert [i.path for i in directory.items] == ['src/app.py']
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_mirrored_get_files_reports_git_errors_per_file(mock_get_client, mock_client, mirrored):
+    tools = mirrored_tools(mock_get_client, mock_client, mirrored)
+
+    def last_commit(repository, sha, path):
+        if path == 'src/app.py':
+            raise GitError('fatal: unable to read tree')
+        return sha
+
+    with patch.object(MirrorRepository, 'last_commit', autospec=True, side_effect=last_commit):
+        results = asyncio.run(tools['get_files'].fn(project_id='1', file_paths=['README.md', 'src/app.py']))
+
+    assert results[0].file.content == 'hello\n'
+    assert results[1].file is None
+    assert 'unable to read tree' in results[1].error
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_mirrored_tools_fall_back_for_unknown_refs(mock_get_client, mock_client, mirrored):
+    tools = mirrored_tools(mock_get_client, mock_client, mirrored)
+    project = mirrored[1]
+    project.search.return_value = []
+
+    with patch.object(mirrored[0], 'refresh') as mock_refresh:
+        asyncio.run(tools['search_code'].fn(project_id='1', query='print', ref='feature'))
+
+    project.search.assert_called_once_with(scope='blobs', search='print', ref='feature')
+    mock_refresh.assert_called_once_with(project)
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_search_code_uses_index_over_mirror(mock_get_client, mock_client, mirrored):
+    mirror, project = mirrored
+    mock_get_client.return_value.get_project.return_value = project
+    mcp = FastMCP('test')
+    repository.register_tools(mcp, mock_client, GITLAB_URL, mirror=mirror, search_indexes=SearchIndexCache(1 << 20))
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'search_code')
+
+    results = asyncio.run(tool.fn(project_id='1', query=r'print\(\d\)', regex=True))
+
+    assert [(r.path, r.startline, r.data) for r in results] == [('src/app.py', 2, 'print(1)')]
+    project.search.assert_not_called()
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_search_code_indexes_api_archive(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    mock_project = MagicMock()
+    mock_project.id = 1
+    mock_project.encoded_id = 1
+    mock_project.default_branch = 'main'
+    mock_project.commits.get.return_value.id = 'a' * 40
+    response = MagicMock()
+    response.raw = io.BytesIO(make_tar([('project-main/src/app.py', b'import os\nprint(1)\n')], 'gz'))
+    mock_project.manager.gitlab.http_get.return_value = response
+    mock_get_client.return_value.get_project.return_value = mock_project
+    repository.register_tools(mcp, mock_client, GITLAB_URL, search_indexes=SearchIndexCache(1 << 20))
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'search_code')
+
+    first = asyncio.run(tool.fn(project_id='1', query='PRINT', ref='feature'))
+    second = asyncio.run(tool.fn(project_id='1', query='import', ref='feature'))
+
+    assert [(r.path, r.startline, r.ref) for r in first] == [('src/app.py', 2, 'feature')]
+    assert [(r.path, r.startline) for r in second] == [('src/app.py', 1)]
+    mock_project.commits.get.assert_called_with('feature')
+    mock_project.manager.gitlab.http_get.assert_called_once_with(
+        '/projects/1/repository/archive.tar.gz',
+        query_data={'sha': 'a' * 40},
+        streamed=True,
+        raw=True,
+    )
+    mock_project.search.assert_not_called()
+
+
+@patch('gitlab_mcp.tools.repository.get_client')
+def test_search_code_regex_requires_index(mock_get_client, mock_client):
+    mcp = FastMCP('test')
+    repository.register_tools(mcp, mock_client, GITLAB_URL)
+    tool = next(t for t in mcp._tool_manager._tools.values() if t.name == 'search_code')
+
+    result = asyncio.run(tool.fn(project_id='1', query='a+', regex=True))
+
+    assert result.isError is True
+    assert 'requires the search index' in result.content[0].text